@@ -16,19 +16,36 @@ Domain-Driven Design: Application orchestrator for complete workflow.
 
 import os
 import json
+import shutil
 import logging
 import asyncio
 from datetime import datetime
 from typing import Dict, List, Any, Optional, Tuple
-from dataclasses import dataclass, asdict
+from dataclasses import dataclass, field, replace
 from pathlib import Path
 
+import httpx
+import orjson
+import requests
+from requests.adapters import HTTPAdapter
+
+try:
+    import h2
+except ImportError:  # Optional: HTTP/2 multiplexing of concurrent agent calls
+    h2 = None
+
 from domain.services.core_analysis.tweet_extraction_service import TweetExtractionService, ExtractionConfig, ExtractionResult
-from domain.services.core_analysis.multi_agent_analysis_service import MultiAgentAnalysisService, AnalysisConfig
-from domain.services.core_analysis.multi_agent_analysis_service import AnalysisResult as ServiceAnalysisResult
+from domain.services.core_analysis.multi_agent_analysis_service import MultiAgentAnalysisService, AnalysisConfig, AnalysisRunReport
 from domain.services.core_analysis.multi_agent_analyzer import MultiAgentAnalyzer
 from infrastructure.adapters.twitter_api_adapter import TwitterApiAdapter, TwitterApiConfig
 from infrastructure.repositories.file_repository import FileRepository
+from infrastructure.repositories.llm_response_cache import LLMResponseCache
+from infrastructure.reliability.rate_limiter import AsyncRateLimiter
+from infrastructure.reliability.circuit_breaker import CircuitBreaker
+from infrastructure.reliability.bulkhead import Bulkhead
+from infrastructure.reliability.pipeline_queue import PipelineQueue
+from infrastructure.reliability.chaos import ChaosMiddleware, ChaosRule, ChaosAsyncTransport, ChaosHTTPAdapter
+from infrastructure.monitoring.latency_metrics import LatencyRecorder, start_metrics_server
 
 
 @dataclass
@@ -41,9 +58,63 @@ class WorkflowConfig:
     
     # Analysis settings
     max_retries: int = 3
-    retry_delay: int = 30
+    retry_base: float = 1.0
+    retry_delay_cap: float = 60.0
     batch_size: int = 5
     continue_on_api_failure: bool = True
+    max_concurrent_llm_calls: int = 8
+    
+    # OpenAI quota (used for proactive rate limiting)
+    openai_rpm: int = 500
+    openai_tpm: int = 300000
+    
+    # Circuit breakers (per provider)
+    circuit_failure_threshold: int = 5
+    circuit_recovery_timeout: int = 60
+    
+    # Bulkheads (per provider): concurrent calls and queued calls before rejecting
+    twitter_max_concurrent: int = 20
+    twitter_max_queue: int = 100
+    openai_max_concurrent: int = 8
+    openai_max_queue: int = 200
+    
+    # Pipelining: analysis consumes tweet batches while extraction is still running
+    pipeline_phases: bool = True
+    pipeline_queue_size: int = 4
+    
+    # Deadlines (seconds): whole workflow, each phase, each OpenAI call
+    workflow_timeout_s: float = 3600
+    phase_timeout_s: float = 1800
+    per_call_timeout_s: float = 60
+    
+    # LLM response cache (None disables); sampled responses are only served from
+    # cache when cache_sampled_responses is set, otherwise used as outage fallback
+    llm_cache_path: Optional[str] = "data/cache/llm_responses.sqlite3"
+    llm_cache_ttl_s: float = 7 * 86400
+    llm_cache_memory_entries: int = 1024  # in-process LRU in front of each SQLite cache
+    cache_sampled_responses: bool = False
+    
+    # Whole-analysis cache keyed by tweet content (None disables); same reuse policy as above.
+    # Reusing whole analyses, and sharing one analysis between identical tweets in a
+    # batch, both require temperature == 0 or cache_sampled_responses=True; otherwise
+    # (the analyzer defaults to temperature 0.3) this cache is neither read nor written
+    analysis_cache_path: Optional[str] = "data/cache/analysis_results.sqlite3"
+    analysis_cache_ttl_s: float = 86400
+    
+    # OpenAI Batch API for each tweet's independent agents: half price, but batches finish
+    # asynchronously (up to 24h), so raise the workflow/phase deadlines when enabling it
+    openai_batch_api: bool = False
+    openai_batch_timeout_s: Optional[float] = None
+    
+    # Chaos testing: fault type -> probability per HTTP request (see infrastructure.reliability.chaos)
+    chaos_rule: Optional[ChaosRule] = None
+    chaos_seed: int = 0
+    
+    # Resume: reuse this workflow's extraction and skip tweets it already analyzed
+    resume_from_workflow_id: Optional[str] = None
+    
+    # Latency metrics: Prometheus endpoint port (None disables; needs prometheus_client)
+    metrics_port: Optional[int] = None
     
     # Output settings
     output_base_directory: str = "data/workflow_runs"
@@ -54,6 +125,19 @@ class WorkflowConfig:
     enable_extraction_recovery: bool = True
     enable_analysis_recovery: bool = True
     save_intermediate_results: bool = True
+    
+    def with_tuned_timeouts(self, metrics: Dict[str, Dict[str, float]],
+                            headroom: float = 1.2, min_samples: int = 20) -> 'WorkflowConfig':
+        """
+        Copy of this config with per_call_timeout_s set from a previous run's metrics
+        
+        Uses the observed OpenAI call p95 times ``headroom``; returns the config
+        unchanged if there were fewer than ``min_samples`` calls.
+        """
+        chat = metrics.get('openai.chat')
+        if not chat or chat['count'] < min_samples:
+            return self
+        return replace(self, per_call_timeout_s=max(1.0, round(chat['p95'] * headroom, 1)))
 
 
 @dataclass
@@ -62,13 +146,14 @@ class WorkflowResult:
     workflow_id: str
     timestamp: datetime
     extraction_result: Optional[ExtractionResult]
-    analysis_result: Optional[ServiceAnalysisResult]
+    analysis_result: Optional[AnalysisRunReport]
     total_processing_time: float
     overall_status: str  # 'success', 'partial', 'extraction_failed', 'analysis_failed'
     phase_completed: str  # 'extraction', 'analysis', 'both', 'none'
     error_summary: List[str]
     data_preserved: bool
     recommendations: List[str]
+    metrics: Dict[str, Dict[str, float]] = field(default_factory=dict)  # latency count/p50/p95/p99 per provider.op
 
 
 class TwitterAnalysisOrchestrator:
@@ -91,9 +176,11 @@ class TwitterAnalysisOrchestrator:
                  twitter_access_token: str,
                  twitter_access_token_secret: str,
                  twitter_bearer_token: str,
-                 openai_api_key: str):
+                 openai_api_key: str,
+                 config: Optional[WorkflowConfig] = None):
         """Initialize the orchestrator with all required API keys"""
         self.logger = logging.getLogger(__name__)
+        config = config or WorkflowConfig()
         
         # Initialize core services
         self.file_repository = FileRepository()
@@ -107,18 +194,97 @@ class TwitterAnalysisOrchestrator:
             bearer_token=twitter_bearer_token
         )
         
-        self.twitter_adapter = TwitterApiAdapter(config=twitter_config)
+        # Optional seeded fault injection into both providers' HTTP traffic
+        self.chaos = ChaosMiddleware(config.chaos_rule, config.chaos_seed) if config.chaos_rule else None
+        if self.chaos:
+            self.logger.warning(f"🐒 Chaos testing enabled: {config.chaos_rule} (seed {config.chaos_seed})")
+        
+        # One long-lived connection pool per provider, sized to its bulkhead, so
+        # keep-alive connections are reused and the providers' pools stay isolated
+        self._twitter_http = requests.Session()
+        if self.chaos:
+            twitter_transport = ChaosHTTPAdapter(self.chaos, pool_maxsize=config.twitter_max_concurrent)
+        else:
+            twitter_transport = HTTPAdapter(pool_maxsize=config.twitter_max_concurrent)
+        self._twitter_http.mount("https://", twitter_transport)
+        
+        # Same pool the analyzer builds for itself: HTTP/2 when h2 is installed
+        openai_limits = MultiAgentAnalyzer.DEFAULT_HTTP_LIMITS
+        openai_http2 = h2 is not None
+        openai_transport = None
+        if self.chaos:
+            openai_transport = ChaosAsyncTransport(
+                self.chaos, httpx.AsyncHTTPTransport(http2=openai_http2, limits=openai_limits)
+            )
+        self._openai_http = httpx.AsyncClient(
+            http2=openai_http2,
+            timeout=httpx.Timeout(60.0, connect=5.0),
+            limits=openai_limits,
+            transport=openai_transport
+        )
+        
+        self.twitter_adapter = TwitterApiAdapter(config=twitter_config, session=self._twitter_http)
+        
+        # Latency of every provider call and checkpoint write, summarized per workflow run
+        self.latency = LatencyRecorder()
+        if config.metrics_port is not None:
+            start_metrics_server(config.metrics_port)
+        
+        # One breaker per provider so a Twitter outage doesn't halt OpenAI analysis and vice versa
+        self._breakers = {
+            provider: CircuitBreaker(
+                provider,
+                failure_threshold=config.circuit_failure_threshold,
+                recovery_timeout=config.circuit_recovery_timeout
+            )
+            for provider in ("twitter", "openai")
+        }
+        
+        # Separate bulkheads keep a slow provider from exhausting the other's slots and threads
+        self.twitter_bulkhead = Bulkhead("twitter", config.twitter_max_concurrent, config.twitter_max_queue)
+        self.openai_bulkhead = Bulkhead("openai", config.openai_max_concurrent, config.openai_max_queue)
         
         self.extraction_service = TweetExtractionService(
             twitter_adapter=self.twitter_adapter,
-            file_repository=self.file_repository
+            file_repository=self.file_repository,
+            bulkhead=self.twitter_bulkhead,
+            latency_recorder=self.latency
         )
         
-        self.multi_agent_analyzer = MultiAgentAnalyzer(openai_api_key)
+        # Rate limiters live on the orchestrator so every workflow run shares the same quota
+        self.rpm_limiter = AsyncRateLimiter(config.openai_rpm, 60)
+        self.tpm_limiter = AsyncRateLimiter(config.openai_tpm, 60)
+        
+        self.llm_cache = LLMResponseCache(
+            config.llm_cache_path, config.llm_cache_ttl_s, config.llm_cache_memory_entries
+        ) if config.llm_cache_path else None
+        self.analysis_cache = LLMResponseCache(
+            config.analysis_cache_path, config.analysis_cache_ttl_s, config.llm_cache_memory_entries
+        ) if config.analysis_cache_path else None
+        
+        self.multi_agent_analyzer = MultiAgentAnalyzer(
+            openai_api_key,
+            rpm_limiter=self.rpm_limiter,
+            tpm_limiter=self.tpm_limiter,
+            circuit_breaker=self._breakers["openai"],
+            bulkhead=self.openai_bulkhead,
+            http_client=self._openai_http,
+            per_call_timeout=config.per_call_timeout_s,
+            response_cache=self.llm_cache,
+            cache_sampled_responses=config.cache_sampled_responses,
+            latency_recorder=self.latency,
+            batch_api=config.openai_batch_api,
+            batch_timeout=config.openai_batch_timeout_s
+        )
+        
+        # Background cleanup of old workflow runs (see execute_complete_workflow)
+        self._cleanup_task: Optional[asyncio.Task] = None
         
         self.analysis_service = MultiAgentAnalysisService(
             multi_agent_analyzer=self.multi_agent_analyzer,
-            file_repository=self.file_repository
+            file_repository=self.file_repository,
+            latency_recorder=self.latency,
+            analysis_cache=self.analysis_cache
         )
         
         # Workflow statistics
@@ -130,6 +296,26 @@ class TwitterAnalysisOrchestrator:
             'total_errors': 0
         }
     
+    async def __aenter__(self) -> 'TwitterAnalysisOrchestrator':
+        return self
+    
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.aclose()
+    
+    async def aclose(self):
+        """Close the shared HTTP clients, bulkhead thread pools and file writers"""
+        if self._cleanup_task is not None:
+            await self._cleanup_task
+        await self._openai_http.aclose()
+        self._twitter_http.close()
+        self.twitter_bulkhead.shutdown()
+        self.openai_bulkhead.shutdown()
+        if self.llm_cache:
+            self.llm_cache.close()
+        if self.analysis_cache:
+            self.analysis_cache.close()
+        self.file_repository.close()
+    
     async def execute_complete_workflow(self, config: WorkflowConfig) -> WorkflowResult:
         """
         Execute the complete Twitter analysis workflow
@@ -141,15 +327,20 @@ class TwitterAnalysisOrchestrator:
             WorkflowResult with complete execution details
         """
         start_time = datetime.now()
-        workflow_id = f"WORKFLOW_{start_time.strftime('%Y%m%d_%H%M%S')}"
+        workflow_id = config.resume_from_workflow_id or f"WORKFLOW_{start_time.strftime('%Y%m%d_%H%M%S')}"
+        pipelined = config.pipeline_phases and not config.resume_from_workflow_id
+        
+        # Per-run settings and metrics (the timeout may have been tuned from the previous run)
+        self.multi_agent_analyzer.per_call_timeout = config.per_call_timeout_s
+        self.latency.reset()
         
         self.logger.info("=" * 60)
         self.logger.info(f"🚀 STARTING TWITTER ANALYSIS WORKFLOW: {workflow_id}")
         self.logger.info("=" * 60)
         
-        # Create workflow directory
+        # Create workflow directory (filesystem calls run off the event loop)
         workflow_dir = Path(config.output_base_directory) / workflow_id
-        workflow_dir.mkdir(parents=True, exist_ok=True)
+        await asyncio.to_thread(workflow_dir.mkdir, parents=True, exist_ok=True)
         
         # Initialize result tracking
         extraction_result = None
@@ -159,53 +350,77 @@ class TwitterAnalysisOrchestrator:
         data_preserved = False
         
         try:
-            # Cleanup old runs if enabled
-            if config.cleanup_old_runs:
-                await self._cleanup_old_workflow_runs(config)
-            
-            # PHASE 1: TWEET EXTRACTION
-            self.logger.info("📡 PHASE 1: TWEET EXTRACTION")
-            self.logger.info("-" * 40)
-            
-            extraction_result = await self._execute_extraction_phase(config, workflow_dir)
-            
-            if extraction_result and extraction_result.status in ['success', 'partial']:
-                phase_completed = "extraction"
-                data_preserved = True
-                self.workflow_stats['successful_extractions'] += 1
-                self.workflow_stats['total_tweets_processed'] += extraction_result.total_tweets_extracted
+            async with asyncio.timeout(config.workflow_timeout_s):
+                # Cleanup old runs if enabled (never while resuming, it could remove the resumed run);
+                # runs in the background since it isn't on the critical path
+                if config.cleanup_old_runs and not config.resume_from_workflow_id:
+                    self._cleanup_task = asyncio.create_task(self._cleanup_old_workflow_runs(config))
                 
-                self.logger.info(f"✅ Extraction phase completed: {extraction_result.total_tweets_extracted} tweets extracted")
-                
-                # PHASE 2: MULTI-AGENT ANALYSIS
-                self.logger.info("🤖 PHASE 2: MULTI-AGENT ANALYSIS")
-                self.logger.info("-" * 40)
-                
-                analysis_result = await self._execute_analysis_phase(
-                    extraction_result, config, workflow_dir
-                )
+                if config.resume_from_workflow_id:
+                    # PHASE 1: REUSE PREVIOUS EXTRACTION
+                    self.logger.info(f"⏭️ PHASE 1: REUSING EXTRACTION FROM {workflow_id}")
+                    self.logger.info("-" * 40)
+                    
+                    extraction_result = await asyncio.to_thread(self._load_previous_extraction, config, workflow_dir)
+                elif pipelined:
+                    # PHASES 1 + 2: EXTRACTION STREAMING INTO MULTI-AGENT ANALYSIS
+                    self.logger.info("📡🤖 PHASES 1+2: PIPELINED TWEET EXTRACTION AND MULTI-AGENT ANALYSIS")
+                    self.logger.info("-" * 40)
+                    
+                    extraction_result, analysis_result = await self._execute_pipelined_phases(config, workflow_dir)
+                else:
+                    # PHASE 1: TWEET EXTRACTION
+                    self.logger.info("📡 PHASE 1: TWEET EXTRACTION")
+                    self.logger.info("-" * 40)
+                    
+                    extraction_result = await self._execute_extraction_phase(config, workflow_dir)
                 
-                if analysis_result and analysis_result.status in ['success', 'partial']:
-                    phase_completed = "both"
-                    self.workflow_stats['successful_analyses'] += 1
+                if extraction_result and extraction_result.status in ['success', 'partial']:
+                    phase_completed = "extraction"
+                    data_preserved = True
+                    self.workflow_stats['successful_extractions'] += 1
+                    self.workflow_stats['total_tweets_processed'] += extraction_result.total_tweets_extracted
+                    
+                    self.logger.info(f"✅ Extraction phase completed: {extraction_result.total_tweets_extracted} tweets extracted")
                     
-                    self.logger.info(f"✅ Analysis phase completed: {analysis_result.successful_analyses} analyses completed")
+                    if not pipelined:
+                        # PHASE 2: MULTI-AGENT ANALYSIS
+                        self.logger.info("🤖 PHASE 2: MULTI-AGENT ANALYSIS")
+                        self.logger.info("-" * 40)
+                        
+                        analysis_result = await self._execute_analysis_phase(
+                            extraction_result, config, workflow_dir
+                        )
+                    
+                    if analysis_result and analysis_result.status in ['success', 'partial']:
+                        phase_completed = "both"
+                        self.workflow_stats['successful_analyses'] += 1
+                        
+                        self.logger.info(f"✅ Analysis phase completed: {analysis_result.successful_analyses} analyses completed")
+                    else:
+                        error_summary.append("Analysis phase failed but extraction data preserved")
+                        if analysis_result and analysis_result.error_details:
+                            error_summary.extend(analysis_result.error_details)
                 else:
-                    error_summary.append("Analysis phase failed but extraction data preserved")
-                    if analysis_result and analysis_result.error_details:
-                        error_summary.extend(analysis_result.error_details)
-            else:
-                error_summary.append("Extraction phase failed")
-                if extraction_result and extraction_result.error_details:
-                    error_summary.extend(extraction_result.error_details)
-            
-            # Calculate final status
-            if phase_completed == "both":
-                overall_status = "success"
-            elif phase_completed == "extraction":
-                overall_status = "analysis_failed"
-            else:
-                overall_status = "extraction_failed"
+                    error_summary.append("Extraction phase failed")
+                    if extraction_result and extraction_result.error_details:
+                        error_summary.extend(extraction_result.error_details)
+                
+                # Calculate final status
+                if phase_completed == "both":
+                    overall_status = "success"
+                elif phase_completed == "extraction":
+                    overall_status = "analysis_failed"
+                else:
+                    overall_status = "extraction_failed"
+                
+        except TimeoutError:
+            # Whatever finished before the deadline is kept; the status reflects the last completed phase
+            error_msg = f"Workflow timed out after {config.workflow_timeout_s}s"
+            self.logger.error(f"⏰ {error_msg}")
+            error_summary.append(error_msg)
+            overall_status = "analysis_failed" if phase_completed == "extraction" else "extraction_failed"
+            self.workflow_stats['total_errors'] += 1
             
         except Exception as e:
             error_msg = f"Workflow execution failed: {str(e)}"
@@ -230,7 +445,8 @@ class TwitterAnalysisOrchestrator:
             data_preserved=data_preserved,
             recommendations=self._generate_workflow_recommendations(
                 extraction_result, analysis_result, error_summary
-            )
+            ),
+            metrics=self.latency.percentiles()
         )
         
         # Save workflow result
@@ -244,87 +460,281 @@ class TwitterAnalysisOrchestrator:
     
     async def _execute_extraction_phase(self, 
                                        config: WorkflowConfig, 
-                                       workflow_dir: Path) -> Optional[ExtractionResult]:
+                                       workflow_dir: Path,
+                                       batch_queue: Optional[asyncio.Queue] = None) -> Optional[ExtractionResult]:
         """Execute tweet extraction phase"""
+        breaker = self._breakers["twitter"]
         try:
-            extraction_config = ExtractionConfig(
-                max_tweets=config.max_tweets,
-                hours_back=config.hours_back,
-                accounts_list=config.trusted_accounts,
-                enable_thread_extraction=True,
-                enable_media_analysis=True,
-                enable_url_extraction=True,
-                output_directory=str(workflow_dir / "extraction"),
-                batch_size=10
-            )
+            extraction_config = self._build_extraction_config(config, workflow_dir)
             
-            return await self.extraction_service.extract_comprehensive_data(extraction_config)
+            if not breaker.allow_request():
+                self.logger.warning("⚡ Twitter circuit is open - skipping extraction until it recovers")
+                return self._short_circuited_extraction(extraction_config)
+            
+            async with asyncio.timeout(config.phase_timeout_s):
+                extraction_result = await self.extraction_service.extract_comprehensive_data(extraction_config, batch_queue)
+            
+            if extraction_result.status == 'failed':
+                breaker.record_failure()
+            else:
+                breaker.record_success()
+            
+            return extraction_result
+            
+        except TimeoutError:
+            breaker.record_failure()
+            self.logger.error(f"⏰ Extraction phase timed out after {config.phase_timeout_s}s")
+            return None
             
         except Exception as e:
+            breaker.record_failure()
             self.logger.error(f"❌ Extraction phase failed: {str(e)}")
             return None
     
+    def _build_extraction_config(self, config: WorkflowConfig, workflow_dir: Path) -> ExtractionConfig:
+        """Build the extraction service configuration from the workflow configuration"""
+        return ExtractionConfig(
+            max_tweets=config.max_tweets,
+            hours_back=config.hours_back,
+            accounts_list=config.trusted_accounts,
+            enable_thread_extraction=True,
+            enable_media_analysis=True,
+            enable_url_extraction=True,
+            output_directory=str(workflow_dir / "extraction"),
+            batch_size=10
+        )
+    
+    def _load_previous_extraction(self, config: WorkflowConfig, workflow_dir: Path) -> Optional[ExtractionResult]:
+        """Rebuild the extraction result of a previous run from its saved metadata"""
+        try:
+            metadata_files = sorted((workflow_dir / "extraction").glob("*/extraction_metadata.json"))
+            if not metadata_files:
+                self.logger.error(f"❌ No previous extraction found in {workflow_dir}")
+                return None
+            
+            metadata_file = metadata_files[-1]
+            with open(metadata_file, 'r', encoding='utf-8') as f:
+                metadata = json.load(f)
+            
+            stats = metadata.get('extraction_stats', {})
+            total_tweets = metadata.get('total_tweets', 0)
+            
+            self.logger.info(f"📂 Reusing {total_tweets} tweets from {metadata_file.parent.name}")
+            
+            return ExtractionResult(
+                extraction_id=metadata.get('extraction_id', metadata_file.parent.name),
+                timestamp=datetime.fromisoformat(metadata['timestamp']),
+                total_tweets_extracted=total_tweets,
+                successful_accounts=stats.get('successful_accounts', 0),
+                failed_accounts=stats.get('failed_accounts', 0),
+                accounts_processed=stats.get('accounts_processed', []),
+                accounts_failed=stats.get('accounts_failed', []),
+                tweets_file_path=str(metadata_file.parent / metadata.get('data_structure', {}).get('tweets_file', 'extracted_tweets.json')),
+                metadata_file_path=str(metadata_file),
+                extraction_config=self._build_extraction_config(config, workflow_dir),
+                processing_time=0.0,
+                status='success' if total_tweets > 0 else 'failed',
+                error_details=stats.get('errors', [])
+            )
+            
+        except Exception as e:
+            self.logger.error(f"❌ Failed to load previous extraction: {str(e)}")
+            return None
+    
+    def _short_circuited_extraction(self, extraction_config: ExtractionConfig) -> ExtractionResult:
+        """Build the extraction result returned while the Twitter circuit is open"""
+        now = datetime.now()
+        return ExtractionResult(
+            extraction_id=f"EXTRACTION_{now.strftime('%Y%m%d_%H%M%S')}",
+            timestamp=now,
+            total_tweets_extracted=0,
+            successful_accounts=0,
+            failed_accounts=0,
+            accounts_processed=[],
+            accounts_failed=[],
+            tweets_file_path="",
+            metadata_file_path="",
+            extraction_config=extraction_config,
+            processing_time=0.0,
+            status='failed',
+            error_details=["Twitter API circuit open - extraction short-circuited"]
+        )
+    
     async def _execute_analysis_phase(self, 
                                     extraction_result: ExtractionResult,
                                     config: WorkflowConfig,
-                                    workflow_dir: Path) -> Optional[ServiceAnalysisResult]:
+                                    workflow_dir: Path) -> Optional[AnalysisRunReport]:
         """Execute multi-agent analysis phase"""
         try:
-            analysis_config = AnalysisConfig(
-                input_tweets_file=extraction_result.tweets_file_path,
-                output_directory=str(workflow_dir / "analysis"),
-                max_retries=config.max_retries,
-                retry_delay=config.retry_delay,
-                batch_size=config.batch_size,
-                enable_error_recovery=config.enable_analysis_recovery,
-                continue_on_failure=config.continue_on_api_failure,
-                save_intermediate_results=config.save_intermediate_results
+            completed_results = await asyncio.to_thread(self._resume_analysis, workflow_dir)
+            
+            analysis_config = self._build_analysis_config(
+                extraction_result.tweets_file_path, config, workflow_dir
             )
             
-            return await self.analysis_service.analyze_extracted_data(analysis_config)
+            async with asyncio.timeout(config.phase_timeout_s):
+                return await self.analysis_service.analyze_extracted_data(analysis_config, completed_results)
+            
+        except TimeoutError:
+            # Finished tweets remain in the run's results.jsonl and are picked up on resume
+            self.logger.error(f"⏰ Analysis phase timed out after {config.phase_timeout_s}s")
+            return None
             
         except Exception as e:
             self.logger.error(f"❌ Analysis phase failed: {str(e)}")
             return None
     
+    def _resume_analysis(self, workflow_dir: Path) -> List[Dict[str, Any]]:
+        """Collect tweet results already produced by earlier analysis runs of this workflow"""
+        analysis_dir = workflow_dir / "analysis"
+        if not analysis_dir.exists():
+            return []
+        
+        completed = {}
+        # Analysis ids are timestamps, so later runs override earlier ones
+        for run_dir in sorted(d for d in analysis_dir.iterdir() if d.is_dir()):
+            results_log = run_dir / 'results.jsonl'
+            if results_log.exists():
+                with open(results_log, 'rb') as f:
+                    for line in f:
+                        try:
+                            result = orjson.loads(line)
+                        except orjson.JSONDecodeError:
+                            continue  # Line cut short by an interrupted run
+                        completed[result['tweet_id']] = result
+            
+            results_file = run_dir / 'integrated_analysis_results.jsonl'
+            if results_file.exists():
+                with open(results_file, 'rb') as f:
+                    for line in f:
+                        try:
+                            result = orjson.loads(line)
+                        except orjson.JSONDecodeError:
+                            continue
+                        if 'tweet_id' in result:  # skip the header and footer lines
+                            completed[result['tweet_id']] = result
+            
+            # Runs from before the JSONL layout saved one JSON document
+            results_file = run_dir / 'integrated_analysis_results.json'
+            if results_file.exists():
+                try:
+                    with open(results_file, 'rb') as f:
+                        for result in orjson.loads(f.read()).get('detailed_results', []):
+                            completed[result['tweet_id']] = result
+                except Exception as e:
+                    self.logger.warning(f"⚠️ Ignoring unreadable results file {results_file}: {str(e)}")
+        
+        return list(completed.values())
+    
+    async def _execute_pipelined_phases(self,
+                                        config: WorkflowConfig,
+                                        workflow_dir: Path) -> Tuple[Optional[ExtractionResult], Optional[AnalysisRunReport]]:
+        """Run extraction and analysis concurrently, streaming tweet batches between them"""
+        batch_queue = PipelineQueue(maxsize=config.pipeline_queue_size)
+        
+        async def _producer() -> Optional[ExtractionResult]:
+            try:
+                return await self._execute_extraction_phase(config, workflow_dir, batch_queue)
+            finally:
+                # End of stream: extraction complete (also on failure, so analysis can finish);
+                # never blocks, even on a full queue
+                batch_queue.finish()
+        
+        async def _consumer() -> Optional[AnalysisRunReport]:
+            try:
+                analysis_config = self._build_analysis_config("", config, workflow_dir)
+                async with asyncio.timeout(config.phase_timeout_s):
+                    return await self.analysis_service.analyze_tweet_stream(batch_queue, analysis_config)
+            except TimeoutError:
+                self.logger.error(f"⏰ Analysis phase timed out after {config.phase_timeout_s}s")
+                return None
+            except Exception as e:
+                self.logger.error(f"❌ Analysis phase failed: {str(e)}")
+                return None
+        
+        extract_task = asyncio.create_task(_producer())
+        analyze_task = asyncio.create_task(_consumer())
+        # Tie the producer to the consumer's lifetime: once analysis ends for any reason
+        # (including cancellation before it started), drop further batches so extraction
+        # runs to completion instead of blocking on a full queue
+        analyze_task.add_done_callback(lambda _: batch_queue.close())
+        extraction_result, analysis_result = await asyncio.gather(extract_task, analyze_task)
+        
+        # The tweets file only exists once extraction has finished
+        if extraction_result and analysis_result:
+            analysis_result.input_tweets_file = extraction_result.tweets_file_path
+            analysis_result.analysis_config.input_tweets_file = extraction_result.tweets_file_path
+        
+        return extraction_result, analysis_result
+    
+    def _build_analysis_config(self,
+                               tweets_file_path: str,
+                               config: WorkflowConfig,
+                               workflow_dir: Path) -> AnalysisConfig:
+        """Build the analysis service configuration from the workflow configuration"""
+        return AnalysisConfig(
+            input_tweets_file=tweets_file_path,
+            output_directory=str(workflow_dir / "analysis"),
+            max_retries=config.max_retries,
+            retry_base=config.retry_base,
+            retry_delay_cap=config.retry_delay_cap,
+            batch_size=config.batch_size,
+            enable_error_recovery=config.enable_analysis_recovery,
+            continue_on_failure=config.continue_on_api_failure,
+            save_intermediate_results=config.save_intermediate_results,
+            max_concurrent_llm_calls=config.max_concurrent_llm_calls
+        )
+    
     async def _cleanup_old_workflow_runs(self, config: WorkflowConfig):
         """Clean up old workflow runs to save space"""
         try:
             base_dir = Path(config.output_base_directory)
-            if not base_dir.exists():
-                return
-            
-            # Get all workflow directories
-            workflow_dirs = [d for d in base_dir.iterdir() if d.is_dir() and d.name.startswith('WORKFLOW_')]
+            loop = asyncio.get_running_loop()
             
-            # Sort by creation time (newest first)
-            workflow_dirs.sort(key=lambda x: x.stat().st_ctime, reverse=True)
+            # Directory listing hits the disk, so keep it off the event loop
+            workflow_dirs = await loop.run_in_executor(None, self._list_workflow_runs, base_dir)
             
-            # Remove old runs beyond the limit
+            # Remove old runs beyond the limit, in parallel
             if len(workflow_dirs) > config.max_old_runs_to_keep:
                 old_runs = workflow_dirs[config.max_old_runs_to_keep:]
                 
-                for old_run in old_runs:
-                    try:
-                        import shutil
-                        shutil.rmtree(old_run)
+                results = await asyncio.gather(*[
+                    loop.run_in_executor(None, shutil.rmtree, old_run)
+                    for old_run in old_runs
+                ], return_exceptions=True)
+                
+                for old_run, result in zip(old_runs, results):
+                    if isinstance(result, Exception):
+                        self.logger.warning(f"⚠️ Failed to clean up {old_run.name}: {str(result)}")
+                    else:
                         self.logger.info(f"🧹 Cleaned up old workflow run: {old_run.name}")
-                    except Exception as e:
-                        self.logger.warning(f"⚠️ Failed to clean up {old_run.name}: {str(e)}")
                         
         except Exception as e:
             self.logger.warning(f"⚠️ Cleanup failed: {str(e)}")
     
+    @staticmethod
+    def _list_workflow_runs(base_dir: Path) -> List[Path]:
+        """List workflow run directories, newest first"""
+        if not base_dir.exists():
+            return []
+        
+        # Get all workflow directories (scandir's is_dir() uses the cached entry type, no stat())
+        with os.scandir(base_dir) as entries:
+            workflow_dirs = [Path(e.path) for e in entries if e.name.startswith('WORKFLOW_') and e.is_dir()]
+        
+        # Sort newest first: WORKFLOW_%Y%m%d_%H%M%S names are fixed-width, so name order is time order
+        workflow_dirs.sort(key=lambda x: x.name, reverse=True)
+        return workflow_dirs
+    
     async def _save_workflow_result(self, result: WorkflowResult, workflow_dir: Path):
         """Save workflow result to file"""
         try:
             result_file = workflow_dir / 'workflow_result.json'
             
-            # Convert result to dictionary for JSON serialization
-            result_dict = asdict(result)
-            
-            with open(result_file, 'w', encoding='utf-8') as f:
-                json.dump(result_dict, f, indent=2, ensure_ascii=False, default=str)
+            # orjson serializes the nested dataclasses and datetimes directly, without
+            # an asdict() deep copy; anything else (e.g. Path) falls back to str
+            data = orjson.dumps(result, default=str, option=orjson.OPT_INDENT_2)
+            await asyncio.to_thread(result_file.write_bytes, data)
             
             self.logger.info(f"💾 Workflow result saved: {result_file}")
             
@@ -333,7 +743,7 @@ class TwitterAnalysisOrchestrator:
     
     def _generate_workflow_recommendations(self, 
                                          extraction_result: Optional[ExtractionResult],
-                                         analysis_result: Optional[ServiceAnalysisResult],
+                                         analysis_result: Optional[AnalysisRunReport],
                                          errors: List[str]) -> List[str]:
         """Generate recommendations based on workflow execution"""
         recommendations = []
@@ -353,6 +763,9 @@ class TwitterAnalysisOrchestrator:
             recommendations.append("❌ Tweet extraction failed - check Twitter API credentials")
             recommendations.append("💡 Verify account list and API permissions")
         
+        if analysis_result and analysis_result.degraded_analyses:
+            recommendations.append(f"⚠️ {analysis_result.degraded_analyses} analyses used fallback model due to rate limits")
+        
         if len(errors) > 5:
             recommendations.append("⚠️ High error rate detected - consider reducing batch size or increasing delays")
         
@@ -378,6 +791,10 @@ class TwitterAnalysisOrchestrator:
         if result.error_summary:
             self.logger.info(f"❌ Errors: {len(result.error_summary)}")
         
+        for op, stats in result.metrics.items():
+            self.logger.info(f"⏱️  {op}: n={stats['count']} p50={stats['p50']:.2f}s "
+                             f"p95={stats['p95']:.2f}s p99={stats['p99']:.2f}s")
+        
         self.logger.info("=" * 60)
         
         # Log recommendations
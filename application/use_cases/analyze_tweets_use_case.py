@@ -10,15 +10,26 @@ Coordinates Twitter extraction, multi-agent analysis, and result persistence.
 
 import os
 import logging
+import asyncio
+import multiprocessing
 from datetime import datetime
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Iterator, Optional, Tuple
 from dataclasses import dataclass
+from string import Template
+
+import orjson
+
+try:
+    import ray
+except ImportError:  # Optional: distributed analysis across cores/nodes
+    ray = None
 
 from domain.entities.tweet import Tweet
-from domain.entities.analysis_result import AnalysisResult
+from domain.entities.analysis_result import AnalysisResult, AnalysisResultPool, AnalysisStatus, STATUS_VALUES
 from domain.services.multi_agent_analyzer import MultiAgentAnalyzer
 from infrastructure.adapters.twitter_api_adapter import TwitterApiAdapter
 from infrastructure.repositories.file_repository import FileRepository
+from infrastructure.monitoring.background_logging import BackgroundLogging
 
 
 @dataclass
@@ -30,7 +41,29 @@ class AnalysisConfig:
     enable_media_analysis: bool = True
     output_format: str = "json"
     save_individual_results: bool = True
+    batch_output: bool = True  # one run_report.md + NDJSON (with offset index) instead of two files per tweet
     generate_summary: bool = True
+    max_concurrent_analyses: int = 8  # tweets analyzed at the same time (per Ray actor with use_ray)
+    use_ray: bool = False  # fan analyses out to a Ray actor pool; falls back to asyncio without Ray
+    ray_num_actors: Optional[int] = None  # defaults to the number of CPUs
+
+
+class AnalyzerActor:
+    """
+    🛰️ Ray actor owning one MultiAgentAnalyzer
+    
+    Each actor builds its analyzer from the environment, since API clients
+    can't be shipped between processes.
+    """
+    
+    def __init__(self):
+        openai_api_key = os.getenv('OPENAI_API_KEY')
+        if not openai_api_key:
+            raise ValueError("OPENAI_API_KEY environment variable is required")
+        self.multi_agent_analyzer = MultiAgentAnalyzer(openai_api_key)
+    
+    async def analyze_tweet(self, tweet: Tweet, run_id: str) -> AnalysisResult:
+        return await self.multi_agent_analyzer.analyze_tweet(tweet, run_id)
 
 
 class AnalyzeTweetsUseCase:
@@ -45,19 +78,111 @@ class AnalyzeTweetsUseCase:
     5. Generate comprehensive reports
     """
     
+    # Results saved concurrently per wave in _save_individual_results
+    SAVE_BATCH_SIZE = 100
+    
+    # Markdown templates, parsed once at class definition
+    REPORT_TEMPLATE = Template("""# Analysis Report for Content $content_id
+
+## Overview
+- **Content ID:** $content_id
+- **Run ID:** $run_id
+- **Analysis Timestamp:** $analysis_timestamp
+- **Quality Score:** $score/10
+- **Processing Time:** ${processing_time}s
+- **Status:** $status
+
+## Agent Analysis Summary
+- **Success Rate:** $success_rate%
+- **Average Agent Score:** $average_agent_score
+- **Agents Executed:** $agents_executed
+
+## Key Findings
+$key_findings
+
+## Thread Analysis
+$thread_analysis
+
+## Media Analysis  
+$media_analysis
+
+---
+*Generated by Enhanced Social Media Multi-Agent Analyzer v$analysis_version*
+""")
+
+    SUMMARY_TEMPLATE = Template("""# 🚀 Enhanced Multi-Agent Analysis Summary
+
+**Run ID:** $run_id  
+**Generated:** $generation_timestamp  
+**Total Processing Time:** $total_processing_time seconds
+
+---
+
+## 📊 Analysis Overview
+
+### Content Analysis Results
+- **Total Items Processed:** $total_items_processed
+- **Successful Analyses:** $successful_analyses
+- **Failed Analyses:** $failed_analyses
+- **Success Rate:** $success_rate%
+- **Average Quality Score:** $average_quality_score/10
+
+### Thread Detection Results
+- **Threads Detected:** $threads_detected
+- **Thread Detection Rate:** $thread_detection_rate%
+
+### Media Analysis Results
+- **Items with Media:** $items_with_media
+- **Media Analysis Rate:** $media_analysis_rate%
+
+---
+
+## 🎯 Performance Metrics
+
+- **Average Processing Time per Item:** $average_processing_time_per_item seconds
+- **Total Execution Time:** $total_execution_time seconds
+- **Error Rate:** $error_rate%
+
+---
+
+## 📋 Detailed Results
+
+### Successfully Analyzed Content
+
+$detailed_results
+
+---
+
+## 🔧 Configuration Used
+
+- **Analysis Type:** Enhanced Multi-Agent
+- **Thread Analysis:** True
+- **Media Analysis:** True
+- **Link Analysis:** True
+- **Output Formats:** json, markdown
+
+---
+
+*Generated by Enhanced Social Media Multi-Agent Analyzer v4.0*
+""")
+
     def __init__(self, 
                  twitter_adapter: TwitterApiAdapter,
                  multi_agent_analyzer: MultiAgentAnalyzer,
-                 file_repository: FileRepository):
+                 file_repository: FileRepository,
+                 result_pool: Optional[AnalysisResultPool] = None,
+                 background_logging: Optional[BackgroundLogging] = None):
         """Initialize use case with required dependencies"""
         self.twitter_adapter = twitter_adapter
         self.multi_agent_analyzer = multi_agent_analyzer
         self.file_repository = file_repository
+        self.result_pool = result_pool
+        self.background_logging = background_logging
         self.logger = logging.getLogger(__name__)
     
     @classmethod
-    def create_from_env(cls) -> 'AnalyzeTweetsUseCase':
-        """Create use case instance from environment variables"""
+    def create_from_env(cls, log_file: Optional[str] = None) -> 'AnalyzeTweetsUseCase':
+        """Create use case instance from environment variables, optionally also logging to ``log_file``"""
         # Initialize dependencies
         twitter_adapter = TwitterApiAdapter.from_env()
         
@@ -65,10 +190,29 @@ class AnalyzeTweetsUseCase:
         if not openai_api_key:
             raise ValueError("OPENAI_API_KEY environment variable is required")
         
-        multi_agent_analyzer = MultiAgentAnalyzer(openai_api_key)
+        # Results are recycled across tweets and runs of this use case
+        result_pool = AnalysisResultPool()
+        multi_agent_analyzer = MultiAgentAnalyzer(openai_api_key, result_pool=result_pool)
         file_repository = FileRepository()
         
-        return cls(twitter_adapter, multi_agent_analyzer, file_repository)
+        # Log handlers run on a listener thread so log calls never block the event loop
+        background_logging = BackgroundLogging(log_file)
+        background_logging.start()
+        
+        return cls(twitter_adapter, multi_agent_analyzer, file_repository, result_pool, background_logging)
+    
+    async def __aenter__(self) -> 'AnalyzeTweetsUseCase':
+        return self
+    
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.aclose()
+    
+    async def aclose(self):
+        """Close the analyzer's HTTP connections and the file writers, then flush the logs"""
+        await self.multi_agent_analyzer.aclose()
+        self.file_repository.close()
+        if self.background_logging:
+            self.background_logging.stop()
     
     async def execute(self, 
                      account_usernames: List[str], 
@@ -83,9 +227,12 @@ class AnalyzeTweetsUseCase:
         Returns:
             Analysis execution summary
         """
-        run_id = f"TWITTER_ANALYSIS_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
         start_time = datetime.now()
         
+        # Formatted once per run and reused for the run id and every saved file name
+        run_timestamp = start_time.strftime('%Y%m%d_%H%M%S')
+        run_id = f"TWITTER_ANALYSIS_{run_timestamp}"
+        
         self.logger.info(f"🚀 Starting tweet analysis workflow: {run_id}")
         self.logger.info(f"📊 Configuration: {config.max_tweets} tweets, {config.hours_back}h back")
         self.logger.info(f"🎯 Target accounts: {len(account_usernames)} accounts")
@@ -106,18 +253,28 @@ class AnalyzeTweetsUseCase:
             # Step 3: Save individual results
             if config.save_individual_results:
                 self.logger.info("💾 Step 3: Saving individual analysis results...")
-                await self._save_individual_results(analysis_results, run_id)
+                if config.batch_output:
+                    await self._save_batched_results(analysis_results, run_id, run_timestamp)
+                else:
+                    await self._save_individual_results(analysis_results, run_id, run_timestamp)
             
             # Step 4: Generate and save summary
             if config.generate_summary:
                 self.logger.info("📋 Step 4: Generating analysis summary...")
-                summary = await self._generate_summary(analysis_results, run_id, start_time)
-                await self._save_summary(summary, run_id)
+                summary = await self._aggregate_stats(analysis_results, run_id, start_time)
+                await self._save_summary(summary, analysis_results, run_id, run_timestamp)
             
             execution_time = (datetime.now() - start_time).total_seconds()
             self.logger.info(f"🎉 Analysis workflow completed in {execution_time:.2f}s")
             
-            return self._create_summary(run_id, analysis_results, start_time, "success")
+            execution_summary = self._create_summary(run_id, analysis_results, start_time, "success")
+            
+            # Everything is saved and summarized: hand the results back for reuse
+            if self.result_pool:
+                for result in analysis_results:
+                    self.result_pool.release(result)
+            
+            return execution_summary
             
         except Exception as e:
             self.logger.error(f"❌ Analysis workflow failed: {str(e)}")
@@ -137,63 +294,158 @@ class AnalyzeTweetsUseCase:
                             tweets: List[Tweet], 
                             run_id: str, 
                             config: AnalysisConfig) -> List[AnalysisResult]:
-        """Analyze tweets using multi-agent system"""
-        analysis_results = []
+        """Analyze tweets using multi-agent system, up to max_concurrent_analyses at a time"""
+        if config.use_ray:
+            if ray is not None:
+                return await self._analyze_tweets_with_ray(tweets, run_id, config)
+            self.logger.warning("⚠️ Ray not installed - analyzing tweets in this process")
+        
+        semaphore = asyncio.Semaphore(config.max_concurrent_analyses)
+        
+        async def _analyze_one(i: int, tweet: Tweet) -> Optional[AnalysisResult]:
+            async with semaphore:
+                self.logger.info(f"📊 Analyzing tweet {i}/{len(tweets)}: {tweet.tweet_id}")
+                
+                try:
+                    # Perform multi-agent analysis
+                    result = await self.multi_agent_analyzer.analyze_tweet(tweet, run_id)
+                    self.logger.info(f"✅ Tweet {tweet.tweet_id} analyzed successfully")
+                    return result
+                    
+                except Exception as e:
+                    self.logger.error(f"❌ Failed to analyze tweet {tweet.tweet_id}: {str(e)}")
+                    return None
+        
+        # gather keeps results in tweet order
+        results = await asyncio.gather(*[
+            _analyze_one(i, tweet) for i, tweet in enumerate(tweets, 1)
+        ])
+        
+        return [result for result in results if result is not None]
+    
+    async def _analyze_tweets_with_ray(self, 
+                                       tweets: List[Tweet], 
+                                       run_id: str, 
+                                       config: AnalysisConfig) -> List[AnalysisResult]:
+        """Analyze tweets on a pool of Ray actors, assigned round-robin"""
+        if not ray.is_initialized():
+            ray.init(ignore_reinit_error=True)
+        
+        num_actors = min(config.ray_num_actors or multiprocessing.cpu_count(), len(tweets))
+        remote_actor = ray.remote(AnalyzerActor).options(max_concurrency=config.max_concurrent_analyses)
+        actors = [remote_actor.remote() for _ in range(num_actors)]
+        self.logger.info(f"🛰️ Analyzing {len(tweets)} tweets on {num_actors} Ray actors")
         
-        for i, tweet in enumerate(tweets, 1):
-            self.logger.info(f"📊 Analyzing tweet {i}/{len(tweets)}: {tweet.tweet_id}")
+        try:
+            refs = [actors[i % num_actors].analyze_tweet.remote(tweet, run_id) for i, tweet in enumerate(tweets)]
             
-            try:
-                # Perform multi-agent analysis
-                result = await self.multi_agent_analyzer.analyze_tweet(tweet, run_id)
+            # ObjectRefs are awaitable, so waiting doesn't block the event loop like ray.get would
+            results = await asyncio.gather(*refs, return_exceptions=True)
+        finally:
+            for actor in actors:
+                ray.kill(actor)
+        
+        analysis_results = []
+        for tweet, result in zip(tweets, results):
+            if isinstance(result, Exception):
+                self.logger.error(f"❌ Failed to analyze tweet {tweet.tweet_id}: {str(result)}")
+            else:
                 analysis_results.append(result)
-                
-                self.logger.info(f"✅ Tweet {tweet.tweet_id} analyzed successfully")
-                
-            except Exception as e:
-                self.logger.error(f"❌ Failed to analyze tweet {tweet.tweet_id}: {str(e)}")
-                continue
         
+        self.logger.info(f"✅ {len(analysis_results)}/{len(tweets)} tweets analyzed on Ray")
         return analysis_results
     
     async def _save_individual_results(self, 
                                      analysis_results: List[AnalysisResult], 
-                                     run_id: str):
+                                     run_id: str,
+                                     timestamp: str):
         """Save individual analysis results to files"""
+        # JSON result and markdown report of every tweet are written concurrently,
+        # in waves of SAVE_BATCH_SIZE results to bound the number of open files
+        for start in range(0, len(analysis_results), self.SAVE_BATCH_SIZE):
+            batch = analysis_results[start:start + self.SAVE_BATCH_SIZE]
+            await asyncio.gather(
+                *[
+                    self.file_repository.save_analysis_result(
+                        result, run_id, f"content_{result.content_id}_{timestamp}.json"
+                    )
+                    for result in batch
+                ],
+                *[
+                    self.file_repository.save_text_file(
+                        self._generate_markdown_report(result), run_id, f"content_{result.content_id}_{timestamp}.md"
+                    )
+                    for result in batch
+                ]
+            )
+    
+    async def _save_batched_results(self, 
+                                  analysis_results: List[AnalysisResult], 
+                                  run_id: str,
+                                  timestamp: str):
+        """Save all results of the run as one markdown report and one NDJSON file"""
+        # Serializing the whole run is CPU-bound: keep it off the event loop
+        records, markdown, index = await asyncio.to_thread(self._build_batched_output, analysis_results)
+        
+        await asyncio.gather(
+            self.file_repository.save_binary_file(records, run_id, f"results_{timestamp}.ndjson"),
+            self.file_repository.save_binary_file(markdown, run_id, f"run_report_{timestamp}.md"),
+            self.file_repository.save_json_data(index, run_id, f"results_index_{timestamp}.json",
+                                                subfolder="individual_content")
+        )
+    
+    def _build_batched_output(self, analysis_results: List[AnalysisResult]) -> Tuple[bytes, bytes, Dict[str, Any]]:
+        """Build the NDJSON records, the combined markdown report and their offset index"""
+        markdown = bytearray()
+        records = bytearray()
+        index = {}
+        
         for result in analysis_results:
-            # Save JSON result
-            json_filename = f"content_{result.content_id}_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
-            await self.file_repository.save_analysis_result(result, run_id, json_filename)
+            record = result.to_json_bytes(indent=False) + b'\n'
+            report = self._generate_markdown_report(result).encode('utf-8') + b'\n'
             
-            # Save markdown report
-            md_filename = f"content_{result.content_id}_{datetime.now().strftime('%Y%m%d_%H%M%S')}.md"
-            markdown_content = self._generate_markdown_report(result)
-            await self.file_repository.save_text_file(markdown_content, run_id, md_filename)
+            # Byte ranges of this result in both files, for random access by content id
+            index[result.content_id] = {
+                'ndjson_offset': len(records),
+                'ndjson_length': len(record),
+                'markdown_offset': len(markdown),
+                'markdown_length': len(report)
+            }
+            records += record
+            markdown += report
+        
+        return bytes(records), bytes(markdown), index
     
-    async def _generate_summary(self, 
-                              analysis_results: List[AnalysisResult], 
-                              run_id: str, 
-                              start_time: datetime) -> Dict[str, Any]:
-        """Generate comprehensive analysis summary"""
+    async def _aggregate_stats(self, 
+                             analysis_results: List[AnalysisResult], 
+                             run_id: str, 
+                             start_time: datetime) -> Dict[str, Any]:
+        """Generate the analysis summary (aggregate statistics only, see _stream_details)"""
         execution_time = (datetime.now() - start_time).total_seconds()
         
-        # Calculate statistics
+        # Calculate statistics, averages and thread/media counts in one pass
         total_items = len(analysis_results)
-        successful_analyses = sum(1 for r in analysis_results if r.overall_status.value == "success")
-        failed_analyses = total_items - successful_analyses
-        
-        # Calculate average scores
-        valid_scores = [r.consolidated_score.consolidated_score for r in analysis_results 
-                       if r.consolidated_score]
-        average_score = sum(valid_scores) / len(valid_scores) if valid_scores else 0.0
+        successful_analyses = 0
+        thread_count = media_count = 0
+        score_sum = 0.0
+        score_count = 0
+        processing_time_sum = 0.0
         
-        # Count thread and media analyses
-        thread_count = sum(1 for r in analysis_results if r.has_thread_analysis)
-        media_count = sum(1 for r in analysis_results if r.has_media_analysis)
+        for result in analysis_results:
+            if result.overall_status is AnalysisStatus.SUCCESS:
+                successful_analyses += 1
+            
+            if result.consolidated_score:
+                score_sum += result.consolidated_score.consolidated_score
+                score_count += 1
+            
+            thread_count += result.has_thread_analysis
+            media_count += result.has_media_analysis
+            processing_time_sum += result.total_processing_time
         
-        # Collect processing times
-        processing_times = [r.total_processing_time for r in analysis_results]
-        avg_processing_time = sum(processing_times) / len(processing_times) if processing_times else 0.0
+        failed_analyses = total_items - successful_analyses
+        average_score = score_sum / score_count if score_count else 0.0
+        avg_processing_time = processing_time_sum / total_items if total_items else 0.0
         
         return {
             "run_id": run_id,
@@ -218,25 +470,34 @@ class AnalyzeTweetsUseCase:
                 "average_processing_time_per_item": avg_processing_time,
                 "total_execution_time": execution_time,
                 "error_rate": (failed_analyses / total_items * 100) if total_items > 0 else 0.0
-            },
-            "detailed_results": [
-                {
-                    "content_id": result.content_id,
-                    "quality_score": result.consolidated_score.consolidated_score if result.consolidated_score else 0.0,
-                    "processing_time": result.total_processing_time,
-                    "status": result.overall_status.value,
-                    "has_thread_analysis": result.has_thread_analysis,
-                    "has_media_analysis": result.has_media_analysis
-                }
-                for result in analysis_results
-            ]
+            }
         }
     
-    async def _save_summary(self, summary: Dict[str, Any], run_id: str):
-        """Save analysis summary to file"""
-        timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
-        filename = f"enhanced_analysis_summary_{run_id}_{timestamp}.md"
+    def _stream_details(self, analysis_results: List[AnalysisResult]) -> Iterator[bytes]:
+        """Yield one NDJSON row of per-item details per result, without building the full list"""
+        for result in analysis_results:
+            yield orjson.dumps({
+                "content_id": result.content_id,
+                "quality_score": result.consolidated_score.consolidated_score if result.consolidated_score else 0.0,
+                "processing_time": result.total_processing_time,
+                "status": STATUS_VALUES[result.overall_status],
+                "has_thread_analysis": result.has_thread_analysis,
+                "has_media_analysis": result.has_media_analysis
+            }) + b'\n'
+    
+    async def _save_summary(self, 
+                          summary: Dict[str, Any], 
+                          analysis_results: List[AnalysisResult], 
+                          run_id: str, 
+                          timestamp: str):
+        """Save analysis summary to file, with the per-item details streamed to NDJSON"""
+        details_filename = f"detailed_results_{run_id}_{timestamp}.ndjson"
+        await self.file_repository.save_ndjson_stream(
+            self._stream_details(analysis_results), run_id, details_filename, subfolder="summary"
+        )
+        summary['detailed_results_file'] = details_filename
         
+        filename = f"enhanced_analysis_summary_{run_id}_{timestamp}.md"
         markdown_summary = self._generate_summary_markdown(summary)
         await self.file_repository.save_text_file(markdown_summary, run_id, filename, subfolder="summary")
     
@@ -244,49 +505,34 @@ class AnalyzeTweetsUseCase:
         """Generate markdown report for individual analysis result"""
         score = result.consolidated_score.consolidated_score if result.consolidated_score else 0.0
         
-        return f"""# Analysis Report for Content {result.content_id}
-
-## Overview
-- **Content ID:** {result.content_id}
-- **Run ID:** {result.run_id}
-- **Analysis Timestamp:** {result.analysis_timestamp}
-- **Quality Score:** {score:.1f}/10
-- **Processing Time:** {result.total_processing_time:.2f}s
-- **Status:** {result.overall_status.value}
-
-## Agent Analysis Summary
-- **Success Rate:** {result.success_rate:.1f}%
-- **Average Agent Score:** {result.average_agent_score:.1f}
-- **Agents Executed:** {len(result.agent_responses)}
-
-## Key Findings
-{self._extract_key_findings(result)}
-
-## Thread Analysis
-{'✅ Thread detected and analyzed' if result.has_thread_analysis else '❌ No thread detected'}
-
-## Media Analysis  
-{'✅ Media content analyzed' if result.has_media_analysis else '❌ No media content'}
-
----
-*Generated by Enhanced Social Media Multi-Agent Analyzer v{result.analysis_version}*
-"""
+        return self.REPORT_TEMPLATE.substitute(
+            content_id=result.content_id,
+            run_id=result.run_id,
+            analysis_timestamp=result.analysis_timestamp,
+            score=f"{score:.1f}",
+            processing_time=f"{result.total_processing_time:.2f}",
+            status=STATUS_VALUES[result.overall_status],
+            success_rate=f"{result.success_rate:.1f}",
+            average_agent_score=f"{result.average_agent_score:.1f}",
+            agents_executed=len(result.agent_responses),
+            key_findings=self._extract_key_findings(result),
+            thread_analysis='✅ Thread detected and analyzed' if result.has_thread_analysis else '❌ No thread detected',
+            media_analysis='✅ Media content analyzed' if result.has_media_analysis else '❌ No media content',
+            analysis_version=result.analysis_version
+        )
     
     def _extract_key_findings(self, result: AnalysisResult) -> str:
         """Extract key findings from agent responses"""
         findings = []
         
-        # Extract summary if available
-        if 'summary_agent' in result.agent_responses:
-            summary_data = result.agent_responses['summary_agent'].response_data
+        # Extract summary and key themes if available
+        summary_response = result.agent_responses.get('summary_agent')
+        if summary_response:
+            summary_data = summary_response.response_data
             if 'title' in summary_data:
                 findings.append(f"**Title:** {summary_data['title']}")
             if 'abstract' in summary_data:
                 findings.append(f"**Abstract:** {summary_data['abstract'][:200]}...")
-        
-        # Extract key themes
-        if 'summary_agent' in result.agent_responses:
-            summary_data = result.agent_responses['summary_agent'].response_data
             if 'key_themes' in summary_data:
                 themes = ', '.join(summary_data['key_themes'][:5])  # Top 5 themes
                 findings.append(f"**Key Themes:** {themes}")
@@ -295,78 +541,37 @@ class AnalyzeTweetsUseCase:
     
     def _generate_summary_markdown(self, summary: Dict[str, Any]) -> str:
         """Generate markdown summary report"""
-        return f"""# 🚀 Enhanced Multi-Agent Analysis Summary
-
-**Run ID:** {summary['run_id']}  
-**Generated:** {summary['generation_timestamp']}  
-**Total Processing Time:** {summary['total_processing_time']:.2f} seconds
-
----
-
-## 📊 Analysis Overview
-
-### Content Analysis Results
-- **Total Items Processed:** {summary['analysis_overview']['total_items_processed']}
-- **Successful Analyses:** {summary['analysis_overview']['successful_analyses']}
-- **Failed Analyses:** {summary['analysis_overview']['failed_analyses']}
-- **Success Rate:** {summary['analysis_overview']['success_rate']:.1f}%
-- **Average Quality Score:** {summary['analysis_overview']['average_quality_score']:.2f}/10
-
-### Thread Detection Results
-- **Threads Detected:** {summary['thread_detection_results']['threads_detected']}
-- **Thread Detection Rate:** {summary['thread_detection_results']['thread_detection_rate']:.1f}%
-
-### Media Analysis Results
-- **Items with Media:** {summary['media_analysis_results']['items_with_media']}
-- **Media Analysis Rate:** {summary['media_analysis_results']['media_analysis_rate']:.1f}%
-
----
-
-## 🎯 Performance Metrics
-
-- **Average Processing Time per Item:** {summary['performance_metrics']['average_processing_time_per_item']:.2f} seconds
-- **Total Execution Time:** {summary['performance_metrics']['total_execution_time']:.2f} seconds
-- **Error Rate:** {summary['performance_metrics']['error_rate']:.1f}%
-
----
-
-## 📋 Detailed Results
-
-### Successfully Analyzed Content
-
-{self._format_detailed_results(summary['detailed_results'])}
-
----
-
-## 🔧 Configuration Used
-
-- **Analysis Type:** Enhanced Multi-Agent
-- **Thread Analysis:** True
-- **Media Analysis:** True
-- **Link Analysis:** True
-- **Output Formats:** json, markdown
-
----
-
-*Generated by Enhanced Social Media Multi-Agent Analyzer v4.0*
-"""
+        overview = summary['analysis_overview']
+        threads = summary['thread_detection_results']
+        media = summary['media_analysis_results']
+        performance = summary['performance_metrics']
+        
+        return self.SUMMARY_TEMPLATE.substitute(
+            run_id=summary['run_id'],
+            generation_timestamp=summary['generation_timestamp'],
+            total_processing_time=f"{summary['total_processing_time']:.2f}",
+            total_items_processed=overview['total_items_processed'],
+            successful_analyses=overview['successful_analyses'],
+            failed_analyses=overview['failed_analyses'],
+            success_rate=f"{overview['success_rate']:.1f}",
+            average_quality_score=f"{overview['average_quality_score']:.2f}",
+            threads_detected=threads['threads_detected'],
+            thread_detection_rate=f"{threads['thread_detection_rate']:.1f}",
+            items_with_media=media['items_with_media'],
+            media_analysis_rate=f"{media['media_analysis_rate']:.1f}",
+            average_processing_time_per_item=f"{performance['average_processing_time_per_item']:.2f}",
+            total_execution_time=f"{performance['total_execution_time']:.2f}",
+            error_rate=f"{performance['error_rate']:.1f}",
+            detailed_results=self._format_detailed_results(summary)
+        )
     
-    def _format_detailed_results(self, detailed_results: List[Dict[str, Any]]) -> str:
-        """Format detailed results for markdown"""
-        if not detailed_results:
+    def _format_detailed_results(self, summary: Dict[str, Any]) -> str:
+        """Format the reference to the streamed per-item details for markdown"""
+        total_items = summary['analysis_overview']['total_items_processed']
+        if not total_items:
             return "No results to display."
         
-        result_lines = []
-        for i, result in enumerate(detailed_results, 1):
-            result_lines.append(f"""#### {i}. Content ID: {result['content_id']}
-- **Quality Score:** {result['quality_score']:.1f}/10
-- **Processing Time:** {result['processing_time']:.2f}s
-- **Status:** {result['status']}
-- **Thread Analysis:** {'✅' if result['has_thread_analysis'] else '❌'}
-- **Media Analysis:** {'✅' if result['has_media_analysis'] else '❌'}
-""")
-        
-        return '\n'.join(result_lines)
+        return f"Per-item results ({total_items} rows): `{summary['detailed_results_file']}`"
     
     def _create_summary(self, 
                        run_id: str, 
@@ -381,6 +586,6 @@ class AnalyzeTweetsUseCase:
             "status": status,
             "execution_time": execution_time,
             "tweets_processed": len(results),
-            "successful_analyses": sum(1 for r in results if r.overall_status.value == "success"),
+            "successful_analyses": sum(1 for r in results if r.overall_status is AnalysisStatus.SUCCESS),
             "timestamp": datetime.now().isoformat()
         } 
\ No newline at end of file
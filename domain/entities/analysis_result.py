@@ -7,11 +7,15 @@ Core domain entity representing analysis results from multi-agent processing.
 Domain-Driven Design: Core domain entity containing analysis outcomes.
 """
 
-from dataclasses import dataclass, field
+import threading
+from bisect import bisect_right
+from dataclasses import dataclass, field, fields, MISSING
 from datetime import datetime
 from typing import Dict, List, Any, Optional
 from enum import Enum
 
+import orjson
+
 
 class AnalysisStatus(Enum):
     """Analysis status enumeration"""
@@ -30,7 +34,17 @@ class QualityLevel(Enum):
     VERY_POOR = "very_poor" # 0-2.9
 
 
-@dataclass
+# Enum -> string lookups for the serialization hot paths (plain dict hits, no Enum.value descriptor)
+STATUS_VALUES = {status: status.value for status in AnalysisStatus}
+QUALITY_VALUES = {quality: quality.value for quality in QualityLevel}
+
+# Quality level of a consolidated score: _QUALITY_LEVELS[bisect_right(_QUALITY_BOUNDS, score)]
+_QUALITY_BOUNDS = (3.0, 5.0, 7.0, 9.0)
+_QUALITY_LEVELS = (QualityLevel.VERY_POOR, QualityLevel.POOR, QualityLevel.AVERAGE,
+                   QualityLevel.GOOD, QualityLevel.EXCELLENT)
+
+
+@dataclass(slots=True)
 class AgentResponse:
     """Individual agent response data"""
     agent_name: str
@@ -41,7 +55,7 @@ class AgentResponse:
     error_message: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class ConsolidatedScore:
     """Consolidated scoring information"""
     total_agents_contributing: int
@@ -54,7 +68,7 @@ class ConsolidatedScore:
     detailed_reasoning: str
 
 
-@dataclass
+@dataclass(slots=True)
 class MediaAnalysisResult:
     """Media analysis results"""
     links_analyzed: List[Dict[str, Any]] = field(default_factory=list)
@@ -64,7 +78,7 @@ class MediaAnalysisResult:
     analysis_complete: bool = True
 
 
-@dataclass
+@dataclass(slots=True)
 class ThreadAnalysisResult:
     """Thread analysis results"""
     is_thread: bool = False
@@ -73,7 +87,7 @@ class ThreadAnalysisResult:
     conversation_context: Optional[Dict[str, Any]] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class AnalysisResult:
     """
     📊 Core Analysis Result entity representing comprehensive analysis outcomes
@@ -102,11 +116,18 @@ class AnalysisResult:
     analysis_version: str = "4.0"
     analysis_type: str = "enhanced_multi_agent"
     overall_status: AnalysisStatus = AnalysisStatus.PENDING
+    escalation_reason: Optional[str] = None  # why the result needs human review
+    model_used: Optional[str] = None
+    degraded: bool = False  # True when a fallback model tier had to be used
     
     # Quality assessment
     quality_level: Optional[QualityLevel] = None
     quality_indicators: Dict[str, float] = field(default_factory=dict)
     
+    # Agent statistics cached by finalize(); None means recompute on access
+    _success_rate: Optional[float] = field(default=None, init=False, repr=False, compare=False)
+    _average_agent_score: Optional[float] = field(default=None, init=False, repr=False, compare=False)
+    
     def __post_init__(self):
         """Post-initialization processing"""
         if not self.analysis_timestamp:
@@ -114,37 +135,33 @@ class AnalysisResult:
         
         # Determine quality level based on consolidated score
         if self.consolidated_score:
-            score = self.consolidated_score.consolidated_score
-            if score >= 9.0:
-                self.quality_level = QualityLevel.EXCELLENT
-            elif score >= 7.0:
-                self.quality_level = QualityLevel.GOOD
-            elif score >= 5.0:
-                self.quality_level = QualityLevel.AVERAGE
-            elif score >= 3.0:
-                self.quality_level = QualityLevel.POOR
-            else:
-                self.quality_level = QualityLevel.VERY_POOR
+            self.quality_level = _QUALITY_LEVELS[bisect_right(_QUALITY_BOUNDS, self.consolidated_score.consolidated_score)]
     
     @property
     def success_rate(self) -> float:
         """Calculate success rate of agent responses"""
-        if not self.agent_responses:
-            return 0.0
-        
-        successful = sum(1 for response in self.agent_responses.values() 
-                        if response.status == AnalysisStatus.SUCCESS)
-        return successful / len(self.agent_responses) * 100.0
+        if self._success_rate is None:
+            self.finalize()
+        return self._success_rate
     
     @property
     def average_agent_score(self) -> float:
         """Calculate average score across all agents"""
-        if not self.agent_responses:
-            return 0.0
+        if self._average_agent_score is None:
+            self.finalize()
+        return self._average_agent_score
+    
+    def finalize(self):
+        """Compute the agent statistics in one pass over the responses and cache them"""
+        successful = 0
+        score_sum = 0.0
+        for response in self.agent_responses.values():
+            if response.status is AnalysisStatus.SUCCESS:
+                successful += 1
+                score_sum += response.agent_score
         
-        scores = [response.agent_score for response in self.agent_responses.values() 
-                 if response.status == AnalysisStatus.SUCCESS]
-        return sum(scores) / len(scores) if scores else 0.0
+        self._success_rate = successful / len(self.agent_responses) * 100.0 if self.agent_responses else 0.0
+        self._average_agent_score = score_sum / successful if successful else 0.0
     
     @property
     def has_media_analysis(self) -> bool:
@@ -158,6 +175,24 @@ class AnalysisResult:
         return (self.thread_analysis is not None and 
                 self.thread_analysis.is_thread)
     
+    def reset(self, content_id: str, run_id: str, analysis_timestamp: datetime):
+        """Reinitialize this result in place for reuse (see AnalysisResultPool)"""
+        self.content_id = content_id
+        self.run_id = run_id
+        self.analysis_timestamp = analysis_timestamp
+        
+        # Everything else back to its default; dicts are cleared rather than reallocated
+        for f in fields(self):
+            if f.name in ('content_id', 'run_id', 'analysis_timestamp'):
+                continue
+            current = getattr(self, f.name)
+            if isinstance(current, dict):
+                current.clear()
+            elif f.default is not MISSING:
+                setattr(self, f.name, f.default)
+            else:
+                setattr(self, f.name, f.default_factory())
+    
     def add_agent_response(self, agent_name: str, response_data: Dict[str, Any], 
                           execution_time: float, status: AnalysisStatus = AnalysisStatus.SUCCESS,
                           error_message: Optional[str] = None):
@@ -165,6 +200,9 @@ class AnalysisResult:
         # Extract agent score from response data
         agent_score = response_data.get('agent_score', 5.0)  # Default fallback
         
+        # Cached statistics no longer cover every response
+        self._success_rate = self._average_agent_score = None
+        
         self.agent_responses[agent_name] = AgentResponse(
             agent_name=agent_name,
             response_data=response_data,
@@ -177,9 +215,17 @@ class AnalysisResult:
     def set_consolidated_score(self, total_agents: int, individual_scores: Dict[str, float],
                               weighted_avg: float, final_score: float, reasoning: str):
         """Set the consolidated scoring information"""
-        score_values = list(individual_scores.values())
-        score_range = f"{min(score_values):.1f} - {max(score_values):.1f}" if score_values else "N/A"
-        confidence_interval = f"±{(max(score_values) - min(score_values)) / 2:.1f}" if len(score_values) > 1 else "±0.0"
+        # Lowest and highest score in a single pass
+        scores = iter(individual_scores.values())
+        lowest = highest = next(scores, None)
+        for value in scores:
+            if value < lowest:
+                lowest = value
+            elif value > highest:
+                highest = value
+        
+        score_range = f"{lowest:.1f} - {highest:.1f}" if lowest is not None else "N/A"
+        confidence_interval = f"±{(highest - lowest) / 2:.1f}" if len(individual_scores) > 1 else "±0.0"
         
         self.consolidated_score = ConsolidatedScore(
             total_agents_contributing=total_agents,
@@ -204,7 +250,7 @@ class AnalysisResult:
                     "response_data": response.response_data,
                     "agent_score": response.agent_score,
                     "execution_time": response.execution_time,
-                    "status": response.status.value,
+                    "status": STATUS_VALUES[response.status],
                     "error_message": response.error_message
                 }
                 for name, response in self.agent_responses.items()
@@ -216,19 +262,88 @@ class AnalysisResult:
                 "consolidated_score": self.consolidated_score.consolidated_score,
                 "score_range": self.consolidated_score.score_range,
                 "confidence_interval": self.consolidated_score.confidence_interval,
-                "status": self.consolidated_score.status.value,
+                "status": STATUS_VALUES[self.consolidated_score.status],
                 "detailed_reasoning": self.consolidated_score.detailed_reasoning
             } if self.consolidated_score else None,
-            "media_analysis": self.media_analysis.__dict__ if self.media_analysis else None,
-            "thread_analysis": self.thread_analysis.__dict__ if self.thread_analysis else None,
+            "media_analysis": _shallow_dict(self.media_analysis) if self.media_analysis else None,
+            "thread_analysis": _shallow_dict(self.thread_analysis) if self.thread_analysis else None,
             "total_processing_time": self.total_processing_time,
             "analysis_version": self.analysis_version,
             "analysis_type": self.analysis_type,
-            "overall_status": self.overall_status.value,
-            "quality_level": self.quality_level.value if self.quality_level else None,
+            "overall_status": STATUS_VALUES[self.overall_status],
+            "escalation_reason": self.escalation_reason,
+            "model_used": self.model_used,
+            "degraded": self.degraded,
+            "quality_level": QUALITY_VALUES[self.quality_level] if self.quality_level else None,
             "quality_indicators": self.quality_indicators,
             "success_rate": self.success_rate,
             "average_agent_score": self.average_agent_score,
             "has_media_analysis": self.has_media_analysis,
             "has_thread_analysis": self.has_thread_analysis
-        } 
\ No newline at end of file
+        }
+    
+    def to_json_bytes(self, indent: bool = True) -> bytes:
+        """
+        Serialize to JSON bytes with the same content as to_dict()
+        
+        Only the top level is copied; orjson serializes the nested dataclasses,
+        enums and datetimes directly instead of going through a dict tree.
+        With ``indent=False`` the output is a single line (e.g. an NDJSON record).
+        """
+        data = {f.name: getattr(self, f.name) for f in fields(self) if not f.name.startswith('_')}
+        data.update(
+            success_rate=self.success_rate,
+            average_agent_score=self.average_agent_score,
+            has_media_analysis=self.has_media_analysis,
+            has_thread_analysis=self.has_thread_analysis
+        )
+        option = orjson.OPT_NON_STR_KEYS | (orjson.OPT_INDENT_2 if indent else 0)
+        return orjson.dumps(data, default=_json_default, option=option)
+
+
+class AnalysisResultPool:
+    """
+    ♻️ Pool of reusable AnalysisResult instances for high-volume runs
+    
+    Released results are reset in place and handed out again by acquire(),
+    so long runs don't allocate a fresh result (and its dicts) per tweet.
+    Only release a result once nothing references it anymore, i.e. after it
+    has been serialized and summarized.
+    """
+    
+    def __init__(self, max_size: int = 1000):
+        """Initialize an empty pool keeping at most ``max_size`` free results"""
+        self.max_size = max_size
+        self._free: List[AnalysisResult] = []
+        self._lock = threading.Lock()  # results may be released from worker threads
+        self.stats = {'created': 0, 'reused': 0}
+    
+    def acquire(self, content_id: str, run_id: str, analysis_timestamp: datetime) -> AnalysisResult:
+        """Get a clean result, reusing a released one when available"""
+        with self._lock:
+            result = self._free.pop() if self._free else None
+            self.stats['reused' if result else 'created'] += 1
+        
+        if result is None:
+            return AnalysisResult(content_id=content_id, run_id=run_id, analysis_timestamp=analysis_timestamp)
+        
+        result.reset(content_id, run_id, analysis_timestamp)
+        return result
+    
+    def release(self, result: AnalysisResult):
+        """Return a result to the pool (dropped if the pool is full)"""
+        with self._lock:
+            if len(self._free) < self.max_size:
+                self._free.append(result)
+
+
+def _shallow_dict(obj: Any) -> Dict[str, Any]:
+    """Field name -> value of a (slotted) dataclass instance, like its __dict__ would be"""
+    return {f.name: getattr(obj, f.name) for f in fields(obj)}
+
+
+def _json_default(obj: Any) -> Any:
+    """Fallback for values orjson can't serialize natively"""
+    if hasattr(obj, '__dict__'):
+        return obj.__dict__
+    return str(obj)
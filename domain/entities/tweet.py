@@ -7,11 +7,46 @@ Core domain entity representing a social media tweet.
 Domain-Driven Design: Core domain entity with business logic.
 """
 
+import sys
 from dataclasses import dataclass, field
+from functools import lru_cache
 from datetime import datetime
-from typing import Optional, Dict, List, Any
+from typing import Optional, Dict, List, Any, Callable, Iterable
 from enum import Enum
 
+import orjson
+
+try:
+    import ciso8601
+except ImportError:  # Optional: C-accelerated ISO 8601 parsing
+    ciso8601 = None
+
+_parse_dt = ciso8601.parse_datetime if ciso8601 else datetime.fromisoformat
+
+
+@lru_cache(maxsize=8192)
+def parse_iso_datetime(value: str) -> datetime:
+    """
+    Parse an ISO 8601 timestamp (as written by to_dict), memoized per string
+    
+    Batches of persisted tweets repeat the same author created_at and
+    processing timestamps, so each distinct string is parsed only once.
+    Use parse_iso_datetime.cache_clear() to reset.
+    """
+    return _parse_dt(value)
+
+
+def _dict_builder(cls: type) -> Callable[[Any], Dict[str, Any]]:
+    """
+    Compile ``lambda obj: {"field": obj.field, ...}`` for a slotted dataclass
+    
+    Gives the instance's field name -> value dict (what its __dict__ would be)
+    as one dict display, without a per-call loop or getattr. A slotted
+    dataclass's __slots__ are its field names, in order.
+    """
+    items = ", ".join(f"{name!r}: obj.{name}" for name in cls.__slots__)
+    return eval(compile(f"lambda obj: {{{items}}}", f"<{cls.__name__} dict builder>", "eval"))
+
 
 class ContentType(Enum):
     """Content type classification"""
@@ -24,7 +59,11 @@ class ContentType(Enum):
     OTHER = "other"
 
 
-@dataclass
+# Value -> member, so from_dict needs one dict lookup instead of ContentType(value)
+_CONTENT_TYPE_BY_VALUE = {content_type.value: content_type for content_type in ContentType}
+
+
+@dataclass(slots=True)
 class UserMetadata:
     """User metadata information"""
     user_id: str
@@ -37,16 +76,17 @@ class UserMetadata:
     public_metrics: Dict[str, int]
 
 
-@dataclass
+@dataclass(slots=True)
 class MediaAttachment:
     """Media attachment information"""
     links_analyzed: List[Dict[str, Any]] = field(default_factory=list)
     images_analyzed: List[Dict[str, Any]] = field(default_factory=list)
     total_processing_time: float = 0.0
     summary: Dict[str, Any] = field(default_factory=dict)
+    analysis_results: Dict[str, Any] = field(default_factory=dict)  # filled during extraction
 
 
-@dataclass
+@dataclass(slots=True)
 class ThreadContext:
     """Thread context information"""
     conversation_id: Optional[str] = None
@@ -55,7 +95,12 @@ class ThreadContext:
     thread_position: Optional[int] = None
 
 
-@dataclass
+_user_metadata_dict = _dict_builder(UserMetadata)
+_media_attachment_dict = _dict_builder(MediaAttachment)
+_thread_context_dict = _dict_builder(ThreadContext)
+
+
+@dataclass(slots=True)
 class Tweet:
     """
     🐦 Core Tweet entity representing social media content
@@ -102,10 +147,8 @@ class Tweet:
     @property
     def has_media(self) -> bool:
         """Check if tweet has media attachments"""
-        if not self.media_attachments:
-            return False
-        return (len(self.media_attachments.links_analyzed) > 0 or 
-                len(self.media_attachments.images_analyzed) > 0)
+        media = self.media_attachments
+        return bool(media and (media.links_analyzed or media.images_analyzed))
     
     @property
     def is_thread_tweet(self) -> bool:
@@ -114,6 +157,10 @@ class Tweet:
     
     def to_dict(self) -> Dict[str, Any]:
         """Convert tweet to dictionary representation"""
+        user_metadata = self.user_metadata
+        media_attachments = self.media_attachments
+        thread_context = self.thread_context
+        
         return {
             "tweet_id": self.tweet_id,
             "text": self.text,
@@ -124,10 +171,10 @@ class Tweet:
             "retweet_count": self.retweet_count,
             "reply_count": self.reply_count,
             "quote_count": self.quote_count,
-            "user_metadata": self.user_metadata.__dict__ if self.user_metadata else None,
-            "media_attachments": self.media_attachments.__dict__ if self.media_attachments else None,
+            "user_metadata": _user_metadata_dict(user_metadata) if user_metadata else None,
+            "media_attachments": _media_attachment_dict(media_attachments) if media_attachments else None,
             "external_links": self.external_links,
-            "thread_context": self.thread_context.__dict__ if self.thread_context else None,
+            "thread_context": _thread_context_dict(thread_context) if thread_context else None,
             "conversation_context": self.conversation_context,
             "content_type": self.content_type.value if self.content_type else None,
             "processing_timestamp": self.processing_timestamp.isoformat() if self.processing_timestamp else None,
@@ -136,18 +183,22 @@ class Tweet:
             "is_thread_tweet": self.is_thread_tweet
         }
     
+    def to_json_bytes(self) -> bytes:
+        """Serialize to_dict() to JSON bytes with orjson (e.g. one JSONL record)"""
+        return orjson.dumps(self.to_dict(), default=str)
+    
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> 'Tweet':
         """Create Tweet from dictionary representation"""
         # Convert datetime strings back to datetime objects
-        created_at = datetime.fromisoformat(data['created_at']) if data.get('created_at') else datetime.now()
-        processing_timestamp = datetime.fromisoformat(data['processing_timestamp']) if data.get('processing_timestamp') else None
+        created_at = parse_iso_datetime(data['created_at']) if data.get('created_at') else datetime.now()
+        processing_timestamp = parse_iso_datetime(data['processing_timestamp']) if data.get('processing_timestamp') else None
         
         # Convert user metadata
         user_metadata = None
         if data.get('user_metadata'):
             user_data = data['user_metadata']
-            user_created_at = datetime.fromisoformat(user_data['created_at']) if user_data.get('created_at') else datetime.now()
+            user_created_at = parse_iso_datetime(user_data['created_at']) if user_data.get('created_at') else datetime.now()
             user_metadata = UserMetadata(
                 user_id=user_data.get('user_id', ''),
                 username=user_data.get('username', ''),
@@ -167,7 +218,8 @@ class Tweet:
                 links_analyzed=media_data.get('links_analyzed', []),
                 images_analyzed=media_data.get('images_analyzed', []),
                 total_processing_time=media_data.get('total_processing_time', 0.0),
-                summary=media_data.get('summary', {})
+                summary=media_data.get('summary', {}),
+                analysis_results=media_data.get('analysis_results', {})
             )
         
         # Convert thread context
@@ -181,13 +233,9 @@ class Tweet:
                 thread_position=thread_data.get('thread_position')
             )
         
-        # Convert content type
-        content_type = None
-        if data.get('content_type'):
-            try:
-                content_type = ContentType(data['content_type'])
-            except ValueError:
-                content_type = ContentType.OTHER
+        # Convert content type (unknown values map to OTHER)
+        raw_content_type = data.get('content_type')
+        content_type = _CONTENT_TYPE_BY_VALUE.get(raw_content_type, ContentType.OTHER) if raw_content_type else None
         
         return cls(
             tweet_id=data.get('tweet_id', ''),
@@ -206,4 +254,39 @@ class Tweet:
             conversation_context=data.get('conversation_context'),
             content_type=content_type,
             processing_timestamp=processing_timestamp
-        ) 
\ No newline at end of file
+        ) 
+    
+    @classmethod
+    def from_dicts(cls, rows: Iterable[Dict[str, Any]],
+                   on_error: Optional[Callable[[Dict[str, Any], Exception], None]] = None) -> List['Tweet']:
+        """
+        Create Tweets from many dictionary representations (e.g. a loaded extraction file)
+        
+        Author ids/usernames and conversation ids repeat across a batch, so they
+        are interned to share one string each. Rows that fail to convert are
+        passed to ``on_error`` and skipped; without it the error propagates.
+        """
+        from_dict = cls.from_dict
+        intern = sys.intern
+        tweets = []
+        append = tweets.append
+        
+        for row in rows:
+            try:
+                tweet = from_dict(row)
+            except Exception as e:
+                if on_error is None:
+                    raise
+                on_error(row, e)
+                continue
+            
+            if type(tweet.author_id) is str:
+                tweet.author_id = intern(tweet.author_id)
+            if type(tweet.author_username) is str:
+                tweet.author_username = intern(tweet.author_username)
+            thread_context = tweet.thread_context
+            if thread_context is not None and type(thread_context.conversation_id) is str:
+                thread_context.conversation_id = intern(thread_context.conversation_id)
+            append(tweet)
+        
+        return tweets
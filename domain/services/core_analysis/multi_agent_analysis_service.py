@@ -14,18 +14,48 @@ This service handles:
 Domain-Driven Design: Application service for multi-agent analysis.
 """
 
-import json
 import logging
 import asyncio
+import random
+import itertools
 from datetime import datetime
-from typing import Dict, List, Any, Optional, Tuple
+from typing import Dict, List, Any, Optional, Tuple, Iterator
 from dataclasses import dataclass, asdict
 from pathlib import Path
+import orjson
+from openai import RateLimitError, APIConnectionError, APITimeoutError, InternalServerError
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+except ImportError:  # Parquet export is optional
+    pa = pq = None
+
+try:
+    import ijson
+except ImportError:  # Optional: streaming parse of legacy JSON array tweet files
+    ijson = None
 
 from ...entities.tweet import Tweet
-from ...entities.analysis_result import AnalysisResult, AnalysisStatus, QualityLevel
+from ...entities.analysis_result import AnalysisStatus, QualityLevel
 from .multi_agent_analyzer import MultiAgentAnalyzer
 from infrastructure.repositories.file_repository import FileRepository
+from infrastructure.repositories.llm_response_cache import LLMResponseCache
+from infrastructure.reliability.circuit_breaker import CircuitOpenError
+from infrastructure.reliability.adaptive_concurrency import AdaptiveConcurrency
+from infrastructure.monitoring.latency_metrics import LatencyRecorder
+
+# Transient provider errors worth retrying; auth errors, bad requests and refusals are not
+RETRYABLE_ERRORS = (RateLimitError, InternalServerError, APIConnectionError, APITimeoutError, asyncio.TimeoutError)
+
+# Read buffer for tweet input files (the 8 KiB default means many small reads on large files)
+INPUT_READ_BUFFER = 1 << 20
+
+# Tweets parsed per Phase 1 chunk; Phase 2 analyzes one chunk while the next is parsed
+LOAD_CHUNK_SIZE = 500
+
+# Part of every analysis cache key; bump when agent prompts or result layout change
+ANALYSIS_CACHE_VERSION = 1
 
 
 @dataclass
@@ -34,15 +64,17 @@ class AnalysisConfig:
     input_tweets_file: str
     output_directory: str = "results/analysis"
     max_retries: int = 3
-    retry_delay: int = 30  # seconds
+    retry_base: float = 1.0  # seconds, doubled per attempt
+    retry_delay_cap: float = 60.0  # seconds, upper bound for a single backoff
     batch_size: int = 5
     enable_error_recovery: bool = True
     continue_on_failure: bool = True
     save_intermediate_results: bool = True
+    max_concurrent_llm_calls: int = 8  # per model, shared by every analysis using this service (adaptive ceiling)
 
 
 @dataclass
-class AnalysisResult:
+class AnalysisRunReport:
     """Result of multi-agent analysis process"""
     analysis_id: str
     timestamp: datetime
@@ -59,6 +91,7 @@ class AnalysisResult:
     status: str  # 'success', 'partial', 'failed'
     error_details: List[str] = None
     agent_performance: Dict[str, Any] = None
+    degraded_analyses: int = 0  # Analyses that fell back to a cheaper model tier
 
 
 class MultiAgentAnalysisService:
@@ -78,11 +111,32 @@ class MultiAgentAnalysisService:
     
     def __init__(self, 
                  multi_agent_analyzer: MultiAgentAnalyzer,
-                 file_repository: FileRepository):
-        """Initialize multi-agent analysis service"""
+                 file_repository: FileRepository,
+                 latency_recorder: Optional[LatencyRecorder] = None,
+                 analysis_cache: Optional[LLMResponseCache] = None):
+        """
+        Initialize multi-agent analysis service
+        
+        Args:
+            analysis_cache: Optional cache of whole analysis results keyed by tweet
+                content (text, author, links, media) and model, so reruns and
+                duplicate tweets skip the agents entirely
+        """
         self.logger = logging.getLogger(__name__)
         self.analyzer = multi_agent_analyzer
         self.file_repository = file_repository
+        self.latency_recorder = latency_recorder or LatencyRecorder()
+        self.analysis_cache = analysis_cache
+        
+        # Adaptive concurrency gates keyed by model name, so models with separate
+        # rate limits don't share a budget; sized on first use from AnalysisConfig
+        self._llm_limiters: Dict[str, AdaptiveConcurrency] = {}
+        
+        # Background writer appending finished results to results.jsonl; results
+        # queued while a write is in progress go out together in the next write
+        self._ckpt_queue: asyncio.Queue = asyncio.Queue()
+        self._ckpt_task: Optional[asyncio.Task] = None
+        self._results_logs: Dict[Path, Any] = {}  # open append handles per results file
         
         # Analysis statistics
         self.stats = {
@@ -91,18 +145,24 @@ class MultiAgentAnalysisService:
             'failed_analyses': 0,
             'api_errors': 0,
             'retries_attempted': 0,
-            'agent_calls': 0
+            'agent_calls': 0,
+            'analysis_cache_hits': 0,
+            'duplicate_analyses_reused': 0
         }
     
-    async def analyze_extracted_data(self, config: AnalysisConfig) -> AnalysisResult:
+    async def analyze_extracted_data(self, 
+                                     config: AnalysisConfig,
+                                     completed_results: Optional[List[Dict]] = None) -> AnalysisRunReport:
         """
         Main analysis method - processes pre-extracted tweet data
         
         Args:
             config: Analysis configuration parameters
+            completed_results: Integrated results from a previous run; their
+                tweets are not analyzed again and the results are carried over
             
         Returns:
-            AnalysisResult with analysis details and file paths
+            AnalysisRunReport with analysis details and file paths
         """
         start_time = datetime.now()
         analysis_id = f"ANALYSIS_{start_time.strftime('%Y%m%d_%H%M%S')}"
@@ -112,163 +172,404 @@ class MultiAgentAnalysisService:
         
         # Create output directory
         output_dir = Path(config.output_directory) / analysis_id
-        output_dir.mkdir(parents=True, exist_ok=True)
+        await asyncio.to_thread(output_dir.mkdir, parents=True, exist_ok=True)
+        
+        # Phase 1: Load pre-extracted tweet data in chunks, parsed while earlier chunks are analyzed
+        batch_queue = asyncio.Queue(maxsize=2)
+        loader = asyncio.create_task(self._load_tweet_batches(config.input_tweets_file, batch_queue))
         
         try:
-            # Phase 1: Load pre-extracted tweet data
-            tweets = await self._load_extracted_tweets(config.input_tweets_file)
+            # Skip tweets a previous run already analyzed
+            completed = {r['tweet_id']: r for r in completed_results or []}
+            if completed:
+                self.logger.info(f"⏭️ Resuming: skipping {len(completed)} previously analyzed tweets")
             
-            # Phase 2: Process tweets through multi-agent analysis
-            analysis_results, processing_stats = await self._process_tweets_batch(
-                tweets, config, output_dir, analysis_id
-            )
+            tweets = []
+            analysis_results = []
+            serialized_results: Dict[str, bytes] = {}
+            processing_stats = self._new_processing_stats()
+            
+            # Phase 2: Process each chunk through multi-agent analysis as soon as it is loaded
+            while (batch := await batch_queue.get()) is not None:
+                tweets.extend(batch)
+                pending = [tweet for tweet in batch if tweet.tweet_id not in completed]
+                _, batch_stats = await self._process_tweets_batch(
+                    pending, config, output_dir, analysis_id, analysis_results, serialized_results
+                )
+                self._merge_processing_stats(processing_stats, batch_stats)
+            
+            await loader  # re-raises a load failure
+            self.logger.info(f"📊 Loaded {len(tweets)} tweets for analysis")
+            
+            # Carry over the previous results of tweets in this input
+            tweet_ids = {tweet.tweet_id for tweet in tweets}
+            previous_results = [r for r in completed.values() if r['tweet_id'] in tweet_ids]
+            analysis_results[:0] = previous_results
+            processing_stats['successful_analyses'] += len(previous_results)
+            processing_stats['tweets_analyzed'][:0] = [r['tweet_id'] for r in previous_results]
             
             # Phase 3: Integrate results and save comprehensive output
-            results_file, summary_file = await self._save_integrated_results(
-                tweets, analysis_results, processing_stats, output_dir, analysis_id
+            return await self._finalize_analysis(
+                tweets, analysis_results, processing_stats, config, output_dir, analysis_id, start_time,
+                serialized_results
             )
             
-            # Calculate processing time
-            processing_time = (datetime.now() - start_time).total_seconds()
+        except Exception as e:
+            return self._failed_analysis_result(config, analysis_id, start_time, e)
+        
+        finally:
+            loader.cancel()
+            await self._flush_checkpoints(output_dir)
+    
+    async def analyze_tweet_stream(self, 
+                                   batch_queue: asyncio.Queue,
+                                   config: AnalysisConfig) -> AnalysisRunReport:
+        """
+        Analyze tweet batches as they arrive from a concurrently running extraction
+        
+        Args:
+            batch_queue: Queue of ``List[Tweet]`` batches; ``None`` signals that
+                extraction has finished
+            config: Analysis configuration parameters
             
-            # Create analysis result
-            result = AnalysisResult(
-                analysis_id=analysis_id,
-                timestamp=start_time,
-                input_tweets_file=config.input_tweets_file,
-                total_tweets_processed=len(tweets),
-                successful_analyses=processing_stats['successful_analyses'],
-                failed_analyses=processing_stats['failed_analyses'],
-                tweets_analyzed=processing_stats['tweets_analyzed'],
-                tweets_failed=processing_stats['tweets_failed'],
-                results_file_path=str(results_file),
-                summary_file_path=str(summary_file),
-                analysis_config=config,
-                processing_time=processing_time,
-                status='success' if processing_stats['successful_analyses'] > 0 else 'failed',
-                error_details=processing_stats.get('errors', []),
-                agent_performance=processing_stats.get('agent_performance', {})
-            )
+        Returns:
+            AnalysisRunReport with analysis details and file paths
+        """
+        start_time = datetime.now()
+        analysis_id = f"ANALYSIS_{start_time.strftime('%Y%m%d_%H%M%S')}"
+        extraction_finished = False
+        
+        self.logger.info(f"🚀 Starting streaming multi-agent analysis: {analysis_id}")
+        
+        output_dir = Path(config.output_directory) / analysis_id
+        
+        try:
+            # Create output directory
+            await asyncio.to_thread(output_dir.mkdir, parents=True, exist_ok=True)
             
-            self.logger.info(f"✅ Analysis completed: {processing_stats['successful_analyses']}/{len(tweets)} tweets analyzed")
-            self.logger.info(f"📁 Results saved to: {results_file}")
+            tweets = []
+            analysis_results = []
+            serialized_results: Dict[str, bytes] = {}
+            processing_stats = self._new_processing_stats()
             
-            return result
+            # Phase 2: Analyze each batch as soon as extraction produces it
+            while True:
+                batch = await batch_queue.get()
+                if batch is None:
+                    extraction_finished = True
+                    break
+                
+                tweets.extend(batch)
+                _, batch_stats = await self._process_tweets_batch(
+                    batch, config, output_dir, analysis_id, analysis_results, serialized_results
+                )
+                self._merge_processing_stats(processing_stats, batch_stats)
             
-        except Exception as e:
-            processing_time = (datetime.now() - start_time).total_seconds()
-            error_msg = f"Analysis failed: {str(e)}"
-            self.logger.error(f"❌ {error_msg}")
+            # Phase 3: Integrate results and save comprehensive output
+            return await self._finalize_analysis(
+                tweets, analysis_results, processing_stats, config, output_dir, analysis_id, start_time,
+                serialized_results
+            )
             
-            # Return failed result
-            return AnalysisResult(
-                analysis_id=analysis_id,
-                timestamp=start_time,
-                input_tweets_file=config.input_tweets_file,
-                total_tweets_processed=0,
-                successful_analyses=0,
-                failed_analyses=0,
-                tweets_analyzed=[],
-                tweets_failed=[],
-                results_file_path="",
-                summary_file_path="",
-                analysis_config=config,
-                processing_time=processing_time,
-                status='failed',
-                error_details=[error_msg]
+        except Exception as e:
+            # Keep draining so the producer never blocks on a full queue
+            while not extraction_finished:
+                extraction_finished = await batch_queue.get() is None
+            return self._failed_analysis_result(config, analysis_id, start_time, e)
+        
+        finally:
+            await self._flush_checkpoints(output_dir)
+    
+    async def _finalize_analysis(self,
+                                 tweets: List[Tweet],
+                                 analysis_results: List[Dict],
+                                 processing_stats: Dict,
+                                 config: AnalysisConfig,
+                                 output_dir: Path,
+                                 analysis_id: str,
+                                 start_time: datetime,
+                                 serialized_results: Optional[Dict[str, bytes]] = None) -> AnalysisRunReport:
+        """Save integrated results and build the final analysis result"""
+        await self._flush_checkpoints(output_dir)
+        await asyncio.to_thread(self._export_parquet, analysis_results, output_dir)
+        
+        results_file, summary_file = await self._save_integrated_results(
+            tweets, analysis_results, processing_stats, output_dir, analysis_id, serialized_results
+        )
+        
+        # Calculate processing time
+        processing_time = (datetime.now() - start_time).total_seconds()
+        
+        # Create analysis result
+        result = AnalysisRunReport(
+            analysis_id=analysis_id,
+            timestamp=start_time,
+            input_tweets_file=config.input_tweets_file,
+            total_tweets_processed=len(tweets),
+            successful_analyses=processing_stats['successful_analyses'],
+            failed_analyses=processing_stats['failed_analyses'],
+            tweets_analyzed=processing_stats['tweets_analyzed'],
+            tweets_failed=processing_stats['tweets_failed'],
+            results_file_path=str(results_file),
+            summary_file_path=str(summary_file),
+            analysis_config=config,
+            processing_time=processing_time,
+            status='success' if processing_stats['successful_analyses'] > 0 else 'failed',
+            error_details=processing_stats.get('errors', []),
+            agent_performance=processing_stats.get('agent_performance', {}),
+            degraded_analyses=sum(
+                1 for r in analysis_results
+                if isinstance(r.get('analysis_result'), dict) and r['analysis_result'].get('degraded')
             )
+        )
+        
+        self.logger.info(f"✅ Analysis completed: {processing_stats['successful_analyses']}/{len(tweets)} tweets analyzed")
+        if result.degraded_analyses:
+            self.logger.warning(f"⬇️ {result.degraded_analyses} analyses used a fallback model")
+        self.logger.info(f"📁 Results saved to: {results_file}")
+        
+        return result
     
-    async def _load_extracted_tweets(self, tweets_file_path: str) -> List[Tweet]:
-        """Load pre-extracted tweets from file"""
+    def _failed_analysis_result(self,
+                                config: AnalysisConfig,
+                                analysis_id: str,
+                                start_time: datetime,
+                                error: Exception) -> AnalysisRunReport:
+        """Build the result returned when analysis fails as a whole"""
+        processing_time = (datetime.now() - start_time).total_seconds()
+        error_msg = f"Analysis failed: {str(error)}"
+        self.logger.error(f"❌ {error_msg}")
+        
+        return AnalysisRunReport(
+            analysis_id=analysis_id,
+            timestamp=start_time,
+            input_tweets_file=config.input_tweets_file,
+            total_tweets_processed=0,
+            successful_analyses=0,
+            failed_analyses=0,
+            tweets_analyzed=[],
+            tweets_failed=[],
+            results_file_path="",
+            summary_file_path="",
+            analysis_config=config,
+            processing_time=processing_time,
+            status='failed',
+            error_details=[error_msg]
+        )
+    
+    async def _load_tweet_batches(self, tweets_file_path: str, batch_queue: asyncio.Queue):
+        """
+        Load pre-extracted tweets from file into ``batch_queue``
+        
+        The file is parsed in a worker thread, ``LOAD_CHUNK_SIZE`` tweets at a
+        time; the queue is bounded, so parsing stays at most a couple of
+        chunks ahead of the analysis. ``None`` is queued once loading ends,
+        also when it fails (the error is then raised by the task).
+        """
         self.logger.info("📂 Phase 1: Loading pre-extracted tweet data...")
         
+        # Convert dictionaries back to Tweet entities
+        def _skip(tweet_data: Dict, e: Exception):
+            self.logger.warning("⚠️ Failed to load tweet %s: %s", tweet_data.get('id', 'unknown'), e)
+        
+        records = self._iter_tweet_records(tweets_file_path)
+        
+        def _next_chunk() -> List[Tweet]:
+            return Tweet.from_dicts(itertools.islice(records, LOAD_CHUNK_SIZE), on_error=_skip)
+        
         try:
-            with open(tweets_file_path, 'r', encoding='utf-8') as f:
-                tweets_data = json.load(f)
-            
-            # Convert dictionaries back to Tweet entities
-            tweets = []
-            for tweet_data in tweets_data:
-                try:
-                    tweet = Tweet.from_dict(tweet_data)
-                    tweets.append(tweet)
-                except Exception as e:
-                    self.logger.warning(f"⚠️ Failed to load tweet {tweet_data.get('id', 'unknown')}: {str(e)}")
-                    continue
-            
-            self.logger.info(f"📊 Loaded {len(tweets)} tweets for analysis")
-            return tweets
-            
+            while batch := await asyncio.to_thread(_next_chunk):
+                await batch_queue.put(batch)
+                
         except Exception as e:
             error_msg = f"Failed to load tweets from {tweets_file_path}: {str(e)}"
             self.logger.error(f"❌ {error_msg}")
+            await batch_queue.put(None)
             raise
+        
+        await batch_queue.put(None)
+    
+    @staticmethod
+    def _iter_tweet_records(tweets_file_path: str) -> Iterator[Dict]:
+        """Yield tweet dictionaries from a JSONL extraction file (or a legacy JSON array)"""
+        if not tweets_file_path.endswith('.jsonl'):
+            if ijson is None:
+                with open(tweets_file_path, 'rb', buffering=INPUT_READ_BUFFER) as f:
+                    yield from orjson.loads(f.read())
+                return
+            
+            # One array item at a time instead of the whole document in memory
+            with open(tweets_file_path, 'rb', buffering=INPUT_READ_BUFFER) as f:
+                yield from ijson.items(f, 'item', use_float=True)
+            return
+        
+        with open(tweets_file_path, 'rb', buffering=INPUT_READ_BUFFER) as f:
+            for line in f:
+                if line.strip():
+                    yield orjson.loads(line)
     
     async def _process_tweets_batch(self, 
                                   tweets: List[Tweet], 
                                   config: AnalysisConfig,
                                   output_dir: Path,
-                                  analysis_id: str) -> Tuple[List[Dict], Dict]:
-        """Process tweets through multi-agent analysis with error handling"""
+                                  analysis_id: str,
+                                  analysis_results: Optional[List[Dict]] = None,
+                                  serialized_results: Optional[Dict[str, bytes]] = None) -> Tuple[List[Dict], Dict]:
+        """
+        Process tweets through multi-agent analysis with error handling
+        
+        Results are appended to ``analysis_results`` when given, so streamed
+        batches accumulate into a single list. Each result is serialized once;
+        its JSON line is kept in ``serialized_results`` by tweet id when given,
+        for the checkpoint log and the integrated results file to reuse.
+        """
         self.logger.info("🤖 Phase 2: Processing tweets through multi-agent analysis...")
         
-        processing_stats = {
-            'successful_analyses': 0,
-            'failed_analyses': 0,
-            'tweets_analyzed': [],
-            'tweets_failed': [],
-            'errors': [],
-            'agent_performance': {},
-            'retry_stats': {}
-        }
+        processing_stats = self._new_processing_stats()
         
-        analysis_results = []
+        if analysis_results is None:
+            analysis_results = []
         
-        # Process tweets in batches
-        for i in range(0, len(tweets), config.batch_size):
-            batch = tweets[i:i + config.batch_size]
-            self.logger.info(f"📊 Processing batch {i//config.batch_size + 1}: {len(batch)} tweets")
-            
-            for tweet in batch:
-                result = await self._analyze_single_tweet_with_retry(
-                    tweet, config, processing_stats, analysis_id
-                )
+        # Success flag per tweet, by batch position; the id lists are derived once the batch ends
+        outcomes: List[Optional[bool]] = [None] * len(tweets)
+        
+        def _record(index: int, tweet: Tweet, result: Optional[Dict]):
+            outcomes[index] = bool(result)
+            if result:
+                analysis_results.append(result)
                 
-                if result:
-                    analysis_results.append(result)
-                    processing_stats['successful_analyses'] += 1
-                    processing_stats['tweets_analyzed'].append(tweet.tweet_id)
+                if serialized_results is not None or config.save_intermediate_results:
+                    row = self._serialize_result(result)
+                    if serialized_results is not None:
+                        serialized_results[tweet.tweet_id] = row
                     
-                    # Save intermediate results if enabled
+                    # Checkpoint intermediate results if enabled
                     if config.save_intermediate_results:
-                        await self._save_intermediate_result(result, output_dir, tweet.tweet_id)
-                else:
-                    processing_stats['failed_analyses'] += 1
-                    processing_stats['tweets_failed'].append(tweet.tweet_id)
-                
-                self.stats['tweets_processed'] += 1
+                        self._enqueue_checkpoint(row, output_dir)
             
-            # Small delay between batches to prevent API overload
-            await asyncio.sleep(1)
+            self.stats['tweets_processed'] += 1
+        
+        # Look up the whole batch in the analysis cache at once; only misses reach the analyzer
+        reuse = self._reuses_analyses()
+        cache_keys = [self._analysis_cache_key(tweet) for tweet in tweets] if reuse else [None] * len(tweets)
+        cached = await self._cached_analyses(cache_keys) if reuse else {}
+        misses = []
+        
+        # Identical tweets are analyzed once; the others wait for that analysis
+        duplicates: Dict[str, List[Tuple[int, Tweet]]] = {}
+        
+        for index, (tweet, cache_key) in enumerate(zip(tweets, cache_keys)):
+            result = self._cached_result(cached[cache_key], tweet, analysis_id) if cache_key in cached else None
+            if result is not None:
+                _record(index, tweet, result)
+            elif reuse and cache_key in duplicates:
+                duplicates[cache_key].append((index, tweet))
+            else:
+                if reuse:
+                    duplicates[cache_key] = []
+                misses.append((index, tweet, cache_key))
+        
+        # New analyses are written back to the cache together once the batch ends
+        # (only when they could be read back: sampled analyses are never reused)
+        cache_writes: Optional[List[Tuple[str, str]]] = [] if self.analysis_cache and reuse else None
+        
+        # At most batch_size tweets in flight; results are handled as each one
+        # finishes so it can be checkpointed immediately
+        slots = asyncio.Semaphore(config.batch_size)
+        self.logger.info(f"📊 Processing {len(misses)} unique tweets ({len(tweets) - len(misses)} cached or duplicate), up to {config.batch_size} at a time")
+        
+        async def _bounded(index: int, tweet: Tweet,
+                           cache_key: Optional[str]) -> Tuple[int, Tweet, Optional[str], Optional[Dict]]:
+            async with slots:
+                return index, tweet, cache_key, await self._analyze_single_tweet_with_retry(
+                    tweet, config, processing_stats, analysis_id, cache_key, cache_writes
+                )
+        
+        tasks = [asyncio.create_task(_bounded(index, tweet, cache_key)) for index, tweet, cache_key in misses]
+        try:
+            for next_done in asyncio.as_completed(tasks):
+                index, tweet, cache_key, result = await next_done
+                _record(index, tweet, result)
+                
+                for duplicate_index, duplicate in duplicates.pop(cache_key, []):
+                    duplicate_result = self._duplicate_result(result, duplicate, analysis_id) if result else None
+                    if duplicate_result is None:
+                        processing_stats['errors'].append(
+                            f"Tweet {duplicate.tweet_id}: analysis of identical tweet {tweet.tweet_id} failed"
+                        )
+                    _record(duplicate_index, duplicate, duplicate_result)
+        finally:
+            # Don't leave analyses running if one failed hard (continue_on_failure=False) or we were cancelled
+            for task in tasks:
+                task.cancel()
+            await self._store_cached_analyses(cache_writes)
+        
+        processing_stats['tweets_analyzed'] = [tweet.tweet_id for tweet, ok in zip(tweets, outcomes) if ok]
+        processing_stats['tweets_failed'] = [tweet.tweet_id for tweet, ok in zip(tweets, outcomes) if ok is False]
+        processing_stats['successful_analyses'] = len(processing_stats['tweets_analyzed'])
+        processing_stats['failed_analyses'] = len(processing_stats['tweets_failed'])
         
         self.logger.info(f"✅ Batch processing completed: {processing_stats['successful_analyses']} successful, {processing_stats['failed_analyses']} failed")
         return analysis_results, processing_stats
     
+    @staticmethod
+    def _new_processing_stats() -> Dict:
+        """Create an empty processing statistics structure"""
+        return {
+            'successful_analyses': 0,
+            'failed_analyses': 0,
+            'tweets_analyzed': [],
+            'tweets_failed': [],
+            'errors': [],
+            'agent_performance': {},
+            'retry_stats': {}
+        }
+    
+    @staticmethod
+    def _merge_processing_stats(total: Dict, batch: Dict):
+        """Accumulate per-batch processing statistics into the running totals"""
+        total['successful_analyses'] += batch['successful_analyses']
+        total['failed_analyses'] += batch['failed_analyses']
+        total['tweets_analyzed'].extend(batch['tweets_analyzed'])
+        total['tweets_failed'].extend(batch['tweets_failed'])
+        total['errors'].extend(batch['errors'])
+        total['agent_performance'].update(batch['agent_performance'])
+        total['retry_stats'].update(batch['retry_stats'])
+    
+    def _llm_limiter(self, config: AnalysisConfig) -> AdaptiveConcurrency:
+        """Get the adaptive concurrency gate for the analyzer's model"""
+        model = getattr(self.analyzer, 'model', 'default')
+        if model not in self._llm_limiters:
+            self._llm_limiters[model] = AdaptiveConcurrency(f"llm:{model}", config.max_concurrent_llm_calls)
+        return self._llm_limiters[model]
+    
     async def _analyze_single_tweet_with_retry(self, 
                                              tweet: Tweet, 
                                              config: AnalysisConfig,
                                              stats: Dict,
-                                             analysis_id: str) -> Optional[Dict]:
-        """Analyze single tweet with retry logic for API failures"""
+                                             analysis_id: str,
+                                             cache_key: Optional[str] = None,
+                                             cache_writes: Optional[List[Tuple[str, str]]] = None) -> Optional[Dict]:
+        """
+        Analyze single tweet with retry logic for API failures
+        
+        A cacheable analysis is added to ``cache_writes`` as a
+        ``(cache_key, json)`` pair for the caller to store.
+        """
         retries = 0
         last_error = None
+        limiter = self._llm_limiter(config)
         
         while retries <= config.max_retries:
             try:
-                self.logger.debug(f"🔍 Analyzing tweet {tweet.tweet_id} (attempt {retries + 1})")
+                self.logger.debug("🔍 Analyzing tweet %s (attempt %d)", tweet.tweet_id, retries + 1)
                 
                 # Perform multi-agent analysis
-                analysis_result = await self.analyzer.analyze_tweet(tweet, analysis_id)
+                async with limiter:
+                    analysis_result = await self.analyzer.analyze_tweet(tweet, analysis_id)
+                
+                # A result that had to fall back off the primary model counts as rate-limited
+                await limiter.record(rate_limited=bool(getattr(analysis_result, 'degraded', False)))
                 
                 if analysis_result:
                     # Create integrated result with input data
@@ -283,30 +584,52 @@ class MultiAgentAnalysisService:
                         }
                     }
                     
-                    self.logger.debug(f"✅ Successfully analyzed tweet {tweet.tweet_id}")
+                    if cache_key and cache_writes is not None:
+                        cache_entry = self._cache_entry(cache_key, analysis_result, integrated_result['analysis_result'])
+                        if cache_entry:
+                            cache_writes.append(cache_entry)
+                    
+                    self.logger.debug("✅ Successfully analyzed tweet %s", tweet.tweet_id)
                     return integrated_result
                 else:
                     raise Exception("Analysis returned empty result")
                     
+            except CircuitOpenError as e:
+                # Provider is short-circuited: retrying now would only be rejected again
+                self.logger.warning("⚡ Skipping tweet %s: %s", tweet.tweet_id, e)
+                stats['errors'].append(f"Tweet {tweet.tweet_id}: {str(e)}")
+                return None
+                
             except Exception as e:
                 last_error = str(e)
-                retries += 1
                 self.stats['api_errors'] += 1
+                if isinstance(e, RateLimitError):
+                    await limiter.record(rate_limited=True)
+                
+                if not isinstance(e, RETRYABLE_ERRORS):
+                    self.logger.error("❌ Non-retryable error for tweet %s: %s", tweet.tweet_id, last_error)
+                    stats['errors'].append(f"Tweet {tweet.tweet_id}: {last_error}")
+                    
+                    if not config.continue_on_failure:
+                        raise Exception(f"Analysis failed for tweet {tweet.tweet_id}: {last_error}")
+                    return None
+                
+                retries += 1
                 self.stats['retries_attempted'] += 1
                 
                 if retries <= config.max_retries:
-                    self.logger.warning(f"⚠️ Analysis failed for tweet {tweet.tweet_id} (attempt {retries}): {last_error}")
-                    self.logger.info(f"🔄 Retrying in {config.retry_delay} seconds...")
+                    # Full jitter: desynchronize retries so failed calls don't wake together
+                    delay = random.uniform(0, min(config.retry_delay_cap, config.retry_base * (2 ** (retries - 1))))
+                    self.logger.warning("⚠️ Analysis failed for tweet %s (attempt %d): %s", tweet.tweet_id, retries, last_error)
+                    self.logger.info("🔄 Retrying in %.1f seconds...", delay)
                     
                     # Add error to stats
-                    if 'retry_stats' not in stats:
-                        stats['retry_stats'] = {}
                     stats['retry_stats'][tweet.tweet_id] = retries
                     
                     # Wait before retry
-                    await asyncio.sleep(config.retry_delay)
+                    await asyncio.sleep(delay)
                 else:
-                    self.logger.error(f"❌ Max retries exceeded for tweet {tweet.tweet_id}: {last_error}")
+                    self.logger.error("❌ Max retries exceeded for tweet %s: %s", tweet.tweet_id, last_error)
                     stats['errors'].append(f"Tweet {tweet.tweet_id}: {last_error}")
                     
                     if not config.continue_on_failure:
@@ -315,47 +638,245 @@ class MultiAgentAnalysisService:
         # Return None if all retries failed
         return None
     
-    async def _save_intermediate_result(self, result: Dict, output_dir: Path, tweet_id: str):
-        """Save intermediate analysis result"""
+    def _analysis_cache_key(self, tweet: Tweet) -> str:
+        """Cache key of a tweet's analysis: its content and the analyzer model, not its id or metrics"""
+        media = tweet.media_attachments
+        media_urls = [
+            item.get('url') for item in (media.links_analyzed + media.images_analyzed) if isinstance(item, dict)
+        ] if media else []
+        
+        content = orjson.dumps({
+            'text': tweet.text,
+            'author': tweet.author_username,
+            'links': tweet.external_links,
+            'media': media_urls,
+            'version': ANALYSIS_CACHE_VERSION
+        }, option=orjson.OPT_SORT_KEYS, default=str)
+        return LLMResponseCache.make_key(getattr(self.analyzer, 'model', 'default'), content.decode())
+    
+    def _reuses_analyses(self) -> bool:
+        """Whether an analysis may stand in for another of identical content (cached or duplicate tweets)"""
+        # Same reuse policy as the analyzer's agent response cache
+        return getattr(self.analyzer, 'temperature', 0) == 0 or getattr(self.analyzer, 'cache_sampled_responses', False)
+    
+    async def _cached_analyses(self, cache_keys: List[Optional[str]]) -> Dict[str, str]:
+        """Cached analyses (as JSON) found for a batch's cache keys, fetched with one bulk lookup"""
+        keys = [key for key in cache_keys if key]
+        if not keys or self.analysis_cache is None:
+            return {}
+        
+        try:
+            return await self.analysis_cache.get_many_async(keys)
+        except Exception as e:
+            self.logger.warning(f"⚠️ Analysis cache lookup failed for {len(keys)} tweets: {str(e)}")
+            return {}
+    
+    def _cached_result(self, cached: str, tweet: Tweet, analysis_id: str) -> Optional[Dict]:
+        """Integrated result built from a cached analysis of the same content, or None if unreadable"""
         try:
-            intermediate_dir = output_dir / 'intermediate'
-            intermediate_dir.mkdir(exist_ok=True)
+            analysis = orjson.loads(cached)
+        except Exception as e:
+            self.logger.warning("⚠️ Unreadable cached analysis for tweet %s: %s", tweet.tweet_id, e)
+            return None
+        
+        self.stats['analysis_cache_hits'] += 1
+        self.logger.debug("🗃️ Reused cached analysis for tweet %s", tweet.tweet_id)
+        return self._reused_result(analysis, tweet, analysis_id, cache_hit=True)
+    
+    def _duplicate_result(self, result: Dict, tweet: Tweet, analysis_id: str) -> Optional[Dict]:
+        """Integrated result for ``tweet`` reusing the analysis of an identical tweet from this run"""
+        if not isinstance(result.get('analysis_result'), dict):
+            return None
+        
+        # Round-trip through JSON, as for cached analyses, so the copy shares nothing with the original
+        analysis = orjson.loads(orjson.dumps(result['analysis_result'], default=str))
+        
+        self.stats['duplicate_analyses_reused'] += 1
+        self.logger.debug("♊ Reused analysis of tweet %s for identical tweet %s", result['tweet_id'], tweet.tweet_id)
+        return self._reused_result(analysis, tweet, analysis_id, duplicate_of=result['tweet_id'])
+    
+    def _reused_result(self, analysis: Dict, tweet: Tweet, analysis_id: str, **metadata) -> Dict:
+        """Integrated result for ``tweet`` around an analysis made for identical content"""
+        # The analysis may come from a duplicate tweet or an earlier run
+        now_iso = datetime.now().isoformat()
+        analysis['content_id'] = tweet.tweet_id
+        analysis['run_id'] = analysis_id
+        analysis['analysis_timestamp'] = now_iso
+        
+        return {
+            'tweet_id': tweet.tweet_id,
+            'input_data': tweet.to_dict(),
+            'analysis_result': analysis,
+            'processing_metadata': {
+                'analyzed_at': now_iso,
+                'attempts': 0,
+                'status': 'success',
+                **metadata
+            }
+        }
+    
+    def _cache_entry(self, cache_key: str, analysis_result: Any, analysis: Any) -> Optional[Tuple[str, str]]:
+        """(cache_key, json) of a successful primary-model analysis worth reusing, or None"""
+        if (not isinstance(analysis, dict) or getattr(analysis_result, 'degraded', False)
+                or getattr(analysis_result, 'overall_status', None) is not AnalysisStatus.SUCCESS):
+            return None
+        
+        try:
+            return cache_key, orjson.dumps(analysis, default=str).decode()
+        except Exception as e:
+            self.logger.warning("⚠️ Failed to cache analysis for tweet %s: %s", analysis.get('content_id'), e)
+            return None
+    
+    async def _store_cached_analyses(self, cache_writes: Optional[List[Tuple[str, str]]]):
+        """Write a batch's new analyses to the cache in one transaction"""
+        if not cache_writes:
+            return
+        
+        try:
+            await self.analysis_cache.set_many_async(cache_writes)
+        except Exception as e:
+            self.logger.warning(f"⚠️ Failed to cache {len(cache_writes)} analyses: {str(e)}")
+    
+    @staticmethod
+    def _serialize_result(result: Dict) -> bytes:
+        """JSON line of a tweet result, as written to results.jsonl and the integrated results"""
+        return orjson.dumps(result, default=str, option=orjson.OPT_NON_STR_KEYS | orjson.OPT_APPEND_NEWLINE)
+    
+    def _enqueue_checkpoint(self, row: bytes, output_dir: Path):
+        """Queue a finished tweet result's JSON line for appending to the run's results.jsonl"""
+        if self._ckpt_task is None or self._ckpt_task.done():
+            self._ckpt_task = asyncio.create_task(self._checkpoint_writer())
+        
+        self._ckpt_queue.put_nowait((row, output_dir / 'results.jsonl'))
+    
+    async def _checkpoint_writer(self):
+        """Background task appending queued results off the event loop"""
+        loop = asyncio.get_running_loop()
+        while True:
+            pending = [await self._ckpt_queue.get()]
+            while not self._ckpt_queue.empty():
+                pending.append(self._ckpt_queue.get_nowait())
+            
+            rows_by_path: Dict[Path, List[bytes]] = {}
+            for row, path in pending:
+                rows_by_path.setdefault(path, []).append(row)
+            
+            for path, rows in rows_by_path.items():
+                try:
+                    with self.latency_recorder.time("local", "checkpoint_write"):
+                        await loop.run_in_executor(None, self._append_jsonl, path, rows)
+                except Exception as e:
+                    self.logger.warning(f"⚠️ Failed to append {len(rows)} results to {path}: {str(e)}")
+            
+            for _ in pending:
+                self._ckpt_queue.task_done()
+    
+    @staticmethod
+    def _write_json(path: Path, data: Dict):
+        """Write an indented JSON file (runs in a worker thread)"""
+        path.write_bytes(orjson.dumps(data, default=str, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS))
+    
+    def _write_results_jsonl(self, path: Path, header: Dict, rows: List[Dict], footer: Dict,
+                             serialized_results: Optional[Dict[str, bytes]] = None):
+        """
+        Write header, rows and footer as JSONL (runs in a worker thread)
+        
+        Rows already serialized during Phase 2 are written as-is; the rest
+        (e.g. results carried over from a resumed run) are serialized one
+        line at a time.
+        """
+        serialized_results = serialized_results or {}
+        with open(path, 'wb') as f:
+            f.write(self._serialize_result(header))
+            for row in rows:
+                f.write(serialized_results.get(row['tweet_id']) or self._serialize_result(row))
+            f.write(self._serialize_result(footer))
+    
+    def _append_jsonl(self, path: Path, rows: List[bytes]):
+        """Append JSON lines to a JSONL file, keeping the handle open for the rest of the run"""
+        handle = self._results_logs.get(path)
+        if handle is None:
+            handle = self._results_logs[path] = open(path, 'ab')
+        handle.write(b''.join(rows))
+        handle.flush()
+    
+    async def _flush_checkpoints(self, output_dir: Path):
+        """Wait until every queued result is written, then stop the writer and close the run's results file"""
+        if self._ckpt_task is not None and not self._ckpt_task.done():
+            await self._ckpt_queue.join()
+            # Idle writer: stop it rather than leave it pending past the run (restarted on the next enqueue)
+            self._ckpt_task.cancel()
+            self._ckpt_task = None
+        
+        handle = self._results_logs.pop(output_dir / 'results.jsonl', None)
+        if handle is not None:
+            handle.close()
+    
+    def _export_parquet(self, analysis_results: List[Dict], output_dir: Path):
+        """Write the final results as one zstd-compressed Parquet file (requires pyarrow)"""
+        if pa is None or not analysis_results:
+            return
+        
+        try:
+            # Nested payloads differ per agent, so they are stored as JSON strings
+            rows = [{
+                'tweet_id': result['tweet_id'],
+                'status': result.get('processing_metadata', {}).get('status'),
+                'analyzed_at': result.get('processing_metadata', {}).get('analyzed_at'),
+                'input_data': orjson.dumps(result.get('input_data'), default=str).decode(),
+                'analysis_result': orjson.dumps(result.get('analysis_result'), default=str).decode()
+            } for result in analysis_results]
+            
+            pq.write_table(pa.Table.from_pylist(rows), output_dir / 'results.parquet', compression='zstd')
             
-            result_file = intermediate_dir / f'tweet_{tweet_id}_analysis.json'
-            with open(result_file, 'w', encoding='utf-8') as f:
-                json.dump(result, f, indent=2, ensure_ascii=False, default=str)
-                
         except Exception as e:
-            self.logger.warning(f"⚠️ Failed to save intermediate result for tweet {tweet_id}: {str(e)}")
+            self.logger.warning(f"⚠️ Failed to export Parquet results: {str(e)}")
     
     async def _save_integrated_results(self, 
                                      tweets: List[Tweet],
                                      analysis_results: List[Dict], 
                                      stats: Dict,
                                      output_dir: Path,
-                                     analysis_id: str) -> Tuple[Path, Path]:
+                                     analysis_id: str,
+                                     serialized_results: Optional[Dict[str, bytes]] = None) -> Tuple[Path, Path]:
         """Save integrated analysis results"""
         self.logger.info("💾 Phase 3: Saving integrated analysis results...")
         
-        # Create comprehensive results structure
-        integrated_results = {
+        # Count input features in a single pass over the tweets
+        with_media = with_threads = with_urls = 0
+        for t in tweets:
+            if t.media_attachments:
+                with_media += 1
+            if t.thread_context and t.thread_context.is_thread:
+                with_threads += 1
+            if getattr(t, 'extracted_urls', None):
+                with_urls += 1
+        
+        # Integrated results are streamed as JSONL: header, one line per tweet result, footer
+        header = {
             'analysis_id': analysis_id,
-            'timestamp': datetime.now().isoformat(),
-            'input_summary': {
-                'total_tweets': len(tweets),
-                'tweets_with_media': len([t for t in tweets if t.media_attachments]),
-                'tweets_with_threads': len([t for t in tweets if t.thread_context and t.thread_context.is_thread]),
-                'tweets_with_urls': len([t for t in tweets if hasattr(t, 'extracted_urls') and t.extracted_urls])
-            },
-            'analysis_summary': {
-                'successful_analyses': stats['successful_analyses'],
-                'failed_analyses': stats['failed_analyses'],
-                'success_rate': stats['successful_analyses'] / len(tweets) if tweets else 0,
-                'processing_stats': self.stats
-            },
-            'detailed_results': analysis_results,
-            'error_analysis': stats.get('errors', []),
-            'performance_metrics': stats.get('agent_performance', {})
+            'meta': {
+                'timestamp': datetime.now().isoformat(),
+                'input_summary': {
+                    'total_tweets': len(tweets),
+                    'tweets_with_media': with_media,
+                    'tweets_with_threads': with_threads,
+                    'tweets_with_urls': with_urls
+                },
+                'analysis_summary': {
+                    'successful_analyses': stats['successful_analyses'],
+                    'failed_analyses': stats['failed_analyses'],
+                    'success_rate': stats['successful_analyses'] / len(tweets) if tweets else 0,
+                    'processing_stats': dict(self.stats)  # snapshot: written from a worker thread
+                }
+            }
+        }
+        footer = {
+            'analysis_id': analysis_id,
+            'footer': {
+                'error_analysis': stats.get('errors', []),
+                'performance_metrics': stats.get('agent_performance', {})
+            }
         }
         
         # Create analysis summary
@@ -374,16 +895,14 @@ class MultiAgentAnalysisService:
         }
         
         # Save files
-        results_file = output_dir / 'integrated_analysis_results.json'
+        results_file = output_dir / 'integrated_analysis_results.jsonl'
         summary_file = output_dir / 'analysis_summary.json'
         
-        # Save integrated results
-        with open(results_file, 'w', encoding='utf-8') as f:
-            json.dump(integrated_results, f, indent=2, ensure_ascii=False, default=str)
-        
-        # Save summary
-        with open(summary_file, 'w', encoding='utf-8') as f:
-            json.dump(summary, f, indent=2, ensure_ascii=False, default=str)
+        # Save integrated results and summary off the event loop
+        await asyncio.to_thread(
+            self._write_results_jsonl, results_file, header, analysis_results, footer, serialized_results
+        )
+        await asyncio.to_thread(self._write_json, summary_file, summary)
         
         self.logger.info(f"💾 Integrated results saved:")
         self.logger.info(f"   📄 Full results: {results_file}")
@@ -396,23 +915,32 @@ class MultiAgentAnalysisService:
         if not results:
             return {}
         
-        # Extract scores and analyze patterns
-        scores = []
-        categories = {}
+        # Extract scores and tally the distribution in the same pass
+        score_total = 0
+        score_count = 0
+        high = medium = low = 0
         
         for result in results:
             analysis = result.get('analysis_result', {})
             if 'consolidated_score' in analysis:
                 score_data = analysis['consolidated_score']
-                scores.append(score_data.get('consolidated_score', 0))
+                score = score_data.get('consolidated_score', 0)
+                score_total += score
+                score_count += 1
+                if score >= 8:
+                    high += 1
+                elif score >= 6:
+                    medium += 1
+                elif score < 6:
+                    low += 1
         
         return {
             'total_analyzed': len(results),
-            'average_score': sum(scores) / len(scores) if scores else 0,
+            'average_score': score_total / score_count if score_count else 0,
             'score_distribution': {
-                'high_quality': len([s for s in scores if s >= 8]),
-                'medium_quality': len([s for s in scores if 6 <= s < 8]),
-                'low_quality': len([s for s in scores if s < 6])
+                'high_quality': high,
+                'medium_quality': medium,
+                'low_quality': low
             }
         }
     
@@ -421,10 +949,14 @@ class MultiAgentAnalysisService:
         if not results:
             return {}
         
+        processed = self.stats['tweets_processed']
+        if processed <= 0:
+            return {'processing_efficiency': 0, 'error_rate': 0, 'retry_rate': 0}
+        
         return {
-            'processing_efficiency': len(results) / self.stats['tweets_processed'] if self.stats['tweets_processed'] > 0 else 0,
-            'error_rate': self.stats['api_errors'] / self.stats['tweets_processed'] if self.stats['tweets_processed'] > 0 else 0,
-            'retry_rate': self.stats['retries_attempted'] / self.stats['tweets_processed'] if self.stats['tweets_processed'] > 0 else 0
+            'processing_efficiency': len(results) / processed,
+            'error_rate': self.stats['api_errors'] / processed,
+            'retry_rate': self.stats['retries_attempted'] / processed
         }
     
     def _generate_recommendations(self, stats: Dict, results: List[Dict]) -> List[str]:
@@ -8,17 +8,48 @@ Domain-Driven Design: Core domain service containing business logic.
 Orchestrates 12 specialized AI agents for comprehensive content analysis.
 """
 
+import re
 import json
 import logging
 import asyncio
+import itertools
+import time
 from datetime import datetime
-from typing import Dict, List, Any, Optional
+from typing import Dict, List, Any, Optional, Tuple
 from enum import Enum
-from openai import AsyncOpenAI
+import httpx
+import orjson
+from openai import AsyncOpenAI, RateLimitError, InternalServerError
+
+try:
+    import h2
+except ImportError:  # Optional: HTTP/2 multiplexing of concurrent agent calls
+    h2 = None
 
 from ...entities.tweet import Tweet
-from ...entities.analysis_result import AnalysisResult, AnalysisStatus, MediaAnalysisResult, ThreadAnalysisResult
+from ...entities.analysis_result import AnalysisResult, AnalysisResultPool, AnalysisStatus, MediaAnalysisResult, ThreadAnalysisResult
 from infrastructure.prompts.agent_prompts import AgentPrompts
+from infrastructure.reliability.rate_limiter import AsyncRateLimiter
+from infrastructure.reliability.circuit_breaker import CircuitBreaker, CircuitOpenError, CircuitState
+from infrastructure.reliability.bulkhead import Bulkhead
+from infrastructure.repositories.llm_response_cache import LLMResponseCache
+from infrastructure.monitoring.latency_metrics import LatencyRecorder
+from infrastructure.adapters.openai_batch_adapter import OpenAIBatchAdapter
+
+
+# Identical for every call, so it always opens the cacheable prompt prefix
+SYSTEM_PROMPT = "You are a specialized AI agent for social media content analysis. Always respond with valid JSON format as specified in the prompt."
+
+# Pre-'agent_score' score fields, checked in order when a response lacks agent_score
+LEGACY_SCORE_FIELDS = (
+    'summary_score', 'preprocessing_score', 'context_score',
+    'fact_check_score', 'depth_score', 'relevance_score',
+    'structure_score', 'reflection_score', 'credibility_score',
+    'consensus_score'
+)
+
+# Body of a ```json fenced block in an agent response
+JSON_BLOCK_RE = re.compile(r"```json\s*(.*?)\s*```", re.S)
 
 
 def convert_enums_to_strings(obj: Any) -> Any:
@@ -62,13 +93,106 @@ class MultiAgentAnalyzer:
     12. Validator - Final validation and quality assurance
     """
     
-    def __init__(self, openai_api_key: str):
-        """Initialize multi-agent analyzer"""
+    # Run score_consolidator and validator concurrently over the Phase 1 responses;
+    # when False the validator runs after, and also sees, the score consolidator
+    PARALLEL_META_AGENTS = True
+    
+    # Connection pool of the HTTP client created when none is passed in
+    DEFAULT_HTTP_LIMITS = httpx.Limits(max_connections=64, max_keepalive_connections=64)
+    
+    def __init__(self, 
+                 openai_api_key: str,
+                 rpm_limiter: Optional[AsyncRateLimiter] = None,
+                 tpm_limiter: Optional[AsyncRateLimiter] = None,
+                 circuit_breaker: Optional[CircuitBreaker] = None,
+                 bulkhead: Optional[Bulkhead] = None,
+                 http_client: Optional[httpx.AsyncClient] = None,
+                 per_call_timeout: float = 60.0,
+                 response_cache: Optional[LLMResponseCache] = None,
+                 cache_sampled_responses: bool = False,
+                 latency_recorder: Optional[LatencyRecorder] = None,
+                 result_pool: Optional[AnalysisResultPool] = None,
+                 batch_api: bool = False,
+                 batch_timeout: Optional[float] = None):
+        """
+        Initialize multi-agent analyzer
+        
+        Args:
+            openai_api_key: OpenAI API key
+            rpm_limiter: Optional requests-per-minute limiter shared by all agent calls
+            tpm_limiter: Optional tokens-per-minute limiter shared by all agent calls
+            circuit_breaker: Optional OpenAI circuit breaker for the primary model; each
+                fallback model tier gets its own breaker with the same settings
+            bulkhead: Optional OpenAI bulkhead bounding concurrent and queued agent calls
+            http_client: Optional long-lived HTTP client so connections are kept alive across calls;
+                when omitted the analyzer creates (and closes in aclose) its own pooled client
+            per_call_timeout: Deadline in seconds for a single OpenAI request
+            response_cache: Optional cache of agent responses keyed by model + prompt
+            cache_sampled_responses: Serve cached responses even though temperature > 0;
+                otherwise the cache is only read as a stale fallback when OpenAI fails
+            latency_recorder: Optional recorder timing every OpenAI request
+            result_pool: Optional pool analysis results are acquired from instead of allocated
+            batch_api: Send each tweet's independent agents as one OpenAI Batch API job
+                (half price, but completes asynchronously - for offline runs only)
+            batch_timeout: Seconds to wait for a batch before cancelling it (None waits
+                for the provider's completion window)
+        """
         self.logger = logging.getLogger(__name__)
         self.prompts = AgentPrompts()
+        self._instructions: Dict[str, str] = {}
+        
+        # Configure OpenAI client: one keep-alive connection pool shared by every agent call,
+        # over HTTP/2 when available so concurrent agent calls share a connection
+        self._owns_http_client = http_client is None
+        if http_client is None:
+            http_client = httpx.AsyncClient(http2=h2 is not None, timeout=httpx.Timeout(60.0, connect=5.0),
+                                            limits=self.DEFAULT_HTTP_LIMITS)
+        self.openai_client = AsyncOpenAI(api_key=openai_api_key, http_client=http_client)
+        self.model = "gpt-4"
+        
+        # Model tiers tried in order when the current one is rate-limited or its circuit is open
+        self.model_tiers = [self.model, "gpt-4o-mini", "gpt-3.5-turbo"]
+        self.max_tokens = 2000
+        self.temperature = 0.3
+        
+        # Completion budget per agent, sized to its JSON response format (others get max_tokens);
+        # smaller budgets also reserve less of the TPM quota per call
+        self.agent_max_tokens = {
+            'summary_agent': 800,
+            'input_preprocessor': 800,
+            'context_evaluator': 1000,
+            'fact_checker': 1200,
+            'depth_analyzer': 1000,
+            'relevance_analyzer': 1000,
+            'structure_analyzer': 800,
+            'reflective_agent': 1000,
+            'metadata_ranking_agent': 800,
+            'consensus_agent': 800,
+            'score_consolidator': 1200,
+            'validator': 1000
+        }
         
-        # Configure OpenAI client
-        self.openai_client = AsyncOpenAI(api_key=openai_api_key)
+        # Proactive throttling so we stay under the account quota instead of retrying on 429
+        self.rpm_limiter = rpm_limiter
+        self.tpm_limiter = tpm_limiter
+        self.circuit_breaker = circuit_breaker
+        self.circuit_breakers: Dict[str, CircuitBreaker] = {}
+        if circuit_breaker:
+            self.circuit_breakers = {
+                model: circuit_breaker if model == self.model else CircuitBreaker(
+                    f"{circuit_breaker.name}:{model}",
+                    failure_threshold=circuit_breaker.failure_threshold,
+                    recovery_timeout=circuit_breaker.recovery_timeout
+                )
+                for model in self.model_tiers
+            }
+        self.bulkhead = bulkhead
+        self.per_call_timeout = per_call_timeout
+        self.response_cache = response_cache
+        self.cache_sampled_responses = cache_sampled_responses
+        self.latency_recorder = latency_recorder or LatencyRecorder()
+        self.result_pool = result_pool
+        self.batch_adapter = OpenAIBatchAdapter(self.openai_client, timeout=batch_timeout) if batch_api else None
         
         # Agent configuration with importance weights for score consolidation
         self.agent_weights = {
@@ -102,6 +226,17 @@ class MultiAgentAnalyzer:
             'validator'
         ]
     
+    async def __aenter__(self) -> 'MultiAgentAnalyzer':
+        return self
+    
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.aclose()
+    
+    async def aclose(self):
+        """Close the OpenAI client if its HTTP client was created by this analyzer"""
+        if self._owns_http_client:
+            await self.openai_client.close()
+    
     async def analyze_tweet(self, tweet: Tweet, run_id: str) -> AnalysisResult:
         """
         Analyze a tweet using all 12 agents
@@ -112,45 +247,69 @@ class MultiAgentAnalyzer:
             
         Returns:
             Complete analysis result
+            
+        Raises:
+            CircuitOpenError: If every OpenAI model tier is short-circuited after repeated failures
         """
-        start_time = datetime.now()
-        self.logger.info(f"🔍 Starting comprehensive analysis for tweet {tweet.tweet_id}")
-        
-        # Create analysis result
-        analysis_result = AnalysisResult(
-            content_id=tweet.tweet_id,
-            run_id=run_id,
-            analysis_timestamp=start_time
-        )
+        if self.circuit_breakers and all(
+            breaker.state is CircuitState.OPEN for breaker in self.circuit_breakers.values()
+        ):
+            raise CircuitOpenError(f"OpenAI circuits are open for all models; skipping analysis of tweet {tweet.tweet_id}")
+        
+        start_time = time.perf_counter()
+        self.logger.info("🔍 Starting comprehensive analysis for tweet %s", tweet.tweet_id)
+        
+        # Create analysis result (the timestamp is wall-clock; durations use perf_counter)
+        analysis_timestamp = datetime.now()
+        if self.result_pool:
+            analysis_result = self.result_pool.acquire(tweet.tweet_id, run_id, analysis_timestamp)
+        else:
+            analysis_result = AnalysisResult(
+                content_id=tweet.tweet_id,
+                run_id=run_id,
+                analysis_timestamp=analysis_timestamp
+            )
         
-        # Prepare comprehensive input for agents
-        comprehensive_input = self._prepare_comprehensive_input(tweet)
+        # Prepare comprehensive input for agents, rendered once as the message every agent shares
+        input_message = self.prompts.get_input_message(self._prepare_comprehensive_input(tweet))
         
         # Execute agents with smart parallelization
         agent_responses = {}
+        models_used: List[str] = []
         
         # Phase 1: Execute independent analysis agents in parallel (first 10 agents)
         independent_agents = self.agent_sequence[:10]  # Exclude score_consolidator and validator
-        self.logger.info(f"🚀 Phase 1: Executing {len(independent_agents)} analysis agents in parallel...")
+        self.logger.info("🚀 Phase 1: Executing %d analysis agents in parallel...", len(independent_agents))
         
-        parallel_start_time = datetime.now()
-        parallel_tasks = []
-        
-        for agent_name in independent_agents:
-            task = self._execute_agent_with_metadata(agent_name, comprehensive_input, {})
-            parallel_tasks.append(task)
+        parallel_start_time = time.perf_counter()
         
         # Wait for all parallel agents to complete with timeout protection
         try:
-            parallel_results = await asyncio.wait_for(
-                asyncio.gather(*parallel_tasks, return_exceptions=True),
-                timeout=300  # 5 minutes timeout for all parallel agents
-            )
+            parallel_results = None
+            if self.batch_adapter:
+                # Batch jobs have their own (much longer) deadline
+                parallel_results = await self._execute_agents_batched(independent_agents, input_message, models_used)
+            
+            if parallel_results is None:
+                parallel_results = await self._run_independent_agents(
+                    independent_agents, input_message, models_used,
+                    timeout=300  # 5 minutes timeout for all parallel agents
+                )
             
             # Process parallel results
             for i, result in enumerate(parallel_results):
                 agent_name = independent_agents[i]
-                if isinstance(result, Exception):
+                if isinstance(result, asyncio.TimeoutError):
+                    # Still running at the phase deadline
+                    agent_responses[agent_name] = {'error': 'timeout', 'agent_score': 5.0}
+                    analysis_result.add_agent_response(
+                        agent_name=agent_name,
+                        response_data={'error': 'timeout', 'agent_score': 5.0},
+                        execution_time=0.0,
+                        status=AnalysisStatus.FAILED,
+                        error_message="Agent execution timed out"
+                    )
+                elif isinstance(result, Exception):
                     self.logger.error(f"❌ {agent_name} failed: {str(result)}")
                     # Add failed response
                     analysis_result.add_agent_response(
@@ -169,10 +328,10 @@ class MultiAgentAnalyzer:
                         execution_time=result['execution_time'],
                         status=AnalysisStatus.SUCCESS
                     )
-                    self.logger.info(f"✅ {agent_name} completed in {result['execution_time']:.2f}s")
+                    self.logger.info("✅ %s completed in %.2fs", agent_name, result['execution_time'])
             
-            parallel_time = (datetime.now() - parallel_start_time).total_seconds()
-            self.logger.info(f"🎉 Phase 1 completed in {parallel_time:.2f}s (parallel execution)")
+            parallel_time = time.perf_counter() - parallel_start_time
+            self.logger.info("🎉 Phase 1 completed in %.2fs (parallel execution)", parallel_time)
             
         except asyncio.TimeoutError:
             self.logger.error("⏰ Parallel agent execution timed out after 5 minutes")
@@ -188,99 +347,56 @@ class MultiAgentAnalyzer:
                         error_message="Agent execution timed out"
                     )
         
-        # Phase 2: Execute dependent agents sequentially (score_consolidator and validator)
+        # Phase 2: Execute dependent agents (score_consolidator and validator)
         dependent_agents = ['score_consolidator', 'validator']
-        self.logger.info(f"🔄 Phase 2: Executing {len(dependent_agents)} dependent agents sequentially...")
-        
-        for agent_name in dependent_agents:
-            self.logger.info(f"🔍 Executing {agent_name}")
-            
-            try:
-                agent_start_time = datetime.now()
-                
-                # Get appropriate prompt for dependent agents
-                if agent_name == 'score_consolidator':
-                    prompt = self.prompts.get_score_consolidator_prompt()
-                    input_data = {
-                        'comprehensive_input': comprehensive_input,
-                        'all_agent_responses': json.dumps(agent_responses, indent=2, default=str)
-                    }
-                elif agent_name == 'validator':
-                    prompt = self.prompts.get_validator_prompt()
-                    input_data = {
-                        'comprehensive_input': comprehensive_input,
-                        'all_agent_responses': json.dumps(agent_responses, indent=2, default=str)
-                    }
-                
-                # Format prompt with input data
-                formatted_prompt = prompt.format(**input_data)
-                
-                # Execute agent with timeout
-                response = await asyncio.wait_for(
-                    self._execute_agent(formatted_prompt),
-                    timeout=60  # 1 minute timeout per dependent agent
-                )
-                
-                # Calculate execution time
-                execution_time = (datetime.now() - agent_start_time).total_seconds()
-                
-                # Parse and store response
-                parsed_response = self._parse_json_safe(response, agent_name)
-                agent_responses[agent_name] = parsed_response
-                
-                # Add to analysis result
-                analysis_result.add_agent_response(
-                    agent_name=agent_name,
-                    response_data=parsed_response,
-                    execution_time=execution_time,
-                    status=AnalysisStatus.SUCCESS
-                )
-                
-                self.logger.info(f"✅ {agent_name} completed in {execution_time:.2f}s")
-                
-            except asyncio.TimeoutError:
-                self.logger.error(f"⏰ {agent_name} timed out after 60 seconds")
-                # Add timeout response
-                agent_responses[agent_name] = {'error': 'timeout', 'agent_score': 5.0}
-                analysis_result.add_agent_response(
-                    agent_name=agent_name,
-                    response_data={'error': 'timeout', 'agent_score': 5.0},
-                    execution_time=60.0,
-                    status=AnalysisStatus.FAILED,
-                    error_message="Agent execution timed out"
-                )
-            except Exception as e:
-                self.logger.error(f"❌ Error executing {agent_name}: {str(e)}")
-                # Add error response
-                agent_responses[agent_name] = {'error': str(e), 'agent_score': 5.0}
-                analysis_result.add_agent_response(
-                    agent_name=agent_name,
-                    response_data={'error': str(e), 'agent_score': 5.0},
-                    execution_time=0.0,
-                    status=AnalysisStatus.FAILED,
-                    error_message=str(e)
-                )
-                
-                # Add error response
-                analysis_result.add_agent_response(
-                    agent_name=agent_name,
-                    response_data={'error': str(e)},
-                    execution_time=0.0,
-                    status=AnalysisStatus.FAILED,
-                    error_message=str(e)
-                )
+        self.logger.info("🔄 Phase 2: Executing %d dependent agents %s...", len(dependent_agents),
+                         "concurrently" if self.PARALLEL_META_AGENTS else "sequentially")
+        
+        # Agent responses as compact JSON members, each serialized once and
+        # extended with the responses added since the previous dependent agent
+        response_members: List[str] = []
+        
+        if self.PARALLEL_META_AGENTS:
+            # Both agents read the same Phase 1 responses
+            all_agent_responses = self._serialize_agent_responses(agent_responses, response_members)
+            dependent_results = await asyncio.gather(*(
+                self._execute_dependent_agent(agent_name, all_agent_responses, input_message, models_used)
+                for agent_name in dependent_agents
+            ))
+        else:
+            # Each agent also sees the responses of the dependent agents before it
+            dependent_results = []
+            for agent_name in dependent_agents:
+                all_agent_responses = self._serialize_agent_responses(agent_responses, response_members)
+                result = await self._execute_dependent_agent(agent_name, all_agent_responses, input_message, models_used)
+                agent_responses[agent_name] = result['response']
+                dependent_results.append(result)
+        
+        for agent_name, result in zip(dependent_agents, dependent_results):
+            agent_responses[agent_name] = result['response']
+            analysis_result.add_agent_response(
+                agent_name=agent_name,
+                response_data=result['response'],
+                execution_time=result['execution_time'],
+                status=result['status'],
+                error_message=result['error_message']
+            )
         
         # Calculate consolidated score
         self._calculate_consolidated_score(analysis_result, agent_responses)
         
         # Set total processing time
-        analysis_result.total_processing_time = (datetime.now() - start_time).total_seconds()
+        analysis_result.total_processing_time = time.perf_counter() - start_time
         analysis_result.overall_status = AnalysisStatus.SUCCESS
+        analysis_result.finalize()
         
-        # Convert enums to strings for JSON serialization
-        analysis_result = convert_enums_to_strings(analysis_result)
+        # Tag the result with the lowest model tier any agent had to fall back to
+        analysis_result.model_used = max(models_used, key=self.model_tiers.index, default=self.model)
+        analysis_result.degraded = analysis_result.model_used != self.model
+        if analysis_result.degraded:
+            self.logger.warning(f"⬇️ Tweet {tweet.tweet_id} analyzed with fallback model {analysis_result.model_used}")
         
-        self.logger.info(f"🎉 Analysis complete for tweet {tweet.tweet_id} in {analysis_result.total_processing_time:.2f}s")
+        self.logger.info("🎉 Analysis complete for tweet %s in %.2fs", tweet.tweet_id, analysis_result.total_processing_time)
         
         return analysis_result
     
@@ -369,14 +485,7 @@ Thread Information:
                 
                 # Fallback to legacy field names if agent_score not found
                 if score is None:
-                    legacy_fields = [
-                        'summary_score', 'preprocessing_score', 'context_score', 
-                        'fact_check_score', 'depth_score', 'relevance_score',
-                        'structure_score', 'reflection_score', 'credibility_score',
-                        'consensus_score'
-                    ]
-                    
-                    for field in legacy_fields:
+                    for field in LEGACY_SCORE_FIELDS:
                         if field in response:
                             score = response[field]
                             break
@@ -423,29 +532,26 @@ Thread Information:
         
         # Strategy 1: Direct JSON parsing
         try:
-            return json.loads(response_text)
-        except json.JSONDecodeError:
+            return orjson.loads(response_text)
+        except orjson.JSONDecodeError:
             pass
         
         # Strategy 2: Extract JSON from code blocks
-        try:
-            if '```json' in response_text:
-                start = response_text.find('```json') + 7
-                end = response_text.find('```', start)
-                json_content = response_text[start:end].strip()
-                return json.loads(json_content)
-        except (json.JSONDecodeError, ValueError):
-            pass
+        match = JSON_BLOCK_RE.search(response_text)
+        if match:
+            try:
+                return orjson.loads(match.group(1))
+            except orjson.JSONDecodeError:
+                pass
         
         # Strategy 3: Extract JSON from curly braces
-        try:
-            start = response_text.find('{')
-            end = response_text.rfind('}') + 1
-            if start != -1 and end > start:
-                json_content = response_text[start:end]
-                return json.loads(json_content)
-        except (json.JSONDecodeError, ValueError):
-            pass
+        start = response_text.find('{')
+        end = response_text.rfind('}') + 1
+        if start != -1 and end > start:
+            try:
+                return orjson.loads(response_text[start:end])
+            except orjson.JSONDecodeError:
+                pass
         
         # Strategy 4: Return fallback response
         self.logger.warning(f"🔧 JSON parsing failed for {agent_name}, using fallback")
@@ -456,62 +562,320 @@ Thread Information:
             'status': 'failed'
         }
      
-    async def _execute_agent(self, prompt: str) -> str:
+    @staticmethod
+    def _estimate_tokens(prompt: str) -> int:
+        """Rough prompt token count (~4 characters per token) for TPM budgeting"""
+        return len(prompt) // 4 + 1
+    
+    async def _execute_agent(self, prompt: str, models_used: Optional[List[str]] = None,
+                             input_message: Optional[str] = None, max_tokens: Optional[int] = None) -> str:
         """
         Execute a single agent with OpenAI API
         
         Args:
-            prompt: Formatted prompt for the agent
+            prompt: Formatted prompt (agent instructions) for the agent
+            models_used: Optional list the model that produced the response is appended to
+            input_message: Optional tweet input sent as its own message ahead of the prompt
+            max_tokens: Completion budget for this call (default: self.max_tokens)
             
         Returns:
             Raw response from the agent
         """
+        cache_key = None
+        if self.response_cache:
+            # Keyed on the primary model so fallback answers are never served as primary ones
+            cache_key = self.response_cache.make_key(self.model, self._prompt_text(prompt, input_message))
+            # Sampled (temperature > 0) responses are only reused when explicitly allowed
+            if self.temperature == 0 or self.cache_sampled_responses:
+                cached = await self.response_cache.get_async(cache_key)
+                if cached is not None:
+                    if models_used is not None:
+                        models_used.append(self.model)
+                    return cached
+        
         try:
-            response = await self.openai_client.chat.completions.create(
-                model="gpt-4",
-                messages=[
-                    {"role": "system", "content": "You are a specialized AI agent for social media content analysis. Always respond with valid JSON format as specified in the prompt."},
-                    {"role": "user", "content": prompt}
-                ],
-                max_tokens=2000,
-                temperature=0.3
-            )
+            if self.bulkhead:
+                response, model = await self.bulkhead.submit(self._call_provider(prompt, input_message, max_tokens))
+            else:
+                response, model = await self._call_provider(prompt, input_message, max_tokens)
+        except Exception:
+            # Graceful degradation: a stale answer beats no answer during an outage
+            stale = await self.response_cache.get_async(cache_key, allow_expired=True) if cache_key else None
+            if stale is None:
+                raise
+            self.logger.warning("♻️ OpenAI call failed - serving cached response")
+            if models_used is not None:
+                models_used.append(self.model)
+            return stale
+        
+        if models_used is not None:
+            models_used.append(model)
+        if cache_key and model == self.model:
+            await self.response_cache.set_async(cache_key, response)
+        return response
+    
+    async def _call_provider(self, prompt: str, input_message: Optional[str] = None,
+                             max_tokens: Optional[int] = None) -> Tuple[str, str]:
+        """
+        Send the completion request down the model tiers until one succeeds
+        
+        A tier is skipped when it is rate-limited, overloaded or its circuit is open.
+        
+        Returns:
+            Tuple of (raw response, model that produced it)
+        """
+        last_error: Optional[Exception] = None
+        for model in self.model_tiers:
+            breaker = self.circuit_breakers.get(model)
+            try:
+                if breaker:
+                    return await breaker.call(self._request_completion, prompt, model, input_message, max_tokens), model
+                return await self._request_completion(prompt, model, input_message, max_tokens), model
+            except (RateLimitError, InternalServerError, CircuitOpenError) as e:
+                last_error = e
+                self.logger.warning(f"⬇️ {model} unavailable ({type(e).__name__}) - falling back to next model tier")
+        raise last_error
+    
+    async def _request_completion(self, prompt: str, model: str, input_message: Optional[str] = None,
+                                  max_tokens: Optional[int] = None) -> str:
+        """Send a single rate-limited chat completion request"""
+        try:
+            if self.rpm_limiter:
+                await self.rpm_limiter.acquire()
+            if self.tpm_limiter:
+                await self.tpm_limiter.acquire(
+                    self._estimate_tokens(self._prompt_text(prompt, input_message)) + (max_tokens or self.max_tokens)
+                )
+            
+            with self.latency_recorder.time("openai", "chat"):
+                async with asyncio.timeout(self.per_call_timeout):
+                    response = await self.openai_client.chat.completions.create(
+                        **self._completion_body(prompt, model, input_message, max_tokens)
+                    )
             
             return response.choices[0].message.content
         except Exception as e:
             self.logger.error(f"OpenAI API error: {str(e)}")
             raise
     
-    async def _execute_agent_with_metadata(self, agent_name: str, comprehensive_input: str, agent_responses: Dict[str, Any]) -> Dict[str, Any]:
+    @staticmethod
+    def _serialize_agent_responses(agent_responses: Dict[str, Any], members: List[str]) -> str:
+        """
+        Agent responses as one compact JSON object
+        
+        ``members`` holds the responses serialized by earlier calls for the
+        same tweet and is extended with the ones added since, so each
+        response is only serialized once.
+        """
+        for name, response in itertools.islice(agent_responses.items(), len(members), None):
+            members.append(f"{json.dumps(name)}:{json.dumps(response, separators=(',', ':'), default=str)}")
+        return "{" + ",".join(members) + "}"
+    
+    async def _execute_dependent_agent(self, agent_name: str, all_agent_responses: str, input_message: str,
+                                       models_used: Optional[List[str]] = None) -> Dict[str, Any]:
+        """
+        Execute a Phase 2 agent over the serialized agent responses
+        
+        Returns:
+            Dictionary with response data, execution time, status and error message
+        """
+        self.logger.info("🔍 Executing %s", agent_name)
+        start_time = time.perf_counter()
+        instructions = self._agent_instructions(agent_name).replace("{all_agent_responses}", all_agent_responses)
+        
+        try:
+            response = await asyncio.wait_for(
+                self._execute_agent(instructions, models_used, input_message, self.agent_max_tokens.get(agent_name)),
+                timeout=60  # 1 minute timeout per dependent agent
+            )
+        except asyncio.TimeoutError:
+            self.logger.error(f"⏰ {agent_name} timed out after 60 seconds")
+            return {
+                'response': {'error': 'timeout', 'agent_score': 5.0},
+                'execution_time': 60.0,
+                'status': AnalysisStatus.FAILED,
+                'error_message': "Agent execution timed out"
+            }
+        except Exception as e:
+            self.logger.error(f"❌ Error executing {agent_name}: {str(e)}")
+            return {
+                'response': {'error': str(e), 'agent_score': 5.0},
+                'execution_time': 0.0,
+                'status': AnalysisStatus.FAILED,
+                'error_message': str(e)
+            }
+        
+        execution_time = time.perf_counter() - start_time
+        self.logger.info("✅ %s completed in %.2fs", agent_name, execution_time)
+        return {
+            'response': self._parse_json_safe(response, agent_name),
+            'execution_time': execution_time,
+            'status': AnalysisStatus.SUCCESS,
+            'error_message': None
+        }
+    
+    async def _run_independent_agents(self, agent_names: List[str], input_message: str,
+                                      models_used: Optional[List[str]] = None, timeout: float = 300) -> List[Any]:
+        """
+        Run independent agents concurrently under one deadline
+        
+        Results come back in agent order, as with asyncio.gather(return_exceptions=True).
+        Unlike a gather under asyncio.timeout, agents that finished before the
+        deadline keep their results; only those still running are cancelled
+        and come back as asyncio.TimeoutError.
+        """
+        tasks = [
+            asyncio.create_task(self._execute_agent_with_metadata(agent_name, input_message, {}, models_used))
+            for agent_name in agent_names
+        ]
+        try:
+            done, pending = await asyncio.wait(tasks, timeout=timeout)
+        finally:
+            for task in tasks:
+                task.cancel()  # No-op for finished tasks
+        
+        if pending:
+            self.logger.error("⏰ %d parallel agents timed out after %.0fs", len(pending), timeout)
+        return [
+            (task.exception() or task.result()) if task in done else asyncio.TimeoutError("Agent execution timed out")
+            for task in tasks
+        ]
+    
+    async def _execute_agents_batched(self, agent_names: List[str], input_message: str,
+                                      models_used: Optional[List[str]] = None) -> Optional[List[Any]]:
+        """
+        Execute independent agents as one OpenAI Batch API job
+        
+        Agents with a usable cached response are not submitted. Results come
+        back in the same shape and order as ``_execute_agent_with_metadata``
+        under asyncio.gather; None means the batch failed as a whole and the
+        agents should be run as regular requests instead.
+        
+        Raises:
+            TimeoutError: If the batch did not finish within the batch timeout
+        """
+        start_time = time.perf_counter()
+        prompts = {
+            agent_name: self._agent_instructions(agent_name)
+            for agent_name in agent_names
+        }
+        
+        responses: Dict[str, Any] = {}
+        cache_keys: Dict[str, str] = {}
+        if self.response_cache:
+            for agent_name, prompt in prompts.items():
+                cache_keys[agent_name] = self.response_cache.make_key(self.model, self._prompt_text(prompt, input_message))
+            if self.temperature == 0 or self.cache_sampled_responses:
+                # One bulk lookup for the whole batch
+                cached = await self.response_cache.get_many_async(list(cache_keys.values()))
+                responses.update({agent_name: cached[key] for agent_name, key in cache_keys.items() if key in cached})
+        
+        pending = {agent_name: self._completion_body(prompt, self.model, input_message, self.agent_max_tokens.get(agent_name))
+                   for agent_name, prompt in prompts.items() if agent_name not in responses}
+        if pending:
+            try:
+                with self.latency_recorder.time("openai", "batch"):
+                    batch_responses = await self.batch_adapter.complete(pending)
+            except TimeoutError:
+                raise
+            except Exception as e:
+                self.logger.warning(f"📦 OpenAI batch failed ({str(e)}) - running agents as regular requests")
+                return None
+            
+            cache_writes = []
+            for agent_name, response in batch_responses.items():
+                responses[agent_name] = response
+                if isinstance(response, str) and agent_name in cache_keys:
+                    cache_writes.append((cache_keys[agent_name], response))
+            if cache_writes:
+                await self.response_cache.set_many_async(cache_writes)
+        
+        execution_time = time.perf_counter() - start_time
+        results = []
+        for agent_name in agent_names:
+            response = responses[agent_name]
+            if isinstance(response, Exception):
+                results.append(response)
+                continue
+            if models_used is not None:
+                models_used.append(self.model)
+            results.append({
+                'response': self._parse_json_safe(response, agent_name),
+                'execution_time': execution_time,
+                'status': 'success'
+            })
+        return results
+    
+    def _agent_instructions(self, agent_name: str) -> str:
+        """
+        Agent instructions with the template's brace escapes resolved, built once per agent
+        
+        Only the ``{all_agent_responses}`` placeholder of dependent agents is
+        left in, to be filled with str.replace instead of a str.format pass
+        over the whole template on every call.
+        """
+        instructions = self._instructions.get(agent_name)
+        if instructions is None:
+            instructions = self.prompts.get_agent_instructions(agent_name).format(
+                all_agent_responses="{all_agent_responses}"
+            )
+            self._instructions[agent_name] = instructions
+        return instructions
+    
+    @staticmethod
+    def _prompt_text(prompt: str, input_message: Optional[str] = None) -> str:
+        """Full user-side text of a call, for cache keys and token estimates"""
+        return f"{input_message}\n\n{prompt}" if input_message else prompt
+    
+    def _completion_body(self, prompt: str, model: str, input_message: Optional[str] = None,
+                         max_tokens: Optional[int] = None) -> Dict[str, Any]:
+        """
+        Chat completion request parameters shared by regular and batched agent calls
+        
+        Messages run from invariant to variable content: the static system
+        prompt, then the tweet input (the same for all agents of a tweet), then
+        the agent-specific prompt. The provider caches prompt prefixes
+        automatically, so the agents after the first one reuse the shared prefix.
+        """
+        messages = [{"role": "system", "content": SYSTEM_PROMPT}]
+        if input_message:
+            messages.append({"role": "user", "content": input_message})
+        messages.append({"role": "user", "content": prompt})
+        return {
+            'model': model,
+            'messages': messages,
+            'max_tokens': max_tokens or self.max_tokens,
+            'temperature': self.temperature
+        }
+    
+    async def _execute_agent_with_metadata(self, agent_name: str, input_message: str, agent_responses: Dict[str, Any],
+                                           models_used: Optional[List[str]] = None) -> Dict[str, Any]:
         """
         Execute a single agent with metadata tracking for parallel execution
         
         Args:
             agent_name: Name of the agent to execute
-            comprehensive_input: Prepared input for the agent
+            input_message: Tweet input message shared by all agents (AgentPrompts.get_input_message)
             agent_responses: Current agent responses (empty for independent agents)
+            models_used: Optional list collecting the model each agent call used
             
         Returns:
             Dictionary with response data and execution metadata
         """
-        start_time = datetime.now()
+        start_time = time.perf_counter()
         
         try:
-            # Get appropriate prompt for independent agents
-            prompt = getattr(self.prompts, f'get_{agent_name}_prompt')()
-            input_data = {'comprehensive_input': comprehensive_input}
-            
-            # Format prompt with input data
-            formatted_prompt = prompt.format(**input_data)
+            # Agent instructions follow the tweet input shared by all agents
+            instructions = self._agent_instructions(agent_name)
             
             # Execute agent with individual timeout
             response = await asyncio.wait_for(
-                self._execute_agent(formatted_prompt),
+                self._execute_agent(instructions, models_used, input_message, self.agent_max_tokens.get(agent_name)),
                 timeout=30  # 30 seconds timeout per agent
             )
             
             # Calculate execution time
-            execution_time = (datetime.now() - start_time).total_seconds()
+            execution_time = time.perf_counter() - start_time
             
             # Parse response
             parsed_response = self._parse_json_safe(response, agent_name)
@@ -523,7 +887,7 @@ Thread Information:
             }
             
         except asyncio.TimeoutError:
-            execution_time = (datetime.now() - start_time).total_seconds()
+            execution_time = time.perf_counter() - start_time
             self.logger.warning(f"⏰ {agent_name} timed out after 30 seconds")
             return {
                 'response': {'error': 'timeout', 'agent_score': 5.0},
@@ -531,7 +895,7 @@ Thread Information:
                 'status': 'timeout'
             }
         except Exception as e:
-            execution_time = (datetime.now() - start_time).total_seconds()
+            execution_time = time.perf_counter() - start_time
             self.logger.error(f"❌ {agent_name} failed: {str(e)}")
             return {
                 'response': {'error': str(e), 'agent_score': 5.0},
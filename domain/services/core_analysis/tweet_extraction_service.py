@@ -15,6 +15,7 @@ This service handles:
 Domain-Driven Design: Domain service for tweet data extraction.
 """
 
+import os
 import json
 import logging
 import asyncio
@@ -26,6 +27,8 @@ from pathlib import Path
 from ...entities.tweet import Tweet, UserMetadata, MediaAttachment, ThreadContext, ContentType
 from infrastructure.adapters.twitter_api_adapter import TwitterApiAdapter
 from infrastructure.repositories.file_repository import FileRepository
+from infrastructure.reliability.bulkhead import Bulkhead
+from infrastructure.monitoring.latency_metrics import LatencyRecorder
 
 
 @dataclass
@@ -39,6 +42,8 @@ class ExtractionConfig:
     enable_url_extraction: bool = True
     output_directory: str = "data/extracted_tweets"
     batch_size: int = 10
+    user_id_cache_file: str = "data/cache/user_ids.json"
+    user_id_cache_ttl_days: int = 30
 
 
 @dataclass
@@ -78,11 +83,15 @@ class TweetExtractionService:
     
     def __init__(self, 
                  twitter_adapter: TwitterApiAdapter,
-                 file_repository: FileRepository):
+                 file_repository: FileRepository,
+                 bulkhead: Optional[Bulkhead] = None,
+                 latency_recorder: Optional[LatencyRecorder] = None):
         """Initialize tweet extraction service"""
         self.logger = logging.getLogger(__name__)
         self.twitter_adapter = twitter_adapter
         self.file_repository = file_repository
+        self.bulkhead = bulkhead
+        self.latency_recorder = latency_recorder or LatencyRecorder()
         
         # Extraction statistics
         self.stats = {
@@ -94,12 +103,18 @@ class TweetExtractionService:
             'urls_extracted': 0
         }
     
-    async def extract_comprehensive_data(self, config: ExtractionConfig) -> ExtractionResult:
+    async def extract_comprehensive_data(self, 
+                                         config: ExtractionConfig,
+                                         batch_queue: Optional[asyncio.Queue] = None) -> ExtractionResult:
         """
         Main extraction method - performs comprehensive tweet data extraction
         
         Args:
             config: Extraction configuration parameters
+            batch_queue: Optional queue receiving enhanced tweets in batches of
+                ``config.batch_size`` as soon as they are extracted, so analysis
+                can start before extraction finishes. The caller is responsible
+                for signalling the end of the stream.
             
         Returns:
             ExtractionResult with extraction details and file paths
@@ -112,18 +127,17 @@ class TweetExtractionService:
         
         # Create output directory
         output_dir = Path(config.output_directory) / extraction_id
-        output_dir.mkdir(parents=True, exist_ok=True)
+        await asyncio.to_thread(output_dir.mkdir, parents=True, exist_ok=True)
         
         try:
-            # Phase 1: Extract raw tweets from Twitter API
-            raw_tweets, extraction_stats = await self._extract_raw_tweets(config)
+            # Phase 1 + 2: Extract raw tweets account by account, enhance them
+            # with metadata, threads, media and stream them to disk as they arrive
+            tweets_file = output_dir / 'extracted_tweets.jsonl'
+            tweet_count, extraction_stats = await self._extract_raw_tweets(config, batch_queue, tweets_file)
             
-            # Phase 2: Enhance tweets with metadata, threads, media
-            enhanced_tweets = self._enhance_tweets_data(raw_tweets, config)
-            
-            # Phase 3: Save extraction results
-            tweets_file, metadata_file = self._save_extraction_data(
-                enhanced_tweets, extraction_stats, output_dir, extraction_id
+            # Phase 3: Save extraction metadata
+            metadata_file = await self._save_extraction_metadata(
+                tweet_count, extraction_stats, output_dir, extraction_id
             )
             
             # Calculate processing time
@@ -133,7 +147,7 @@ class TweetExtractionService:
             result = ExtractionResult(
                 extraction_id=extraction_id,
                 timestamp=start_time,
-                total_tweets_extracted=len(enhanced_tweets),
+                total_tweets_extracted=tweet_count,
                 successful_accounts=extraction_stats['successful_accounts'],
                 failed_accounts=extraction_stats['failed_accounts'],
                 accounts_processed=extraction_stats['accounts_processed'],
@@ -142,11 +156,11 @@ class TweetExtractionService:
                 metadata_file_path=str(metadata_file),
                 extraction_config=config,
                 processing_time=processing_time,
-                status='success' if len(enhanced_tweets) > 0 else 'failed',
+                status='success' if tweet_count > 0 else 'failed',
                 error_details=extraction_stats.get('errors', [])
             )
             
-            self.logger.info(f"✅ Extraction completed: {len(enhanced_tweets)} tweets extracted")
+            self.logger.info(f"✅ Extraction completed: {tweet_count} tweets extracted")
             self.logger.info(f"📁 Data saved to: {tweets_file}")
             
             return result
@@ -173,8 +187,19 @@ class TweetExtractionService:
                 error_details=[error_msg]
             )
     
-    async def _extract_raw_tweets(self, config: ExtractionConfig) -> Tuple[List[Dict], Dict]:
-        """Extract raw tweets from Twitter API"""
+    async def _extract_raw_tweets(self, 
+                                  config: ExtractionConfig,
+                                  batch_queue: Optional[asyncio.Queue] = None,
+                                  tweets_file: Optional[Path] = None) -> Tuple[int, Dict]:
+        """
+        Extract raw tweets from Twitter API and enhance them per account
+        
+        Enhanced tweets are appended to ``tweets_file`` (JSONL, one tweet per
+        line) as each account completes instead of being held in memory.
+        
+        Returns:
+            Tuple of (number of tweets extracted, extraction statistics)
+        """
         self.logger.info("📡 Phase 1: Extracting raw tweets from Twitter API...")
         
         extraction_stats = {
@@ -185,19 +210,51 @@ class TweetExtractionService:
             'errors': []
         }
         
+        tweet_count = 0
+        pending_batch = []
+        tweets_log = await asyncio.to_thread(open, tweets_file, 'ab') if tweets_file else None
+        
         try:
-            # Use existing Twitter adapter for extraction
-            tweets = self.twitter_adapter.extract_tweets_from_accounts(
+            user_ids = await self._resolve_user_ids(config)
+            
+            # The adapter is blocking (tweepy), so each account is fetched in a worker
+            # thread to keep the event loop free for concurrent analysis; with a
+            # bulkhead the thread comes from Twitter's own pool
+            account_iterator = self.twitter_adapter.iter_account_tweets(
                 account_usernames=config.accounts_list,
                 max_tweets=config.max_tweets,
-                hours_back=config.hours_back
+                hours_back=config.hours_back,
+                user_ids=user_ids
             )
             
+            while True:
+                with self.latency_recorder.time("twitter", "account_timeline"):
+                    account_result = await self._run_blocking(next, account_iterator, None)
+                if account_result is None:
+                    break
+                
+                _, account_tweets = account_result
+                
+                # Phase 2: Enhance tweets with metadata, threads, media
+                enhanced = self._enhance_tweets_data(account_tweets, config)
+                
+                if tweets_log and enhanced:
+                    # One write + flush per account, off the event loop
+                    chunk = b"".join(tweet.to_json_bytes() + b"\n" for tweet in enhanced)
+                    await asyncio.to_thread(self._append_chunk, tweets_log, chunk)
+                tweet_count += len(enhanced)
+                
+                if batch_queue is not None:
+                    pending_batch.extend(enhanced)
+                    while len(pending_batch) >= config.batch_size:
+                        await batch_queue.put(pending_batch[:config.batch_size])
+                        pending_batch = pending_batch[config.batch_size:]
+            
             extraction_stats['successful_accounts'] = len(config.accounts_list)
             extraction_stats['accounts_processed'] = config.accounts_list.copy()
             
-            self.logger.info(f"📊 Raw tweets extracted: {len(tweets)}")
-            return tweets, extraction_stats
+            self.logger.info(f"📊 Raw tweets extracted: {tweet_count}")
+            self.logger.info(f"✅ Enhanced {tweet_count} tweets with comprehensive metadata")
             
         except Exception as e:
             error_msg = f"Twitter API extraction failed: {str(e)}"
@@ -206,11 +263,93 @@ class TweetExtractionService:
             extraction_stats['accounts_failed'] = config.accounts_list.copy()
             
             self.logger.error(f"❌ {error_msg}")
-            return [], extraction_stats
+        
+        finally:
+            if tweets_log:
+                await asyncio.to_thread(tweets_log.close)
+        
+        # Flush the last partial batch so every extracted tweet reaches analysis
+        if batch_queue is not None and pending_batch:
+            await batch_queue.put(pending_batch)
+        
+        return tweet_count, extraction_stats
+    
+    @staticmethod
+    def _append_chunk(tweets_log, chunk: bytes):
+        """Append a block of JSONL lines and flush it to the OS"""
+        tweets_log.write(chunk)
+        tweets_log.flush()
+    
+    async def _run_blocking(self, func, *args):
+        """Run a blocking adapter call off the event loop"""
+        if self.bulkhead:
+            return await self.bulkhead.run_sync(func, *args)
+        return await asyncio.to_thread(func, *args)
+    
+    async def _resolve_user_ids(self, config: ExtractionConfig) -> Dict[str, str]:
+        """Resolve account usernames to user IDs, looking up only those missing from the cache"""
+        # Cache file I/O runs in a worker thread: analysis shares this event loop
+        cache = await asyncio.to_thread(self._load_user_id_cache, config)
+        user_ids = {username: entry['id'] for username, entry in cache.items()}
+        uncached = [username for username in config.accounts_list if username.lower() not in user_ids]
+        
+        self.logger.info(f"🗂️ User ID cache: {len(config.accounts_list) - len(uncached)} cached, {len(uncached)} to look up")
+        
+        if uncached:
+            try:
+                with self.latency_recorder.time("twitter", "users_lookup"):
+                    resolved = await self._run_blocking(self.twitter_adapter.resolve_user_ids, uncached)
+                resolved_at = datetime.now().isoformat()
+                for username, user_id in resolved.items():
+                    cache[username] = {'id': user_id, 'resolved_at': resolved_at}
+                    user_ids[username] = user_id
+                await asyncio.to_thread(self._save_user_id_cache, cache, config)
+            except Exception as e:
+                # Unresolved accounts fall back to per-account lookups during extraction
+                self.logger.warning(f"⚠️ Bulk user ID lookup failed: {str(e)}")
+        
+        return user_ids
+    
+    def _load_user_id_cache(self, config: ExtractionConfig) -> Dict[str, Dict[str, str]]:
+        """Load non-expired username -> {id, resolved_at} entries from the cache file"""
+        cache_file = Path(config.user_id_cache_file)
+        if not cache_file.exists():
+            return {}
+        
+        try:
+            with open(cache_file, 'r', encoding='utf-8') as f:
+                cache = json.load(f)
+        except Exception as e:
+            self.logger.warning(f"⚠️ Ignoring unreadable user ID cache {cache_file}: {str(e)}")
+            return {}
+        
+        if not isinstance(cache, dict):
+            self.logger.warning(f"⚠️ Ignoring malformed user ID cache {cache_file}")
+            return {}
+        
+        oldest = datetime.now() - timedelta(days=config.user_id_cache_ttl_days)
+        valid = {}
+        for username, entry in cache.items():
+            try:
+                if datetime.fromisoformat(entry['resolved_at']) >= oldest:
+                    valid[username] = {'id': str(entry['id']), 'resolved_at': entry['resolved_at']}
+            except Exception as e:
+                # A bad entry is looked up again instead of failing every extraction
+                self.logger.warning(f"⚠️ Dropping malformed user ID cache entry '{username}': {str(e)}")
+        return valid
+    
+    def _save_user_id_cache(self, cache: Dict[str, Dict[str, str]], config: ExtractionConfig):
+        """Write the user ID cache atomically (temp file + rename)"""
+        cache_file = Path(config.user_id_cache_file)
+        cache_file.parent.mkdir(parents=True, exist_ok=True)
+        tmp_file = cache_file.with_suffix(cache_file.suffix + '.tmp')
+        with open(tmp_file, 'w', encoding='utf-8') as f:
+            json.dump(cache, f, indent=2, ensure_ascii=False)
+        os.replace(tmp_file, cache_file)
     
     def _enhance_tweets_data(self, raw_tweets: List[Dict], config: ExtractionConfig) -> List[Tweet]:
         """Enhance raw tweets with comprehensive metadata"""
-        self.logger.info("🔍 Phase 2: Enhancing tweets with comprehensive metadata...")
+        self.logger.debug(f"🔍 Phase 2: Enhancing {len(raw_tweets)} tweets with comprehensive metadata...")
         
         enhanced_tweets = []
         
@@ -237,7 +376,6 @@ class TweetExtractionService:
                 self.logger.warning(f"⚠️ Failed to enhance tweet {getattr(tweet, 'tweet_id', 'unknown')}: {str(e)}")
                 continue
         
-        self.logger.info(f"✅ Enhanced {len(enhanced_tweets)} tweets with comprehensive metadata")
         return enhanced_tweets
     
     def _extract_thread_context(self, tweet: Tweet):
@@ -310,27 +448,24 @@ class TweetExtractionService:
         except Exception as e:
             self.logger.warning(f"⚠️ URL extraction failed for tweet {tweet.tweet_id}: {str(e)}")
     
-    def _save_extraction_data(self, 
-                                  tweets: List[Tweet], 
+    async def _save_extraction_metadata(self, 
+                                  tweet_count: int, 
                                   stats: Dict, 
                                   output_dir: Path,
-                                  extraction_id: str) -> Tuple[Path, Path]:
-        """Save extraction data to files"""
-        self.logger.info("💾 Phase 3: Saving extraction data...")
-        
-        # Convert tweets to dictionaries for JSON serialization
-        tweets_data = [tweet.to_dict() for tweet in tweets]
+                                  extraction_id: str) -> Path:
+        """Save extraction metadata (tweets were already streamed to disk)"""
+        self.logger.info("💾 Phase 3: Saving extraction metadata...")
         
         # Create comprehensive metadata
         metadata = {
             'extraction_id': extraction_id,
             'timestamp': datetime.now().isoformat(),
-            'total_tweets': len(tweets),
+            'total_tweets': tweet_count,
             'extraction_stats': stats,
-            'processing_stats': self.stats,
+            'processing_stats': dict(self.stats),
             'data_structure': {
-                'tweets_file': 'extracted_tweets.json',
-                'format': 'JSON array of Tweet entities',
+                'tweets_file': 'extracted_tweets.jsonl',
+                'format': 'JSON Lines, one Tweet entity per line',
                 'fields_included': [
                     'id', 'text', 'created_at', 'author_id', 'user_metadata',
                     'thread_context', 'media_attachments', 'extracted_urls',
@@ -339,23 +474,19 @@ class TweetExtractionService:
             }
         }
         
-        # Save files
-        tweets_file = output_dir / 'extracted_tweets.json'
+        # Save metadata (in a worker thread, like the tweets file)
         metadata_file = output_dir / 'extraction_metadata.json'
+        await asyncio.to_thread(self._write_metadata_file, metadata_file, metadata)
         
-        # Save tweets data
-        with open(tweets_file, 'w', encoding='utf-8') as f:
-            json.dump(tweets_data, f, indent=2, ensure_ascii=False, default=str)
+        self.logger.info(f"💾 Extraction metadata saved: {metadata_file}")
         
-        # Save metadata
+        return metadata_file
+    
+    @staticmethod
+    def _write_metadata_file(metadata_file: Path, metadata: Dict):
+        """Write the extraction metadata as indented JSON"""
         with open(metadata_file, 'w', encoding='utf-8') as f:
             json.dump(metadata, f, indent=2, ensure_ascii=False, default=str)
-        
-        self.logger.info(f"💾 Extraction data saved:")
-        self.logger.info(f"   📄 Tweets: {tweets_file}")
-        self.logger.info(f"   📋 Metadata: {metadata_file}")
-        
-        return tweets_file, metadata_file
     
     def get_extraction_stats(self) -> Dict:
         """Get current extraction statistics"""
@@ -5,10 +5,13 @@ Servicios de gestión de memoria persistente para agentes.
 
 Módulos:
 - MemoryNamespaceManager: Gestor de namespaces de memoria para diferentes agentes
+- NamespacedMemoryStore: Almacén de memoria con un diccionario por namespace
 """
 
 from .memory_namespace_manager import MemoryNamespaceManager
+from .namespaced_memory_store import NamespacedMemoryStore
 
 __all__ = [
-    'MemoryNamespaceManager'
+    'MemoryNamespaceManager',
+    'NamespacedMemoryStore'
 ]
\ No newline at end of file
@@ -15,14 +15,73 @@ This manager provides a structured way to handle persistent memory for:
 Domain-Driven Design: Domain service for memory management.
 """
 
-import json
+import heapq
 import logging
-from typing import Dict, Any, List, Optional, Set
+from collections import Counter
+from contextlib import contextmanager
+from operator import itemgetter
+from typing import Dict, Any, Callable, Iterator, List, Optional, Set, Tuple
 from datetime import datetime, timedelta
 from dataclasses import dataclass, asdict
 
+try:
+    import numpy as np
+    from numba import njit
+except ImportError:  # Optional: compiled scans of large namespaces
+    njit = None
 
-@dataclass
+from ...entities.tweet import parse_iso_datetime
+from .namespaced_memory_store import NamespacedMemoryStore
+
+
+if njit is not None:
+    @njit
+    def _select_trending(last_seen, velocities, cutoff, min_velocity):
+        """Indices of entries seen after ``cutoff`` with velocity >= ``min_velocity``"""
+        selected = np.empty(len(last_seen), dtype=np.int64)
+        count = 0
+        for i in range(len(last_seen)):
+            if last_seen[i] > cutoff and velocities[i] >= min_velocity:
+                selected[count] = i
+                count += 1
+        return selected[:count]
+    
+    @njit
+    def _select_sloppers(counts, avg_slops, min_count, threshold):
+        """Indices of entries with count >= ``min_count`` and avg_slop >= ``threshold``"""
+        selected = np.empty(len(counts), dtype=np.int64)
+        selected_count = 0
+        for i in range(len(counts)):
+            if counts[i] >= min_count and avg_slops[i] >= threshold:
+                selected[selected_count] = i
+                selected_count += 1
+        return selected[:selected_count]
+
+
+def _number_column(field: str) -> Callable[[Dict[str, Any]], float]:
+    """Entry -> float of a numeric field (missing: 0, not a number: NaN, which never matches)"""
+    def column(data: Dict[str, Any]) -> float:
+        try:
+            return float(data.get(field, 0))
+        except (TypeError, ValueError):
+            return float('nan')
+    return column
+
+
+def _epoch_column(field: str) -> Callable[[Dict[str, Any]], float]:
+    """Entry -> POSIX time of an ISO timestamp field (missing or invalid: -inf, which never matches)"""
+    def column(data: Dict[str, Any]) -> float:
+        value = data.get(field)
+        if not isinstance(value, str):
+            return float('-inf')
+        try:
+            return parse_iso_datetime(value).timestamp()
+        except (TypeError, ValueError, OverflowError, OSError):
+            return float('-inf')
+    return column
+
+
+@dataclass(slots=True)
 class MemoryStats:
     """Statistics about memory usage"""
     total_entries: int
@@ -47,11 +106,27 @@ class MemoryNamespaceManager:
     - visual_table_trace:<hash> - Image analysis cache (for future Visual Chart Translator)
     """
     
+    # Namespaces this large are scanned by the numba kernels (when numba is installed)
+    COMPILED_SCAN_MIN_ENTRIES = 10_000
+    
     def __init__(self, memory_store: Dict[str, Any]):
-        """Initialize memory namespace manager"""
+        """
+        Initialize memory namespace manager
+        
+        Pass a NamespacedMemoryStore to share the store with the agents; a plain
+        dict is copied into a new one.
+        """
         self.logger = logging.getLogger(__name__)
+        if not isinstance(memory_store, NamespacedMemoryStore):
+            memory_store = NamespacedMemoryStore(memory_store)
         self.memory_store = memory_store
         
+        # Timestamp shared by every update inside a batch() block
+        self._batch_now_iso: Optional[str] = None
+        
+        # Numeric columns of large namespaces for the compiled scans, with the store version they reflect
+        self._scan_columns_cache: Dict[str, Tuple[int, Tuple[List[str], List[Dict[str, Any]], List[Any]]]] = {}
+        
         # Define namespace schemas for validation
         self.namespace_schemas = {
             'sarcasm_vector': {
@@ -80,20 +155,84 @@ class MemoryNamespaceManager:
                 'optional_fields': ['extracted_at', 'image_hash', 'source_url']
             }
         }
+        
+        # Required fields and the allowed field set of each schema, built once for validation
+        self._schemas: Dict[str, Tuple[Tuple[str, ...], frozenset]] = {
+            namespace: (tuple(schema['required_fields']),
+                        frozenset(schema['required_fields']) | frozenset(schema['optional_fields']))
+            for namespace, schema in self.namespace_schemas.items()
+        }
+    
+    @contextmanager
+    def batch(self):
+        """
+        Share one "now" timestamp across all updates made inside the block
+        
+        Usage:
+            with manager.batch():
+                for tweet in tweets:
+                    manager.update_author_slop_profile(...)
+        """
+        if self._batch_now_iso is not None:
+            yield self  # nested: keep the outer batch's timestamp
+            return
+        
+        self._batch_now_iso = datetime.now().isoformat()
+        try:
+            yield self
+        finally:
+            self._batch_now_iso = None
+    
+    def _now_iso(self, now_iso: Optional[str] = None) -> str:
+        """Timestamp for an update: explicit value, then the batch's, then the current time"""
+        return now_iso or self._batch_now_iso or datetime.now().isoformat()
+    
+    def _use_compiled_scan(self, namespace: str) -> bool:
+        """Whether a namespace is large enough for the numba scan path (and numba is available)"""
+        return njit is not None and len(self.memory_store.namespace(namespace)) >= self.COMPILED_SCAN_MIN_ENTRIES
+    
+    def _scan_columns(self, namespace: str,
+                      columns: Tuple[Callable[[Dict[str, Any]], float], ...]) -> Tuple[List[str], List[Dict[str, Any]], List[Any]]:
+        """
+        Subkeys, entries and float64 column arrays of a namespace for the numba scans
+        
+        Rebuilt only when the namespace was written since the last build.
+        """
+        version = self.memory_store.version(namespace)
+        cached = self._scan_columns_cache.get(namespace)
+        if cached is not None and cached[0] == version:
+            return cached[1]
+        
+        entries = self.memory_store.namespace(namespace)
+        subkeys = list(entries)
+        values = list(entries.values())
+        arrays = [np.fromiter(map(column, values), dtype=np.float64, count=len(values)) for column in columns]
+        
+        self._scan_columns_cache[namespace] = (version, (subkeys, values, arrays))
+        return subkeys, values, arrays
+    
+    @staticmethod
+    def _largest(items: Iterator[Dict[str, Any]], key, top_n: Optional[int]) -> List[Dict[str, Any]]:
+        """Items sorted by ``key``, descending; only the first ``top_n`` (heap-selected) if given"""
+        if top_n is None:
+            return sorted(items, key=key, reverse=True)
+        return heapq.nlargest(top_n, items, key=key)
     
     # Sarcasm Vector Methods
     def get_author_sarcasm_profile(self, author_handle: str) -> Dict[str, Any]:
         """Get author's sarcasm profile"""
-        key = f"sarcasm_vector:{author_handle}"
-        return self.memory_store.get(key, {
+        profile = self.memory_store.namespace('sarcasm_vector').get(author_handle)
+        if profile is not None:
+            return profile
+        return {
             'total_tweets': 0,
             'sarcastic_tweets': 0,
             'sarcasm_rate': 0.0,
-            'last_updated': datetime.now().isoformat()
-        })
+            'last_updated': self._now_iso()
+        }
     
     def update_author_sarcasm_profile(self, author_handle: str, is_sarcastic: bool, 
-                                    confidence: float = None):
+                                    confidence: float = None, now_iso: Optional[str] = None):
         """Update author's sarcasm profile"""
         profile = self.get_author_sarcasm_profile(author_handle)
         
@@ -102,35 +241,32 @@ class MemoryNamespaceManager:
             profile['sarcastic_tweets'] += 1
         
         profile['sarcasm_rate'] = profile['sarcastic_tweets'] / profile['total_tweets']
-        profile['last_updated'] = datetime.now().isoformat()
+        profile['last_updated'] = self._now_iso(now_iso)
         
         if confidence is not None:
-            if 'confidence_history' not in profile:
-                profile['confidence_history'] = []
-            profile['confidence_history'].append(confidence)
-            # Keep only last 20 confidence scores
-            profile['confidence_history'] = profile['confidence_history'][-20:]
+            history = profile.setdefault('confidence_history', [])
+            history.append(confidence)
+            # Keep only last 20 confidence scores (trimmed in place, no list copy)
+            if len(history) > 20:
+                del history[:-20]
         
-        key = f"sarcasm_vector:{author_handle}"
-        self.memory_store[key] = profile
+        self.memory_store.put('sarcasm_vector', author_handle, profile)
         
         self.logger.debug(f"Updated sarcasm profile for {author_handle}: rate={profile['sarcasm_rate']:.3f}")
     
     # Echo Map Methods
     def get_topic_echo_history(self, topic: str) -> Dict[str, Any]:
         """Get echo history for a topic"""
-        key = f"echo_map:{topic}"
-        return self.memory_store.get(key, {})
+        return self.memory_store.namespace('echo_map').get(topic, {})
     
     def update_topic_echo_metrics(self, topic: str, reddit_threads: int, 
                                 farcaster_refs: int, discord_refs: int, 
-                                echo_velocity: float):
+                                echo_velocity: float, now_iso: Optional[str] = None):
         """Update echo metrics for a topic"""
-        key = f"echo_map:{topic}"
-        prev_data = self.memory_store.get(key, {})
+        prev_data = self.get_topic_echo_history(topic)
         
         new_data = {
-            'last_seen': datetime.now().isoformat(),
+            'last_seen': self._now_iso(now_iso),
             'reddit_threads': reddit_threads,
             'farcaster_refs': farcaster_refs,
             'discord_refs': discord_refs,
@@ -143,142 +279,155 @@ class MemoryNamespaceManager:
             new_data['previous_velocity'] = prev_data['echo_velocity']
             new_data['velocity_change'] = echo_velocity - prev_data['echo_velocity']
         
-        self.memory_store[key] = new_data
+        self.memory_store.put('echo_map', topic, new_data)
         
         self.logger.debug(f"Updated echo metrics for '{topic}': velocity={echo_velocity:.2f}")
     
-    def get_trending_topics(self, hours: int = 24, min_velocity: float = 0.5) -> List[Dict[str, Any]]:
-        """Get topics that are trending based on recent echo velocity"""
-        trending = []
-        cutoff_time = datetime.now() - timedelta(hours=hours)
+    def get_trending_topics(self, hours: int = 24, min_velocity: float = 0.5,
+                            top_n: Optional[int] = None) -> List[Dict[str, Any]]:
+        """Get topics that are trending based on recent echo velocity (the ``top_n`` fastest, if given)"""
+        cutoff = datetime.now() - timedelta(hours=hours)
+        # Stored timestamps are naive isoformat() strings, which sort chronologically as text
+        cutoff_iso = cutoff.isoformat()
+        
+        def _row(topic: str, data: Dict[str, Any]) -> Dict[str, Any]:
+            return {
+                'topic': topic,
+                'echo_velocity': data['echo_velocity'],
+                'total_mentions': data.get('total_mentions', 0),
+                'last_seen': data['last_seen'],
+                'velocity_change': data.get('velocity_change', 0)
+            }
         
-        for key, data in self.memory_store.items():
-            if key.startswith('echo_map:'):
-                topic = key.replace('echo_map:', '')
+        def _trending() -> Iterator[Dict[str, Any]]:
+            if self._use_compiled_scan('echo_map'):
+                topics, entries, (last_seen, velocities) = self._scan_columns(
+                    'echo_map', (_epoch_column('last_seen'), _number_column('echo_velocity')))
+                for i in _select_trending(last_seen, velocities, cutoff.timestamp(), float(min_velocity)):
+                    yield _row(topics[i], entries[i])
+                return
+            
+            for topic, data in self.memory_store.namespace('echo_map').items():
                 last_seen_str = data.get('last_seen')
                 
-                if last_seen_str:
-                    try:
-                        last_seen = datetime.fromisoformat(last_seen_str)
-                        if (last_seen > cutoff_time and 
-                            data.get('echo_velocity', 0) >= min_velocity):
-                            trending.append({
-                                'topic': topic,
-                                'echo_velocity': data['echo_velocity'],
-                                'total_mentions': data.get('total_mentions', 0),
-                                'last_seen': last_seen_str,
-                                'velocity_change': data.get('velocity_change', 0)
-                            })
-                    except ValueError:
-                        continue
+                if (isinstance(last_seen_str, str) and last_seen_str > cutoff_iso and 
+                    data.get('echo_velocity', 0) >= min_velocity):
+                    yield _row(topic, data)
         
         # Sort by echo velocity
-        trending.sort(key=lambda x: x['echo_velocity'], reverse=True)
-        return trending
+        return self._largest(_trending(), itemgetter('echo_velocity'), top_n)
     
     # Slop Fingerprint Methods
     def get_author_slop_profile(self, author_handle: str) -> Dict[str, Any]:
         """Get author's content quality profile"""
-        key = f"slop_fingerprint:{author_handle}"
-        return self.memory_store.get(key, {
+        profile = self.memory_store.namespace('slop_fingerprint').get(author_handle)
+        if profile is not None:
+            return profile
+        return {
             'count': 0,
             'avg_slop': 0.0,
             'total_slop': 0.0,
             'last_scores': [],
-            'last_updated': datetime.now().isoformat()
-        })
+            'last_updated': self._now_iso()
+        }
     
-    def update_author_slop_profile(self, author_handle: str, slop_score: float):
+    def update_author_slop_profile(self, author_handle: str, slop_score: float,
+                                 now_iso: Optional[str] = None):
         """Update author's content quality profile"""
         profile = self.get_author_slop_profile(author_handle)
         
         profile['count'] += 1
         profile['total_slop'] += slop_score
         profile['avg_slop'] = profile['total_slop'] / profile['count']
-        profile['last_updated'] = datetime.now().isoformat()
+        profile['last_updated'] = self._now_iso(now_iso)
         
-        # Keep last 10 scores for trend analysis
-        profile['last_scores'].append(slop_score)
-        if len(profile['last_scores']) > 10:
-            profile['last_scores'] = profile['last_scores'][-10:]
+        # Keep last 10 scores for trend analysis (trimmed in place, no list copy)
+        last_scores = profile['last_scores']
+        last_scores.append(slop_score)
+        if len(last_scores) > 10:
+            del last_scores[:-10]
         
-        key = f"slop_fingerprint:{author_handle}"
-        self.memory_store[key] = profile
+        self.memory_store.put('slop_fingerprint', author_handle, profile)
         
         self.logger.debug(f"Updated slop profile for {author_handle}: avg={profile['avg_slop']:.3f}")
     
-    def get_chronic_sloppers(self, threshold: float = 0.7, min_count: int = 5) -> List[Dict[str, Any]]:
-        """Get authors who consistently produce low-quality content"""
-        chronic_sloppers = []
+    def get_chronic_sloppers(self, threshold: float = 0.7, min_count: int = 5,
+                             top_n: Optional[int] = None) -> List[Dict[str, Any]]:
+        """Get authors who consistently produce low-quality content (the ``top_n`` worst, if given)"""
+        def _row(author: str, data: Dict[str, Any]) -> Dict[str, Any]:
+            return {
+                'author': author,
+                'avg_slop': data['avg_slop'],
+                'tweet_count': data['count'],
+                'recent_trend': data.get('last_scores', [])[-3:] if data.get('last_scores') else []
+            }
         
-        for key, data in self.memory_store.items():
-            if key.startswith('slop_fingerprint:'):
-                author = key.replace('slop_fingerprint:', '')
-                
+        def _sloppers() -> Iterator[Dict[str, Any]]:
+            if self._use_compiled_scan('slop_fingerprint'):
+                authors, entries, (counts, avg_slops) = self._scan_columns(
+                    'slop_fingerprint', (_number_column('count'), _number_column('avg_slop')))
+                for i in _select_sloppers(counts, avg_slops, float(min_count), float(threshold)):
+                    yield _row(authors[i], entries[i])
+                return
+            
+            for author, data in self.memory_store.namespace('slop_fingerprint').items():
                 if (data.get('count', 0) >= min_count and 
                     data.get('avg_slop', 0) >= threshold):
-                    chronic_sloppers.append({
-                        'author': author,
-                        'avg_slop': data['avg_slop'],
-                        'tweet_count': data['count'],
-                        'recent_trend': data.get('last_scores', [])[-3:] if data.get('last_scores') else []
-                    })
+                    yield _row(author, data)
         
         # Sort by average slop score
-        chronic_sloppers.sort(key=lambda x: x['avg_slop'], reverse=True)
-        return chronic_sloppers
+        return self._largest(_sloppers(), itemgetter('avg_slop'), top_n)
     
     # Banned Terms Methods
     def get_author_ban_stats(self, author_handle: str) -> Dict[str, Any]:
         """Get author's banned phrase violation statistics"""
-        key = f"ban_term_stats:{author_handle}"
-        return self.memory_store.get(key, {
+        stats = self.memory_store.namespace('ban_term_stats').get(author_handle)
+        if stats is not None:
+            return stats
+        return {
             'count': 0,
             'total_weight': 0.0,
             'violations': {},
             'avg_weight': 0.0,
-            'last_updated': datetime.now().isoformat()
-        })
+            'last_updated': self._now_iso()
+        }
     
     def update_author_ban_stats(self, author_handle: str, banned_terms: List[str], 
-                              total_weight: float):
+                              total_weight: float, now_iso: Optional[str] = None):
         """Update author's banned phrase statistics"""
         stats = self.get_author_ban_stats(author_handle)
         
         stats['count'] += 1
         stats['total_weight'] += total_weight
         stats['avg_weight'] = stats['total_weight'] / stats['count']
-        stats['last_updated'] = datetime.now().isoformat()
+        stats['last_updated'] = self._now_iso(now_iso)
         
         # Track specific violations
         for term in banned_terms:
             clean_term = term.lower().strip()
             stats['violations'][clean_term] = stats['violations'].get(clean_term, 0) + 1
         
-        key = f"ban_term_stats:{author_handle}"
-        self.memory_store[key] = stats
+        self.memory_store.put('ban_term_stats', author_handle, stats)
         
         self.logger.debug(f"Updated ban stats for {author_handle}: avg_weight={stats['avg_weight']:.2f}")
     
     def get_most_violated_terms(self, top_n: int = 10) -> List[Dict[str, Any]]:
         """Get the most commonly violated banned terms"""
-        term_counts = {}
+        term_counts = Counter()
         
-        for key, data in self.memory_store.items():
-            if key.startswith('ban_term_stats:'):
-                violations = data.get('violations', {})
-                for term, count in violations.items():
-                    term_counts[term] = term_counts.get(term, 0) + count
-        
-        # Sort and return top N
-        sorted_terms = sorted(term_counts.items(), key=lambda x: x[1], reverse=True)
-        return [{'term': term, 'violation_count': count} for term, count in sorted_terms[:top_n]]
+        for stats in self.memory_store.namespace('ban_term_stats').values():
+            term_counts.update(stats.get('violations', {}))
+        
+        # most_common(n) heap-selects the top N without sorting every term
+        return [{'term': term, 'violation_count': count} for term, count in term_counts.most_common(top_n)]
     
     # Latency Flags Methods
     def store_latency_flag(self, asset: str, tweet_text: str, tweet_time: datetime,
-                          price_change_pct: float, delta_seconds: int):
+                          price_change_pct: float, delta_seconds: int, now_iso: Optional[str] = None):
         """Store a latency flag event"""
-        key = f"latency_flags:{tweet_time.strftime('%Y%m%d_%H%M%S')}"
+        # Same as strftime('%Y%m%d_%H%M%S'), without the locale-aware C formatting
+        t = tweet_time
+        flag_id = f"{t.year:04d}{t.month:02d}{t.day:02d}_{t.hour:02d}{t.minute:02d}{t.second:02d}"
         
         flag_data = {
             'asset': asset,
@@ -286,28 +435,22 @@ class MemoryNamespaceManager:
             'tweet_time': tweet_time.isoformat(),
             'price_change_pct': price_change_pct,
             'delta_seconds': delta_seconds,
-            'flagged_at': datetime.now().isoformat()
+            'flagged_at': self._now_iso(now_iso)
         }
         
-        self.memory_store[key] = flag_data
+        self.memory_store.put('latency_flags', flag_id, flag_data)
         
         self.logger.info(f"Stored latency flag: {asset} moved {price_change_pct:.2f}% {delta_seconds}s before tweet")
     
     def get_recent_latency_flags(self, hours: int = 24) -> List[Dict[str, Any]]:
         """Get recent latency flag events"""
-        cutoff_time = datetime.now() - timedelta(hours=hours)
+        cutoff_iso = (datetime.now() - timedelta(hours=hours)).isoformat()
         flags = []
         
-        for key, data in self.memory_store.items():
-            if key.startswith('latency_flags:'):
-                flagged_at_str = data.get('flagged_at')
-                if flagged_at_str:
-                    try:
-                        flagged_at = datetime.fromisoformat(flagged_at_str)
-                        if flagged_at > cutoff_time:
-                            flags.append(data)
-                    except ValueError:
-                        continue
+        for data in self.memory_store.namespace('latency_flags').values():
+            flagged_at_str = data.get('flagged_at')
+            if isinstance(flagged_at_str, str) and flagged_at_str > cutoff_iso:
+                flags.append(data)
         
         # Sort by flagged time
         flags.sort(key=lambda x: x.get('flagged_at', ''), reverse=True)
@@ -322,28 +465,33 @@ class MemoryNamespaceManager:
         oldest_time = None
         newest_time = None
         
-        for key, data in self.memory_store.items():
+        for namespace, entries in self.memory_store.namespaces().items():
             # Count by namespace
-            namespace = key.split(':')[0] if ':' in key else 'unknown'
-            namespaces[namespace] = namespaces.get(namespace, 0) + 1
+            label = namespace if namespace is not None else 'unknown'
+            namespaces[label] = namespaces.get(label, 0) + len(entries)
             
-            # Track oldest/newest entries
+            # Track oldest/newest entries (ISO strings compared as text, no parsing)
             timestamp_fields = ['last_updated', 'last_seen', 'flagged_at']
-            for field in timestamp_fields:
-                if field in data:
-                    try:
-                        entry_time = datetime.fromisoformat(data[field])
-                        if oldest_time is None or entry_time < oldest_time:
-                            oldest_time = entry_time
-                            oldest_entry = key
-                        if newest_time is None or entry_time > newest_time:
-                            newest_time = entry_time
-                            newest_entry = key
-                    except (ValueError, TypeError):
+            for subkey, data in entries.items():
+                for field in timestamp_fields:
+                    entry_time = data.get(field)
+                    if not isinstance(entry_time, str):
                         continue
-        
-        # Rough size estimate
-        total_size = len(json.dumps(self.memory_store, default=str))
+                    if oldest_time is None or entry_time < oldest_time:
+                        oldest_time = entry_time
+                        oldest_entry = (namespace, subkey)
+                    if newest_time is None or entry_time > newest_time:
+                        newest_time = entry_time
+                        newest_entry = (namespace, subkey)
+        
+        # Flat keys are only needed for the two reported entries
+        if oldest_entry is not None:
+            oldest_entry = NamespacedMemoryStore.join_key(*oldest_entry)
+        if newest_entry is not None:
+            newest_entry = NamespacedMemoryStore.join_key(*newest_entry)
+        
+        # Rough size estimate: len(orjson.dumps(memory_store)), from the sizes measured at write time
+        total_size = self.memory_store.size_estimate
         
         return MemoryStats(
             total_entries=len(self.memory_store),
@@ -355,26 +503,17 @@ class MemoryNamespaceManager:
     
     def cleanup_old_entries(self, days: int = 30) -> int:
         """Clean up entries older than specified days"""
-        cutoff_time = datetime.now() - timedelta(days=days)
+        cutoff_iso = (datetime.now() - timedelta(days=days)).isoformat()
         keys_to_remove = []
         
         for key, data in self.memory_store.items():
-            should_remove = False
-            
-            # Check various timestamp fields
+            # Check various timestamp fields (compared as ISO strings, no parsing)
             timestamp_fields = ['last_updated', 'last_seen', 'flagged_at']
             for field in timestamp_fields:
-                if field in data:
-                    try:
-                        entry_time = datetime.fromisoformat(data[field])
-                        if entry_time < cutoff_time:
-                            should_remove = True
-                            break
-                    except (ValueError, TypeError):
-                        continue
-            
-            if should_remove:
-                keys_to_remove.append(key)
+                entry_time = data.get(field)
+                if isinstance(entry_time, str) and entry_time < cutoff_iso:
+                    keys_to_remove.append(key)
+                    break
         
         # Remove old entries
         for key in keys_to_remove:
@@ -384,33 +523,23 @@ class MemoryNamespaceManager:
         return len(keys_to_remove)
     
     def export_namespace(self, namespace: str) -> Dict[str, Any]:
-        """Export all entries from a specific namespace"""
-        exported = {}
-        prefix = f"{namespace}:"
-        
-        for key, value in self.memory_store.items():
-            if key.startswith(prefix):
-                exported[key] = value
-        
-        return exported
+        """Export all entries from a specific namespace, keyed without the namespace prefix"""
+        return dict(self.memory_store.namespace(namespace))
     
     def validate_namespace_entry(self, namespace: str, data: Dict[str, Any]) -> List[str]:
         """Validate entry against namespace schema"""
-        errors = []
-        schema = self.namespace_schemas.get(namespace)
+        schema = self._schemas.get(namespace)
         
         if not schema:
             return [f"Unknown namespace: {namespace}"]
+        required_fields, allowed_fields = schema
         
         # Check required fields
-        for field in schema['required_fields']:
-            if field not in data:
-                errors.append(f"Missing required field: {field}")
-        
-        # Check for unexpected fields
-        allowed_fields = set(schema['required_fields'] + schema['optional_fields'])
-        for field in data.keys():
-            if field not in allowed_fields:
-                errors.append(f"Unexpected field: {field}")
+        errors = [f"Missing required field: {field}" for field in required_fields if field not in data]
+        
+        # Check for unexpected fields (reported in the entry's field order)
+        unexpected = data.keys() - allowed_fields
+        if unexpected:
+            errors.extend(f"Unexpected field: {field}" for field in data if field in unexpected)
         
         return errors
\ No newline at end of file
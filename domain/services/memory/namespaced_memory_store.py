@@ -0,0 +1,142 @@
+#!/usr/bin/env python3
+"""
+🗂️ NAMESPACED MEMORY STORE
+=========================
+Memory store for the signal integrity agents, kept as one dict per namespace.
+
+Entries live in ``namespace -> subkey -> data`` dicts, so per-namespace
+queries and exports never scan or parse the keys of other namespaces. The
+store still behaves as the flat ``Dict[str, Any]`` (``"namespace:subkey"``
+keys) that the agents read and write.
+
+Domain-Driven Design: Domain service for memory management.
+"""
+
+from collections.abc import MutableMapping
+from typing import Dict, Any, Iterator, Mapping, Optional, Tuple
+
+import orjson
+
+
+class NamespacedMemoryStore(MutableMapping):
+    """
+    🗂️ Flat-key view over per-namespace dicts
+    
+    - ``store["echo_map:btc"]`` reads/writes ``namespace("echo_map")["btc"]``
+    - Keys without a ``:`` prefix go to the ``None`` namespace, unchanged
+    - ``put(namespace, subkey, value)`` writes without building a flat key
+    - Flat keys are only joined back together when iterating the view
+    - Keeps a running estimate of ``len(orjson.dumps(store))``, measured per write
+    """
+    
+    def __init__(self, entries: Optional[Mapping[str, Any]] = None):
+        """Initialize the store, optionally with flat-keyed entries"""
+        self._namespaces: Dict[Optional[str], Dict[str, Any]] = {}
+        self._count = 0
+        
+        # Write counter per namespace, for callers caching data derived from one
+        self._versions: Dict[Optional[str], int] = {}
+        
+        # JSON size of each entry, measured when written, and their running total
+        self._entry_sizes: Dict[Tuple[Optional[str], str], int] = {}
+        self._size_total = 0
+        
+        if entries:
+            self.update(entries)
+    
+    @staticmethod
+    def split_key(key: str) -> Tuple[Optional[str], str]:
+        """(namespace, subkey) of a flat key; (None, key) for keys without a prefix"""
+        namespace, separator, subkey = key.partition(':')
+        return (namespace, subkey) if separator else (None, key)
+    
+    @staticmethod
+    def join_key(namespace: Optional[str], subkey: str) -> str:
+        """Flat key of a namespace entry"""
+        return subkey if namespace is None else f"{namespace}:{subkey}"
+    
+    @staticmethod
+    def _entry_size(namespace: Optional[str], subkey: str, value: Any) -> int:
+        """Bytes an entry adds to the store's compact JSON: "namespace:subkey":value plus the "," separator"""
+        key_size = len(orjson.dumps(subkey))
+        if namespace is not None:
+            # "namespace:subkey" = both quoted parts, minus one pair of quotes, plus the ':'
+            key_size += len(orjson.dumps(namespace)) - 1
+        return key_size + 2 + len(orjson.dumps(value, default=str, option=orjson.OPT_NON_STR_KEYS))
+    
+    def namespace(self, namespace: Optional[str]) -> Dict[str, Any]:
+        """Entries of one namespace by subkey (the live dict; empty if the namespace is unused)"""
+        return self._namespaces.get(namespace, {})
+    
+    def namespaces(self) -> Dict[Optional[str], Dict[str, Any]]:
+        """All namespaces, in order of first use"""
+        return self._namespaces
+    
+    def version(self, namespace: Optional[str]) -> int:
+        """Number of writes/deletes so far in a namespace (changes whenever its entries do)"""
+        return self._versions.get(namespace, 0)
+    
+    @property
+    def size_estimate(self) -> int:
+        """Estimated ``len(orjson.dumps(store))`` in bytes"""
+        return self._size_total + 2 - (1 if self._count else 0)
+    
+    def __getitem__(self, key: str) -> Any:
+        namespace, subkey = self.split_key(key)
+        try:
+            return self._namespaces[namespace][subkey]
+        except KeyError:
+            raise KeyError(key) from None
+    
+    def get(self, key: str, default: Any = None) -> Any:
+        namespace, subkey = self.split_key(key)
+        entries = self._namespaces.get(namespace)
+        return default if entries is None else entries.get(subkey, default)
+    
+    def __contains__(self, key: object) -> bool:
+        if not isinstance(key, str):
+            return False
+        namespace, subkey = self.split_key(key)
+        entries = self._namespaces.get(namespace)
+        return entries is not None and subkey in entries
+    
+    def put(self, namespace: Optional[str], subkey: str, value: Any):
+        """Write an entry of one namespace (same as ``store["namespace:subkey"] = value``)"""
+        entries = self._namespaces.get(namespace)
+        if entries is None:
+            entries = self._namespaces[namespace] = {}
+        if subkey not in entries:
+            self._count += 1
+        entries[subkey] = value
+        self._versions[namespace] = self._versions.get(namespace, 0) + 1
+        
+        size = self._entry_size(namespace, subkey, value)
+        self._size_total += size - self._entry_sizes.get((namespace, subkey), 0)
+        self._entry_sizes[(namespace, subkey)] = size
+    
+    def __setitem__(self, key: str, value: Any):
+        namespace, subkey = self.split_key(key)
+        self.put(namespace, subkey, value)
+    
+    def __delitem__(self, key: str):
+        namespace, subkey = self.split_key(key)
+        entries = self._namespaces.get(namespace)
+        if entries is None or subkey not in entries:
+            raise KeyError(key)
+        del entries[subkey]
+        if not entries:
+            del self._namespaces[namespace]
+        self._count -= 1
+        self._versions[namespace] = self._versions.get(namespace, 0) + 1
+        self._size_total -= self._entry_sizes.pop((namespace, subkey), 0)
+    
+    def __iter__(self) -> Iterator[str]:
+        for namespace, entries in self._namespaces.items():
+            for subkey in entries:
+                yield self.join_key(namespace, subkey)
+    
+    def __len__(self) -> int:
+        return self._count
+    
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({dict(self.items())!r})"
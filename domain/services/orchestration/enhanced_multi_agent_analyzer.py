@@ -27,6 +27,7 @@ from ..signal_integrity.echo_mapper_agent import EchoMapperAgent
 from ..signal_integrity.latency_guard_agent import LatencyGuardAgent
 from ..signal_integrity.slop_filter_agent import SlopFilterAgent
 from ..signal_integrity.banned_phrase_skeptic_agent import BannedPhraseSkepticAgent
+from ..memory.namespaced_memory_store import NamespacedMemoryStore
 from ...entities.tweet import Tweet
 from ...entities.analysis_result import AnalysisResult, AnalysisStatus
 
@@ -71,7 +72,7 @@ class EnhancedMultiAgentAnalyzer(MultiAgentAnalyzer):
         self.config = config or EnhancedAgentConfig()
         
         # Initialize memory store (in production, this would be LettA)
-        self.memory_store = {}
+        self.memory_store = NamespacedMemoryStore()
         
         # Check API availability in real data only mode
         if self.config.real_data_only:
@@ -153,16 +153,16 @@ async def main():
             print(f"✅ EXTRACTION SUCCESSFUL!")
             print(f"   📊 Tweets extracted: {extraction_result.total_tweets_extracted}")
             print(f"   👥 Accounts processed: {extraction_result.successful_accounts}")
-            print(f"   📁 Output saved to: {extraction_result.output_file}")
+            print(f"   📁 Output saved to: {extraction_result.tweets_file_path}")
             
             # Copy to sample_extraction for main.py to use
-            if extraction_result.output_file and Path(extraction_result.output_file).exists():
+            if extraction_result.tweets_file_path and Path(extraction_result.tweets_file_path).exists():
                 sample_dir = Path("data/sample_extraction")
                 sample_dir.mkdir(parents=True, exist_ok=True)
                 
-                # Copy the extracted data
-                with open(extraction_result.output_file, 'r', encoding='utf-8') as f:
-                    data = json.load(f)
+                # Copy the extracted data (JSONL, one tweet per line) as a JSON array
+                with open(extraction_result.tweets_file_path, 'r', encoding='utf-8') as f:
+                    data = [json.loads(line) for line in f if line.strip()]
                 
                 with open(sample_dir / "extracted_tweets.json", 'w', encoding='utf-8') as f:
                     json.dump(data, f, indent=2, ensure_ascii=False)
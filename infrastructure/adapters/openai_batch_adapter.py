@@ -0,0 +1,149 @@
+#!/usr/bin/env python3
+"""
+📦 OPENAI BATCH ADAPTER
+======================
+Infrastructure adapter for the OpenAI Batch API.
+
+Domain-Driven Design: Infrastructure layer adapter for external services.
+Ships several chat completion requests as one JSONL batch file, at half the
+per-token price of synchronous calls. Batches complete asynchronously (the
+provider only promises the completion window), so this suits offline runs
+rather than interactive ones.
+"""
+
+import asyncio
+import logging
+from typing import Dict, Any, Optional
+
+import orjson
+from openai import AsyncOpenAI
+
+
+# Batch states after which the batch will not change any more
+TERMINAL_BATCH_STATES = ("completed", "failed", "expired", "cancelled")
+
+
+class OpenAIBatchAdapter:
+    """
+    📦 Runs chat completions through the OpenAI Batch API
+    
+    - ``complete()`` uploads one JSONL request file, creates the batch and
+      polls it with exponential backoff until it reaches a terminal state
+    - Responses are routed back by ``custom_id``; requests that failed inside
+      a completed batch come back as exceptions
+    - A batch still running at ``timeout`` (or when the caller is cancelled)
+      is cancelled on the provider side
+    """
+    
+    def __init__(self,
+                 client: AsyncOpenAI,
+                 completion_window: str = "24h",
+                 poll_interval: float = 5.0,
+                 max_poll_interval: float = 60.0,
+                 timeout: Optional[float] = None):
+        """Initialize adapter around an OpenAI client"""
+        self.client = client
+        self.completion_window = completion_window
+        self.poll_interval = poll_interval
+        self.max_poll_interval = max_poll_interval
+        self.timeout = timeout
+        self.logger = logging.getLogger(__name__)
+        
+        # Batch statistics
+        self.stats = {
+            'batches_submitted': 0,
+            'batches_completed': 0,
+            'batches_failed': 0,
+            'requests_submitted': 0
+        }
+    
+    async def complete(self, requests: Dict[str, Dict[str, Any]]) -> Dict[str, Any]:
+        """
+        Run chat completion requests as one batch
+        
+        Args:
+            requests: ``/v1/chat/completions`` request bodies by custom id
+        
+        Returns:
+            Message content (str) or the request's error (Exception) by custom id
+        
+        Raises:
+            TimeoutError: If the batch did not finish within ``timeout``
+            RuntimeError: If the batch as a whole failed, expired or was cancelled
+        """
+        lines = b''.join(
+            orjson.dumps({"custom_id": custom_id, "method": "POST", "url": "/v1/chat/completions", "body": body})
+            + b"\n"
+            for custom_id, body in requests.items()
+        )
+        
+        input_file = await self.client.files.create(file=("batch_requests.jsonl", lines), purpose="batch")
+        batch = await self.client.batches.create(
+            input_file_id=input_file.id,
+            endpoint="/v1/chat/completions",
+            completion_window=self.completion_window
+        )
+        self.stats['batches_submitted'] += 1
+        self.stats['requests_submitted'] += len(requests)
+        self.logger.info(f"📦 Submitted batch {batch.id} with {len(requests)} requests")
+        
+        try:
+            async with asyncio.timeout(self.timeout):
+                batch = await self._wait(batch)
+        except (TimeoutError, asyncio.CancelledError):
+            await self._cancel(batch.id)
+            raise
+        
+        if batch.status != "completed":
+            self.stats['batches_failed'] += 1
+            raise RuntimeError(f"OpenAI batch {batch.id} ended as {batch.status}")
+        self.stats['batches_completed'] += 1
+        
+        results: Dict[str, Any] = {}
+        for file_id in (batch.output_file_id, batch.error_file_id):
+            if file_id:
+                content = await self.client.files.content(file_id)
+                results.update(self._parse_output(content.content))
+        
+        # Requests the provider dropped without an output or error line
+        for custom_id in requests.keys() - results.keys():
+            results[custom_id] = RuntimeError(f"No result for {custom_id} in batch {batch.id}")
+        return results
+    
+    async def _wait(self, batch: Any) -> Any:
+        """Poll a batch with exponential backoff until it reaches a terminal state"""
+        delay = self.poll_interval
+        while batch.status not in TERMINAL_BATCH_STATES:
+            await asyncio.sleep(delay)
+            delay = min(delay * 2, self.max_poll_interval)
+            batch = await self.client.batches.retrieve(batch.id)
+        return batch
+    
+    async def _cancel(self, batch_id: str):
+        """Cancel an unfinished batch (best effort)"""
+        try:
+            await asyncio.shield(self.client.batches.cancel(batch_id))
+            self.logger.warning(f"🛑 Cancelled unfinished batch {batch_id}")
+        except Exception as e:
+            self.logger.warning(f"⚠️ Failed to cancel batch {batch_id}: {str(e)}")
+    
+    @staticmethod
+    def _parse_output(data: bytes) -> Dict[str, Any]:
+        """Message content or error per custom id from a batch output/error file"""
+        results: Dict[str, Any] = {}
+        for line in data.splitlines():
+            if not line.strip():
+                continue
+            
+            row = orjson.loads(line)
+            response = row.get("response") or {}
+            body = response.get("body") or {}
+            if row.get("error") or response.get("status_code") != 200:
+                error = row.get("error") or body.get("error") or {}
+                message = error.get("message") if isinstance(error, dict) else str(error)
+                results[row["custom_id"]] = RuntimeError(
+                    f"Batch request failed ({response.get('status_code')}): {message or 'unknown error'}"
+                )
+            else:
+                results[row["custom_id"]] = body["choices"][0]["message"]["content"]
+        return results
@@ -11,9 +11,10 @@ Handles all Twitter API communication and data transformation.
 import os
 import time
 import tweepy
+import requests
 import logging
 from datetime import datetime, timedelta
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Iterator, Tuple
 from dataclasses import dataclass
 
 from domain.entities.tweet import Tweet, UserMetadata, MediaAttachment, ThreadContext
@@ -41,8 +42,14 @@ class TwitterApiAdapter:
     - Rate limiting and error handling
     """
     
-    def __init__(self, config: TwitterApiConfig):
-        """Initialize Twitter API adapter with configuration"""
+    def __init__(self, config: TwitterApiConfig, session: Optional[requests.Session] = None):
+        """
+        Initialize Twitter API adapter with configuration
+        
+        Args:
+            config: Twitter API credentials
+            session: Optional shared HTTP session (connection pool) for all API calls
+        """
         self.config = config
         self.logger = logging.getLogger(__name__)
         
@@ -55,6 +62,8 @@ class TwitterApiAdapter:
             access_token_secret=config.access_token_secret,
             wait_on_rate_limit=True
         )
+        if session is not None:
+            self.client.session = session
         
         # Comprehensive tweet fields for maximum data extraction
         self.tweet_fields = [
@@ -110,10 +119,51 @@ class TwitterApiAdapter:
         Returns:
             List of Tweet entities
         """
+        tweets = []
+        for _, account_tweets in self.iter_account_tweets(account_usernames, max_tweets, hours_back):
+            tweets.extend(account_tweets)
+        return tweets[:max_tweets]
+    
+    def resolve_user_ids(self, usernames: List[str]) -> Dict[str, str]:
+        """
+        Resolve usernames to numeric user IDs with the bulk users lookup (100 per call)
+        
+        Args:
+            usernames: List of Twitter usernames (without @)
+            
+        Returns:
+            Dictionary mapping lowercase username to user ID; unknown users are omitted
+        """
+        user_ids = {}
+        for i in range(0, len(usernames), 100):
+            response = self.client.get_users(usernames=usernames[i:i + 100])
+            for user in response.data or []:
+                user_ids[user.username.lower()] = str(user.id)
+        
+        self.logger.info(f"🔎 Resolved {len(user_ids)}/{len(usernames)} usernames to user IDs")
+        return user_ids
+    
+    def iter_account_tweets(self, account_usernames: List[str],
+                            max_tweets: int = 30,
+                            hours_back: int = 24,
+                            user_ids: Optional[Dict[str, str]] = None) -> Iterator[Tuple[str, List[Tweet]]]:
+        """
+        Extract tweets account by account, yielding each account's tweets as soon as they arrive
+        
+        Args:
+            account_usernames: List of Twitter usernames (without @)
+            max_tweets: Maximum number of tweets to extract in total
+            hours_back: How many hours back to search
+            user_ids: Optional pre-resolved lowercase username -> user ID mapping;
+                accounts found here skip the per-account user lookup
+            
+        Yields:
+            Tuples of (username, tweets extracted from that account)
+        """
         self.logger.info(f"🐦 Starting tweet extraction from {len(account_usernames)} accounts")
         self.logger.info(f"🎯 Target: {max_tweets} tweets from last {hours_back} hours")
         
-        tweets = []
+        total_tweets = 0
         # Smart distribution: ensure we get enough tweets while respecting API limits
         # For 48 accounts and 30 tweets target: extract 5-10 tweets per account until we reach target
         tweets_per_account = max(5, min(10, (max_tweets * 2) // len(account_usernames)))  # Oversampling
@@ -136,22 +186,20 @@ class TwitterApiAdapter:
                     self.logger.info(f"⏸️ Brief pause after {accounts_processed} accounts...")
                     time.sleep(2)
                 
-                # Get user information first
-                user_response = self.client.get_user(
-                    username=username,
-                    user_fields=self.user_fields
-                )
-                
-                if not user_response.data:
-                    self.logger.warning(f"❌ User @{username} not found")
-                    accounts_processed += 1
-                    continue
-                
-                user = user_response.data
+                # Get user information first, unless the ID is already known
+                user = None
+                user_id = (user_ids or {}).get(username.lower())
+                if user_id is None:
+                    user = self._get_user(username)
+                    if user is None:
+                        self.logger.warning(f"❌ User @{username} not found")
+                        accounts_processed += 1
+                        continue
+                    user_id = user.id
                 
                 # Get user's recent tweets
                 tweets_response = self.client.get_users_tweets(
-                    id=user.id,
+                    id=user_id,
                     max_results=min(tweets_per_account, 100),  # API limit is 100, minimum 5
                     tweet_fields=self.tweet_fields,
                     user_fields=self.user_fields,
@@ -166,19 +214,22 @@ class TwitterApiAdapter:
                     accounts_processed += 1
                     continue
                 
+                # The author's profile comes back in the response includes (author_id expansion)
+                if user is None:
+                    user = self._find_included_user(tweets_response, user_id) or self._get_user(username)
+                
                 # Process tweets
-                account_tweets_added = 0
+                account_tweets = []
                 for tweet_data in tweets_response.data:
-                    if len(tweets) >= max_tweets:
+                    if total_tweets + len(account_tweets) >= max_tweets:
                         break
                     
-                    tweet = self._convert_to_tweet_entity(tweet_data, user, tweets_response)
-                    tweets.append(tweet)
-                    account_tweets_added += 1
+                    account_tweets.append(self._convert_to_tweet_entity(tweet_data, user, tweets_response))
                     
-                self.logger.info(f"✅ Added {account_tweets_added} tweets from @{username}")
+                self.logger.info(f"✅ Added {len(account_tweets)} tweets from @{username}")
                 successful_extractions += 1
                 accounts_processed += 1
+                total_tweets += len(account_tweets)
                 
             except tweepy.TooManyRequests:
                 self.logger.warning(f"⏸️ Rate limit reached at account @{username}. Stopping extraction.")
@@ -188,12 +239,30 @@ class TwitterApiAdapter:
                 accounts_processed += 1
                 continue
             
-            if len(tweets) >= max_tweets:
+            if account_tweets:
+                yield username, account_tweets
+            
+            if total_tweets >= max_tweets:
                 self.logger.info(f"🎯 Target of {max_tweets} tweets reached!")
                 break
         
-        self.logger.info(f"🎉 Extraction complete: {len(tweets)} tweets from {successful_extractions}/{accounts_processed} accounts")
-        return tweets[:max_tweets]
+        self.logger.info(f"🎉 Extraction complete: {total_tweets} tweets from {successful_extractions}/{accounts_processed} accounts")
+    
+    def _get_user(self, username: str) -> Optional[Any]:
+        """Look up a single user with the full user fields"""
+        user_response = self.client.get_user(
+            username=username,
+            user_fields=self.user_fields
+        )
+        return user_response.data
+    
+    def _find_included_user(self, response: Any, user_id: str) -> Optional[Any]:
+        """Find a user in a response's expanded includes"""
+        includes = getattr(response, 'includes', None) or {}
+        for user in includes.get('users', []):
+            if str(user.id) == str(user_id):
+                return user
+        return None
     
     def _convert_to_tweet_entity(self, tweet_data: Any, user_data: Any, 
                                response_includes: Any) -> Tweet:
@@ -0,0 +1,87 @@
+#!/usr/bin/env python3
+"""
+📝 BACKGROUND LOGGING
+====================
+Hands log records to a background thread instead of writing them inline.
+
+Domain-Driven Design: Infrastructure layer monitoring component.
+Log calls made from the event loop only enqueue the record; a QueueListener
+thread does the (possibly blocking) formatting and file/stream writes.
+"""
+
+import queue
+import logging
+from logging.handlers import QueueHandler, QueueListener
+from typing import List, Optional
+
+
+class BackgroundLogging:
+    """
+    📝 Moves a logger's handlers behind a QueueHandler/QueueListener pair
+    
+    - ``start()`` replaces the logger's handlers (plus an optional log file)
+      with one QueueHandler and starts a listener thread feeding them
+    - ``stop()`` flushes the queue and puts the original handlers back
+    """
+    
+    def __init__(self, log_file: Optional[str] = None, logger_name: Optional[str] = None):
+        """Initialize for the given logger (root by default), optionally adding a log file"""
+        self.log_file = log_file
+        self.target = logging.getLogger(logger_name)
+        self.logger = logging.getLogger(__name__)
+        
+        self._handlers: List[logging.Handler] = []
+        self._file_handler: Optional[logging.FileHandler] = None
+        self._queue_handler: Optional[QueueHandler] = None
+        self._listener: Optional[QueueListener] = None
+    
+    @property
+    def running(self) -> bool:
+        """Whether records are currently routed through the listener thread"""
+        return self._listener is not None
+    
+    def start(self):
+        """Route the logger's records through the background listener"""
+        if self._listener is not None:
+            return
+        
+        self._handlers = list(self.target.handlers)
+        handlers = list(self._handlers)
+        if self.log_file:
+            self._file_handler = logging.FileHandler(self.log_file, encoding='utf-8')
+            formatter = next((h.formatter for h in handlers if h.formatter), None)
+            if formatter:
+                self._file_handler.setFormatter(formatter)
+            handlers.append(self._file_handler)
+        
+        if not handlers:
+            return  # Nothing writes these records yet; keep logging's last-resort handler
+        
+        records: "queue.Queue[logging.LogRecord]" = queue.Queue(-1)
+        self._listener = QueueListener(records, *handlers, respect_handler_level=True)
+        self._queue_handler = QueueHandler(records)
+        
+        for handler in self._handlers:
+            self.target.removeHandler(handler)
+        self.target.addHandler(self._queue_handler)
+        self._listener.start()
+        
+        self.logger.info(f"📝 Background logging started ({len(handlers)} handlers)")
+    
+    def stop(self):
+        """Flush pending records and restore the original handlers"""
+        if self._listener is None:
+            return
+        
+        self._listener.stop()
+        self._listener = None
+        
+        self.target.removeHandler(self._queue_handler)
+        self._queue_handler = None
+        for handler in self._handlers:
+            self.target.addHandler(handler)
+        self._handlers = []
+        
+        if self._file_handler:
+            self._file_handler.close()
+            self._file_handler = None
@@ -0,0 +1,109 @@
+#!/usr/bin/env python3
+"""
+⏱️ LATENCY METRICS
+=================
+Per-call latency histograms for external API calls and local writes.
+
+Domain-Driven Design: Infrastructure layer monitoring component.
+Records how long Twitter, OpenAI and checkpoint calls take so timeouts can be
+tuned from observed p95s instead of guessed. Samples are kept in-process for
+percentiles; with prometheus_client installed they are also exported as
+Prometheus histograms.
+"""
+
+import math
+import time
+import logging
+from collections import deque
+from contextlib import contextmanager
+from typing import Deque, Dict, Iterator, Tuple
+
+try:
+    from prometheus_client import Histogram, start_http_server
+except ImportError:  # Optional: Prometheus export
+    Histogram = start_http_server = None
+
+
+LATENCY_BUCKETS = (0.1, 0.25, 0.5, 1, 2, 5, 10, 30, 60)
+
+# Prometheus collectors are process-wide singletons, so registered once here
+LATENCY = Histogram(
+    'twitter_classifier_call_latency_seconds',
+    'Latency of external API calls and local writes',
+    ['provider', 'op'],
+    buckets=LATENCY_BUCKETS
+) if Histogram else None
+
+_metrics_server_port = None
+
+
+def start_metrics_server(port: int) -> bool:
+    """Expose the Prometheus histograms over HTTP (once per process)"""
+    global _metrics_server_port
+    logger = logging.getLogger(__name__)
+    
+    if start_http_server is None:
+        logger.warning("⚠️ prometheus_client not installed - metrics server not started")
+        return False
+    if _metrics_server_port is None:
+        start_http_server(port)
+        _metrics_server_port = port
+        logger.info(f"📈 Prometheus metrics served on port {port}")
+    return True
+
+
+class LatencyRecorder:
+    """
+    ⏱️ Latency samples per (provider, op) with percentile summaries
+    
+    Keeps the most recent ``max_samples`` latencies of each operation.
+    """
+    
+    def __init__(self, max_samples: int = 10000):
+        """Initialize an empty recorder"""
+        self.max_samples = max_samples
+        self._samples: Dict[Tuple[str, str], Deque[float]] = {}
+    
+    @contextmanager
+    def time(self, provider: str, op: str) -> Iterator[None]:
+        """Time the enclosed block (including awaits) as one call"""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(provider, op, time.perf_counter() - start)
+    
+    def observe(self, provider: str, op: str, seconds: float):
+        """Record a single latency sample"""
+        key = (provider, op)
+        if key not in self._samples:
+            self._samples[key] = deque(maxlen=self.max_samples)
+        self._samples[key].append(seconds)
+        
+        if LATENCY is not None:
+            LATENCY.labels(provider=provider, op=op).observe(seconds)
+    
+    def percentiles(self) -> Dict[str, Dict[str, float]]:
+        """Summarize each operation as count, p50, p95 and p99 (seconds)"""
+        summary = {}
+        for (provider, op), samples in self._samples.items():
+            ordered = sorted(samples)
+            if not ordered:
+                continue
+            summary[f"{provider}.{op}"] = {
+                'count': len(ordered),
+                'p50': self._percentile(ordered, 0.50),
+                'p95': self._percentile(ordered, 0.95),
+                'p99': self._percentile(ordered, 0.99)
+            }
+        return summary
+    
+    def reset(self):
+        """Drop all in-process samples (Prometheus histograms are cumulative)"""
+        self._samples.clear()
+    
+    @staticmethod
+    def _percentile(ordered: list, q: float) -> float:
+        """Nearest-rank percentile of an already sorted list"""
+        index = min(len(ordered) - 1, max(0, math.ceil(q * len(ordered)) - 1))
+        return round(ordered[index], 4)
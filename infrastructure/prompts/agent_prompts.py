@@ -20,6 +20,19 @@ class AgentPrompts:
     - Extensive response requirements
     """
     
+    # Tweet input section contained in every agent prompt template
+    INPUT_SECTION = "COMPREHENSIVE INPUT:\n{comprehensive_input}\n"
+    
+    @staticmethod
+    def get_input_message(comprehensive_input: str) -> str:
+        """📥 Tweet input as a message of its own, identical for every agent of a tweet"""
+        return f"COMPREHENSIVE INPUT:\n{comprehensive_input}"
+    
+    @classmethod
+    def get_agent_instructions(cls, agent_name: str) -> str:
+        """🎯 An agent's prompt template without its input section (sent after the input message)"""
+        return getattr(cls, f'get_{agent_name}_prompt')().replace(cls.INPUT_SECTION, "", 1)
+    
     @staticmethod
     def get_summary_agent_prompt() -> str:
         """📄 Summary Agent - Title and abstract generation for social media content"""
@@ -0,0 +1,98 @@
+#!/usr/bin/env python3
+"""
+📉 ADAPTIVE CONCURRENCY
+======================
+AIMD (additive-increase, multiplicative-decrease) concurrency limit for LLM calls.
+
+Domain-Driven Design: Infrastructure layer reliability component.
+Backs off when the provider keeps rate-limiting us and slowly grows back once
+calls succeed again, instead of sending the same load into a wall of 429s.
+"""
+
+import asyncio
+import logging
+from collections import deque
+
+
+class AdaptiveConcurrency:
+    """
+    📉 Concurrency gate whose limit follows the observed rate-limit rate
+    
+    - Halves the limit when more than ``decrease_threshold`` of the recent
+      outcomes were rate-limited
+    - Adds one slot after ``increase_after`` consecutive successes
+    - The limit always stays within [``min_limit``, ``max_limit``]
+    
+    Built on asyncio.Condition rather than asyncio.Semaphore, since a
+    semaphore's capacity cannot be resized once created.
+    """
+    
+    def __init__(self,
+                 name: str,
+                 max_limit: int,
+                 min_limit: int = 1,
+                 window_size: int = 100,
+                 min_samples: int = 10,
+                 decrease_threshold: float = 0.05,
+                 increase_after: int = 100):
+        """Initialize the gate at its maximum limit"""
+        self.name = name
+        self.max_limit = max(max_limit, min_limit)
+        self.min_limit = min_limit
+        self.min_samples = min(min_samples, window_size)
+        self.decrease_threshold = decrease_threshold
+        self.increase_after = increase_after
+        self.logger = logging.getLogger(__name__)
+        
+        self.limit = self.max_limit
+        self._in_flight = 0
+        self._condition = asyncio.Condition()
+        self._outcomes = deque(maxlen=window_size)  # True = rate-limited
+        self._consecutive_successes = 0
+    
+    @property
+    def in_flight(self) -> int:
+        """Number of calls currently holding a slot"""
+        return self._in_flight
+    
+    async def __aenter__(self):
+        async with self._condition:
+            await self._condition.wait_for(lambda: self._in_flight < self.limit)
+            self._in_flight += 1
+        return self
+    
+    async def __aexit__(self, exc_type, exc, tb):
+        async with self._condition:
+            self._in_flight -= 1
+            self._condition.notify()
+    
+    async def record(self, rate_limited: bool):
+        """Record the outcome of one call and resize the limit if needed"""
+        async with self._condition:
+            self._outcomes.append(rate_limited)
+            
+            if rate_limited:
+                self._consecutive_successes = 0
+                if len(self._outcomes) >= self.min_samples:
+                    rate = sum(self._outcomes) / len(self._outcomes)
+                    if rate > self.decrease_threshold and self.limit > self.min_limit:
+                        self._resize(max(self.min_limit, self.limit // 2),
+                                     f"{rate:.0%} of recent calls rate-limited")
+                        # Judge the new limit on fresh outcomes only
+                        self._outcomes.clear()
+                return
+            
+            self._consecutive_successes += 1
+            if self._consecutive_successes >= self.increase_after:
+                self._consecutive_successes = 0
+                if self.limit < self.max_limit:
+                    self._resize(self.limit + 1, f"{self.increase_after} consecutive successes")
+                    self._condition.notify_all()
+    
+    def _resize(self, new_limit: int, reason: str):
+        """Change the limit (caller holds the condition lock)"""
+        if new_limit < self.limit:
+            self.logger.warning(f"📉 Concurrency '{self.name}': {self.limit} -> {new_limit} ({reason})")
+        else:
+            self.logger.info(f"📈 Concurrency '{self.name}': {self.limit} -> {new_limit} ({reason})")
+        self.limit = new_limit
@@ -0,0 +1,89 @@
+#!/usr/bin/env python3
+"""
+🚢 BULKHEAD
+==========
+Per-provider concurrency isolation for external API calls.
+
+Domain-Driven Design: Infrastructure layer reliability component.
+Each provider gets its own bounded pool of in-flight calls, waiting slots and
+worker threads, so a slow provider cannot starve the others.
+"""
+
+import asyncio
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Awaitable, Callable, Optional
+
+
+class BulkheadFull(Exception):
+    """Raised when a bulkhead has no free slot and its wait queue is full"""
+
+
+class Bulkhead:
+    """
+    🚢 Bounded-concurrency compartment for one provider
+    
+    - At most ``max_concurrent`` calls run at once
+    - At most ``max_queue`` further calls wait for a slot; beyond that calls
+      are rejected immediately with BulkheadFull
+    - Blocking (sync) calls run on the bulkhead's own thread pool instead of
+      the event loop's shared default executor
+    """
+    
+    def __init__(self, name: str, max_concurrent: int, max_queue: int):
+        """Initialize bulkhead for a named provider"""
+        self.name = name
+        self.max_concurrent = max_concurrent
+        self.max_queue = max_queue
+        self.logger = logging.getLogger(__name__)
+        
+        self._semaphore = asyncio.Semaphore(max_concurrent)
+        self._pending = 0  # running + waiting
+        self._executor: Optional[ThreadPoolExecutor] = None
+    
+    @property
+    def in_flight(self) -> int:
+        """Number of calls currently running or waiting for a slot"""
+        return self._pending
+    
+    async def submit(self, coro: Awaitable[Any]) -> Any:
+        """
+        Run a coroutine inside the bulkhead
+        
+        Raises:
+            BulkheadFull: If the wait queue is already full
+        """
+        if self._pending >= self.max_concurrent + self.max_queue:
+            # Close the never-awaited coroutine to avoid a "never awaited" warning
+            if asyncio.iscoroutine(coro):
+                coro.close()
+            self.logger.warning(f"🚢 Bulkhead '{self.name}' full: rejecting call")
+            raise BulkheadFull(f"Bulkhead '{self.name}' is full "
+                               f"({self.max_concurrent} running, {self.max_queue} queued)")
+        
+        self._pending += 1
+        try:
+            async with self._semaphore:
+                return await coro
+        finally:
+            self._pending -= 1
+    
+    async def run_sync(self, func: Callable[..., Any], *args) -> Any:
+        """Run a blocking function on this bulkhead's dedicated thread pool"""
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=self.max_concurrent,
+                thread_name_prefix=f"bulkhead-{self.name}"
+            )
+        loop = asyncio.get_running_loop()
+        
+        async def _run_in_thread():
+            return await loop.run_in_executor(self._executor, func, *args)
+        
+        return await self.submit(_run_in_thread())
+    
+    def shutdown(self):
+        """Release the dedicated thread pool"""
+        if self._executor is not None:
+            self._executor.shutdown(wait=False)
+            self._executor = None
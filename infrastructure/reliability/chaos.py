@@ -0,0 +1,143 @@
+#!/usr/bin/env python3
+"""
+🐒 CHAOS MIDDLEWARE
+==================
+Seeded fault injection for the Twitter and OpenAI HTTP clients.
+
+Domain-Driven Design: Infrastructure layer reliability component.
+Lets the workflow's failure branches (extraction_failed, analysis_failed,
+partial results) be exercised reproducibly without a real outage.
+"""
+
+import time
+import random
+import asyncio
+import logging
+from typing import Dict, Optional
+
+import httpx
+import requests
+from requests.adapters import HTTPAdapter
+
+
+# Supported fault types
+NETWORK_TIMEOUT = "network_timeout"
+CONNECTION_ERROR = "connection_error"
+HTTP_429 = "http_429"
+HTTP_5XX = "http_5xx"
+MALFORMED_JSON = "malformed_json"
+SLOW_RESPONSE = "slow_response"
+
+FAULT_TYPES = (NETWORK_TIMEOUT, CONNECTION_ERROR, HTTP_429, HTTP_5XX, MALFORMED_JSON, SLOW_RESPONSE)
+
+# Chaos rule: fault type -> probability per request (total must not exceed 1)
+ChaosRule = Dict[str, float]
+
+
+class ChaosMiddleware:
+    """
+    🐒 Decides, per outgoing request, which fault (if any) to inject
+    
+    Faults are drawn from a private RNG seeded at construction, so the same
+    rule and seed produce the same fault sequence on every run.
+    """
+    
+    def __init__(self, rule: ChaosRule, seed: int = 0, slow_response_delay: float = 5.0):
+        """Initialize middleware with a fault rule and seed"""
+        unknown = set(rule) - set(FAULT_TYPES)
+        if unknown:
+            raise ValueError(f"Unknown chaos fault types: {sorted(unknown)}")
+        if sum(rule.values()) > 1.0:
+            raise ValueError("Chaos fault probabilities must not add up to more than 1")
+        
+        self.rule = rule
+        self.seed = seed
+        self.slow_response_delay = slow_response_delay
+        self.logger = logging.getLogger(__name__)
+        
+        self._rng = random.Random(seed)
+        
+        # Injection statistics
+        self.stats = {fault: 0 for fault in FAULT_TYPES}
+    
+    def pick_fault(self, provider: str) -> Optional[str]:
+        """Draw the fault for the next request, or None to let it through untouched"""
+        roll = self._rng.random()
+        threshold = 0.0
+        for fault in FAULT_TYPES:
+            threshold += self.rule.get(fault, 0.0)
+            if roll < threshold:
+                self.stats[fault] += 1
+                self.logger.warning(f"🐒 Chaos: injecting {fault} into {provider} request")
+                return fault
+        return None
+
+
+class ChaosAsyncTransport(httpx.AsyncBaseTransport):
+    """httpx transport wrapper injecting faults into async (OpenAI) requests"""
+    
+    def __init__(self, chaos: ChaosMiddleware, transport: httpx.AsyncBaseTransport, provider: str = "openai"):
+        self.chaos = chaos
+        self.transport = transport
+        self.provider = provider
+    
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        fault = self.chaos.pick_fault(self.provider)
+        
+        if fault == NETWORK_TIMEOUT:
+            raise httpx.ReadTimeout("Chaos: injected network timeout", request=request)
+        if fault == CONNECTION_ERROR:
+            raise httpx.ConnectError("Chaos: injected connection error", request=request)
+        if fault == HTTP_429:
+            return httpx.Response(429, headers={"retry-after": "1"}, json={"error": {"message": "Chaos: rate limited"}}, request=request)
+        if fault == HTTP_5XX:
+            return httpx.Response(503, json={"error": {"message": "Chaos: service unavailable"}}, request=request)
+        if fault == MALFORMED_JSON:
+            return httpx.Response(200, headers={"content-type": "application/json"}, content=b'{"choices": [', request=request)
+        if fault == SLOW_RESPONSE:
+            await asyncio.sleep(self.chaos.slow_response_delay)
+        
+        return await self.transport.handle_async_request(request)
+    
+    async def aclose(self):
+        await self.transport.aclose()
+
+
+class ChaosHTTPAdapter(HTTPAdapter):
+    """requests adapter injecting faults into sync (Twitter/tweepy) requests"""
+    
+    def __init__(self, chaos: ChaosMiddleware, provider: str = "twitter", **kwargs):
+        self.chaos = chaos
+        self.provider = provider
+        super().__init__(**kwargs)
+    
+    def send(self, request, **kwargs):
+        fault = self.chaos.pick_fault(self.provider)
+        
+        if fault == NETWORK_TIMEOUT:
+            raise requests.exceptions.ReadTimeout("Chaos: injected network timeout", request=request)
+        if fault == CONNECTION_ERROR:
+            raise requests.exceptions.ConnectionError("Chaos: injected connection error", request=request)
+        if fault == HTTP_429:
+            response = self._fake_response(request, 429, b'{"title": "Too Many Requests"}')
+            response.headers["x-rate-limit-reset"] = str(int(time.time()) + 1)
+            return response
+        if fault == HTTP_5XX:
+            return self._fake_response(request, 503, b'{"title": "Service Unavailable"}')
+        if fault == MALFORMED_JSON:
+            return self._fake_response(request, 200, b'{"data": [')
+        if fault == SLOW_RESPONSE:
+            time.sleep(self.chaos.slow_response_delay)
+        
+        return super().send(request, **kwargs)
+    
+    @staticmethod
+    def _fake_response(request, status_code: int, content: bytes) -> requests.Response:
+        """Build a canned response without touching the network"""
+        response = requests.Response()
+        response.status_code = status_code
+        response._content = content
+        response.headers["content-type"] = "application/json"
+        response.url = request.url
+        response.request = request
+        return response
@@ -0,0 +1,110 @@
+#!/usr/bin/env python3
+"""
+🔌 CIRCUIT BREAKER
+=================
+Per-provider circuit breaker for external API calls.
+
+Domain-Driven Design: Infrastructure layer reliability component.
+Stops hammering a degraded provider and fails fast until it has had time to recover.
+"""
+
+import time
+import asyncio
+import logging
+from enum import Enum
+from typing import Any, Awaitable, Callable
+
+
+class CircuitState(Enum):
+    """Circuit breaker state enumeration"""
+    CLOSED = "closed"        # Normal operation, calls pass through
+    OPEN = "open"            # Provider considered down, calls rejected
+    HALF_OPEN = "half_open"  # Recovery window elapsed, one trial call allowed
+
+
+class CircuitOpenError(Exception):
+    """Raised when a call is rejected because the circuit is open"""
+
+
+class CircuitBreaker:
+    """
+    🔌 CLOSED → OPEN → HALF_OPEN circuit breaker
+    
+    - CLOSED: calls pass through; ``failure_threshold`` consecutive failures open the circuit
+    - OPEN: calls are rejected with CircuitOpenError for ``recovery_timeout`` seconds
+    - HALF_OPEN: a single trial call is allowed; success closes the circuit,
+      failure opens it again
+    """
+    
+    def __init__(self, name: str, failure_threshold: int = 5, recovery_timeout: float = 60.0):
+        """Initialize circuit breaker for a named provider"""
+        self.name = name
+        self.failure_threshold = failure_threshold
+        self.recovery_timeout = recovery_timeout
+        self.logger = logging.getLogger(__name__)
+        
+        self._state = CircuitState.CLOSED
+        self._consecutive_failures = 0
+        self._opened_at = 0.0
+        self._trial_in_flight = False
+    
+    @property
+    def state(self) -> CircuitState:
+        """Current state, moving OPEN → HALF_OPEN once the recovery window has elapsed"""
+        if (self._state is CircuitState.OPEN and 
+                time.monotonic() - self._opened_at >= self.recovery_timeout):
+            self._state = CircuitState.HALF_OPEN
+            self._trial_in_flight = False
+            self.logger.info(f"🔌 Circuit '{self.name}' half-open: allowing a trial call")
+        return self._state
+    
+    def allow_request(self) -> bool:
+        """Check whether a call may proceed (reserves the trial slot when half-open)"""
+        state = self.state
+        if state is CircuitState.CLOSED:
+            return True
+        if state is CircuitState.HALF_OPEN and not self._trial_in_flight:
+            self._trial_in_flight = True
+            return True
+        return False
+    
+    def record_success(self):
+        """Record a successful call"""
+        if self._state is not CircuitState.CLOSED:
+            self.logger.info(f"✅ Circuit '{self.name}' closed: provider recovered")
+        self._state = CircuitState.CLOSED
+        self._consecutive_failures = 0
+        self._trial_in_flight = False
+    
+    def record_failure(self):
+        """Record a failed call, opening the circuit when the threshold is reached"""
+        self._consecutive_failures += 1
+        self._trial_in_flight = False
+        
+        if (self._state is CircuitState.HALF_OPEN or 
+                self._consecutive_failures >= self.failure_threshold):
+            if self._state is not CircuitState.OPEN:
+                self.logger.warning(f"⚠️ Circuit '{self.name}' opened after {self._consecutive_failures} "
+                                    f"consecutive failures; short-circuiting for {self.recovery_timeout}s")
+            self._state = CircuitState.OPEN
+            self._opened_at = time.monotonic()
+    
+    async def call(self, func: Callable[..., Awaitable[Any]], *args, **kwargs) -> Any:
+        """
+        Call an async function through the breaker
+        
+        Raises:
+            CircuitOpenError: If the circuit is open
+        """
+        if not self.allow_request():
+            raise CircuitOpenError(f"Circuit '{self.name}' is open")
+        
+        try:
+            result = await func(*args, **kwargs)
+        except (Exception, asyncio.CancelledError):
+            # Cancellation here usually means a caller-side timeout, which is a failure signal too
+            self.record_failure()
+            raise
+        
+        self.record_success()
+        return result
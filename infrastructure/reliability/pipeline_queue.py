@@ -0,0 +1,66 @@
+#!/usr/bin/env python3
+"""
+🔀 PIPELINE QUEUE
+================
+Bounded hand-off queue between the extraction and analysis pipeline stages.
+
+Domain-Driven Design: Infrastructure layer reliability component.
+The producer signals end of stream with ``finish()``, which never blocks, so
+a producer that fails or is cancelled while the queue is full can still
+terminate the consumer. Once the consumer stops reading, ``close()`` makes
+further puts no-ops, so the producer cannot block on a queue nobody drains.
+"""
+
+import asyncio
+from typing import Any
+
+
+class PipelineQueue(asyncio.Queue):
+    """
+    🔀 asyncio.Queue with a non-blocking end-of-stream signal
+    
+    - ``finish()`` marks the stream complete; ``get()`` returns ``None`` once
+      every queued item has been taken
+    - The ``None`` sentinel is also enqueued when there is room, so consumers
+      written against a plain ``asyncio.Queue`` see the same protocol
+    - ``close()`` discards queued items and makes every later put a no-op,
+      including a put already waiting for room (one producer is assumed, as
+      each discarded item wakes at most one waiting put)
+    """
+    
+    def __init__(self, maxsize: int = 0):
+        """Initialize queue with the given bound (0 = unbounded)"""
+        super().__init__(maxsize)
+        self.finished = False
+        self.closed = False
+    
+    def finish(self):
+        """Signal end of stream without waiting for room in the queue"""
+        if self.finished:
+            return
+        self.finished = True
+        if not self.closed and not self.full():
+            super().put_nowait(None)
+    
+    def close(self):
+        """Stop accepting items: the consumer is gone, so drop queued and future puts"""
+        self.closed = True
+        # Each get wakes one blocked put, which then sees the closed flag and drops its item
+        while not self.empty():
+            super().get_nowait()
+    
+    async def put(self, item: Any):
+        """Put an item, waiting for room (no-op once closed)"""
+        if not self.closed:
+            await super().put(item)
+    
+    def put_nowait(self, item: Any):
+        """Put an item without waiting (no-op once closed)"""
+        if not self.closed:
+            super().put_nowait(item)
+    
+    async def get(self) -> Any:
+        """Next item, or ``None`` once the producer finished and the queue is empty"""
+        if self.finished and self.empty():
+            return None
+        return await super().get()
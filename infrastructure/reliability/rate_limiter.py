@@ -0,0 +1,69 @@
+#!/usr/bin/env python3
+"""
+🚦 ASYNC RATE LIMITER
+====================
+Proactive token-bucket rate limiting for external API calls.
+
+Domain-Driven Design: Infrastructure layer reliability component.
+Keeps request and token usage under provider quotas instead of reacting to 429s.
+"""
+
+import time
+import asyncio
+
+
+class AsyncRateLimiter:
+    """
+    🚦 Token-bucket limiter allowing ``max_rate`` units per ``time_period`` seconds
+    
+    Units can be requests (acquire 1 per call) or tokens (acquire the estimated
+    token count per call). The bucket drains continuously, so capacity frees up
+    smoothly instead of in bursts at window boundaries.
+    """
+    
+    def __init__(self, max_rate: float, time_period: float = 60.0):
+        """Initialize limiter with its capacity and refill period"""
+        self.max_rate = float(max_rate)
+        self.time_period = float(time_period)
+        self._rate_per_sec = self.max_rate / self.time_period
+        self._level = 0.0
+        self._last_check = time.monotonic()
+        self._lock = asyncio.Lock()
+    
+    def _leak(self):
+        """Drain the bucket according to the time elapsed since the last check"""
+        now = time.monotonic()
+        elapsed = now - self._last_check
+        self._level = max(0.0, self._level - elapsed * self._rate_per_sec)
+        self._last_check = now
+    
+    def has_capacity(self, amount: float = 1.0) -> bool:
+        """Check whether ``amount`` units could be acquired without waiting"""
+        self._leak()
+        return self._level + min(amount, self.max_rate) <= self.max_rate
+    
+    async def acquire(self, amount: float = 1.0):
+        """
+        Wait until ``amount`` units fit in the bucket, then take them
+        
+        Requests larger than the whole capacity are clamped to it so they
+        wait for an empty bucket instead of blocking forever.
+        """
+        amount = min(float(amount), self.max_rate)
+        
+        # The lock keeps waiters in FIFO order
+        async with self._lock:
+            while True:
+                self._leak()
+                if self._level + amount <= self.max_rate:
+                    self._level += amount
+                    return
+                
+                await asyncio.sleep((self._level + amount - self.max_rate) / self._rate_per_sec)
+    
+    async def __aenter__(self):
+        await self.acquire()
+        return None
+    
+    async def __aexit__(self, exc_type, exc, tb):
+        return False
@@ -10,12 +10,15 @@ Handles saving analysis results, reports, and summaries to filesystem.
 
 import os
 import json
+import asyncio
 import logging
 from datetime import datetime
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Iterable, Optional
 from pathlib import Path
+from dataclasses import fields, is_dataclass
 
 from domain.entities.analysis_result import AnalysisResult
+from .uring_writer import UringWriter
 
 
 class EnhancedJSONEncoder(json.JSONEncoder):
@@ -27,7 +30,9 @@ class EnhancedJSONEncoder(json.JSONEncoder):
             return obj.isoformat()
         elif hasattr(obj, 'value'):  # Handle Enum objects
             return obj.value
-        elif hasattr(obj, '__dict__'):  # Handle dataclass objects
+        elif is_dataclass(obj):  # Handle dataclass objects (slotted ones have no __dict__)
+            return {f.name: getattr(obj, f.name) for f in fields(obj)}
+        elif hasattr(obj, '__dict__'):
             return obj.__dict__
         return super().default(obj)
 
@@ -43,13 +48,16 @@ class FileRepository:
     - Ensuring data consistency and error handling
     """
     
-    def __init__(self, base_path: str = "results/runs"):
+    def __init__(self, base_path: str = "results/runs", use_io_uring: bool = True):
         """Initialize file repository with base path"""
         self.base_path = Path(base_path)
         self.logger = logging.getLogger(__name__)
         
         # Ensure base directory exists
         self.base_path.mkdir(parents=True, exist_ok=True)
+        
+        # Batched kernel-async writes on Linux with liburing; thread writes otherwise
+        self._uring = UringWriter.create() if use_io_uring else None
     
     async def save_analysis_result(self, 
                                  result: AnalysisResult, 
@@ -69,25 +77,11 @@ class FileRepository:
             Full path of saved file
         """
         try:
-            # Create directory structure
-            run_dir = self.base_path / run_id / subfolder
-            run_dir.mkdir(parents=True, exist_ok=True)
-            
-            # Convert result to dictionary
-            if hasattr(result, 'to_dict'):
-                result_dict = result.to_dict()
-            elif hasattr(result, '__dict__'):
-                result_dict = result.__dict__
-            else:
-                result_dict = result
+            file_path = self.base_path / run_id / subfolder / filename
             
-            # Save as JSON with enhanced encoder
-            file_path = run_dir / filename
-            with open(file_path, 'w', encoding='utf-8') as f:
-                json.dump(result_dict, f, 
-                         indent=2, 
-                         ensure_ascii=False,
-                         cls=EnhancedJSONEncoder)
+            # Serialized on a worker thread so large results don't stall the event loop
+            payload = await asyncio.to_thread(self._serialize_result, result)
+            await self._write_file(file_path, payload)
             
             self.logger.info(f"💾 Saved analysis result: {file_path}")
             return str(file_path)
@@ -114,14 +108,9 @@ class FileRepository:
             Full path of saved file
         """
         try:
-            # Create directory structure
-            run_dir = self.base_path / run_id / subfolder
-            run_dir.mkdir(parents=True, exist_ok=True)
-            
             # Save text content
-            file_path = run_dir / filename
-            with open(file_path, 'w', encoding='utf-8') as f:
-                f.write(content)
+            file_path = self.base_path / run_id / subfolder / filename
+            await self._write_file(file_path, content.encode('utf-8'))
             
             self.logger.info(f"💾 Saved text file: {file_path}")
             return str(file_path)
@@ -130,6 +119,72 @@ class FileRepository:
             self.logger.error(f"❌ Failed to save text file {filename}: {str(e)}")
             raise
     
+    async def save_binary_file(self, 
+                               data: bytes, 
+                               run_id: str, 
+                               filename: str,
+                               subfolder: str = "individual_content") -> str:
+        """
+        Save raw bytes to file in a single write
+        
+        Args:
+            data: Bytes to save
+            run_id: Run identifier for directory organization
+            filename: Name of the file to save
+            subfolder: Subfolder within run directory
+            
+        Returns:
+            Full path of saved file
+        """
+        try:
+            file_path = self.base_path / run_id / subfolder / filename
+            await self._write_file(file_path, data)
+            
+            self.logger.info(f"💾 Saved file: {file_path} ({len(data)} bytes)")
+            return str(file_path)
+            
+        except Exception as e:
+            self.logger.error(f"❌ Failed to save file {filename}: {str(e)}")
+            raise
+    
+    async def save_ndjson_stream(self, 
+                                 rows: Iterable[bytes], 
+                                 run_id: str, 
+                                 filename: str,
+                                 subfolder: str = "summary") -> str:
+        """
+        Stream NDJSON rows to file as they are produced
+        
+        Args:
+            rows: Encoded rows, each ending with a newline (consumed on a worker thread)
+            run_id: Run identifier for directory organization
+            filename: Name of the file to save
+            subfolder: Subfolder within run directory
+            
+        Returns:
+            Full path of saved file
+        """
+        try:
+            file_path = self.base_path / run_id / subfolder / filename
+            
+            def _write() -> int:
+                file_path.parent.mkdir(parents=True, exist_ok=True)
+                count = 0
+                with open(file_path, 'wb') as f:
+                    for row in rows:
+                        f.write(row)
+                        count += 1
+                return count
+            
+            count = await asyncio.to_thread(_write)
+            
+            self.logger.info(f"💾 Streamed {count} rows: {file_path}")
+            return str(file_path)
+            
+        except Exception as e:
+            self.logger.error(f"❌ Failed to stream {filename}: {str(e)}")
+            raise
+    
     async def save_json_data(self, 
                            data: Dict[str, Any], 
                            run_id: str, 
@@ -148,17 +203,12 @@ class FileRepository:
             Full path of saved file
         """
         try:
-            # Create directory structure
-            run_dir = self.base_path / run_id / subfolder
-            run_dir.mkdir(parents=True, exist_ok=True)
-            
             # Save as JSON
-            file_path = run_dir / filename
-            with open(file_path, 'w', encoding='utf-8') as f:
-                json.dump(data, f, 
-                         indent=2, 
-                         ensure_ascii=False,
-                         cls=EnhancedJSONEncoder)
+            file_path = self.base_path / run_id / subfolder / filename
+            payload = await asyncio.to_thread(
+                json.dumps, data, indent=2, ensure_ascii=False, cls=EnhancedJSONEncoder
+            )
+            await self._write_file(file_path, payload.encode('utf-8'))
             
             self.logger.info(f"💾 Saved JSON data: {file_path}")
             return str(file_path)
@@ -167,6 +217,35 @@ class FileRepository:
             self.logger.error(f"❌ Failed to save JSON data {filename}: {str(e)}")
             raise
     
+    @staticmethod
+    def _serialize_result(result: AnalysisResult) -> bytes:
+        """Serialize an analysis result to indented JSON bytes"""
+        if hasattr(result, 'to_json_bytes'):
+            # Entities serialize themselves straight to bytes, without a to_dict() tree
+            return result.to_json_bytes()
+        
+        # Convert result to dictionary and save as JSON with enhanced encoder
+        result_dict = result.to_dict() if hasattr(result, 'to_dict') else getattr(result, '__dict__', result)
+        return json.dumps(result_dict, indent=2, ensure_ascii=False, cls=EnhancedJSONEncoder).encode('utf-8')
+    
+    async def _write_file(self, file_path: Path, data: bytes):
+        """Create the parent directory and write the file off the event loop"""
+        if self._uring:
+            await self._uring.write(file_path, data)
+            return
+        
+        def _write():
+            file_path.parent.mkdir(parents=True, exist_ok=True)
+            file_path.write_bytes(data)
+        
+        await asyncio.to_thread(_write)
+    
+    def close(self):
+        """Stop the io_uring writer, if any"""
+        if self._uring:
+            self._uring.close()
+            self._uring = None
+    
     def list_run_directories(self) -> list[str]:
         """List all run directories"""
         try:
@@ -0,0 +1,250 @@
+#!/usr/bin/env python3
+"""
+🗃️ LLM RESPONSE CACHE
+====================
+Infrastructure repository for content-addressed LLM responses.
+
+Domain-Driven Design: Infrastructure layer repository for data persistence.
+Stores raw agent responses in SQLite keyed by sha256(model + prompt), so
+re-runs and duplicate tweets don't pay for the same completion twice.
+Recently used entries are also kept in an in-process LRU in front of SQLite.
+The ``*_async`` methods answer from that LRU on the event loop and run any
+SQLite query or commit in a worker thread.
+"""
+
+import time
+import asyncio
+import hashlib
+import logging
+import sqlite3
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Tuple
+
+
+# Keys per SELECT ... IN (...) query, well under SQLite's bound-parameter limit
+BULK_QUERY_SIZE = 500
+
+
+class LLMResponseCache:
+    """
+    🗃️ SQLite-backed cache of LLM responses
+    
+    Handles:
+    - Content-addressed keys (model + prompt)
+    - Per-entry expiry
+    - Reading expired entries as a stale fallback when the provider is down
+    - Bulk lookups and writes for whole batches
+    - An in-process LRU of the ``memory_entries`` most recently used entries,
+      answering repeat lookups without a SQLite query
+    - Async variants for event-loop callers, with SQLite work off the loop
+    """
+    
+    def __init__(self, db_path: str = "data/cache/llm_responses.sqlite3", ttl_seconds: float = 7 * 86400,
+                 memory_entries: int = 1024):
+        """Initialize cache database at the given path"""
+        self.db_path = Path(db_path)
+        self.ttl_seconds = ttl_seconds
+        self.memory_entries = memory_entries
+        self.logger = logging.getLogger(__name__)
+        
+        self._connection: Optional[sqlite3.Connection] = None
+        # Serializes use of the connection across the worker threads of the async methods
+        self._db_lock = threading.Lock()
+        
+        # In-process tier: key -> (response, expires_at), least recently used first
+        self._memory: "OrderedDict[str, Tuple[str, float]]" = OrderedDict()
+        
+        # Cache statistics
+        self.stats = {
+            'hits': 0,
+            'memory_hits': 0,
+            'misses': 0,
+            'stale_hits': 0
+        }
+    
+    @staticmethod
+    def make_key(model: str, prompt: str) -> str:
+        """Build the cache key for a model/prompt pair"""
+        return hashlib.sha256(f"{model}|{prompt}".encode('utf-8')).hexdigest()
+    
+    def get(self, key: str, allow_expired: bool = False) -> Optional[str]:
+        """
+        Get a cached response
+        
+        Args:
+            key: Cache key from make_key
+            allow_expired: Also return entries past their expiry (stale fallback)
+        
+        Returns:
+            Cached response, or None if missing (or expired)
+        """
+        response = self._memory_get(key, time.time())
+        if response is not None:
+            self.stats['hits'] += 1
+            return response
+        
+        return self._resolve(key, self._fetch(key), allow_expired)
+    
+    async def get_async(self, key: str, allow_expired: bool = False) -> Optional[str]:
+        """Like get(), with the SQLite query run in a worker thread"""
+        response = self._memory_get(key, time.time())
+        if response is not None:
+            self.stats['hits'] += 1
+            return response
+        
+        return self._resolve(key, await asyncio.to_thread(self._fetch, key), allow_expired)
+    
+    def _resolve(self, key: str, row: Optional[Tuple[str, float]], allow_expired: bool) -> Optional[str]:
+        """Response from a SQLite row, applying expiry and updating stats and the LRU"""
+        if row is None:
+            self.stats['misses'] += 1
+            return None
+        
+        response, expires_at = row
+        if expires_at < time.time():
+            if not allow_expired:
+                self.stats['misses'] += 1
+                return None
+            self.stats['stale_hits'] += 1
+        else:
+            self.stats['hits'] += 1
+            self._memory_put(key, response, expires_at)
+        
+        return response
+    
+    def get_many(self, keys: List[str]) -> Dict[str, str]:
+        """Get the unexpired cached responses for several keys at once (missing keys are left out)"""
+        unique_keys, found, now = self._memory_get_many(keys)
+        remaining = [key for key in unique_keys if key not in found]
+        rows = self._fetch_many(remaining, now) if remaining else []
+        return self._collect(unique_keys, found, rows)
+    
+    async def get_many_async(self, keys: List[str]) -> Dict[str, str]:
+        """Like get_many(), with the SQLite queries run in a worker thread"""
+        unique_keys, found, now = self._memory_get_many(keys)
+        remaining = [key for key in unique_keys if key not in found]
+        rows = await asyncio.to_thread(self._fetch_many, remaining, now) if remaining else []
+        return self._collect(unique_keys, found, rows)
+    
+    def _memory_get_many(self, keys: List[str]) -> Tuple[List[str], Dict[str, str], float]:
+        """De-duplicated keys, the responses the in-process tier already holds, and the lookup time"""
+        unique_keys = list(dict.fromkeys(keys))
+        found: Dict[str, str] = {}
+        now = time.time()
+        
+        for key in unique_keys:
+            response = self._memory_get(key, now)
+            if response is not None:
+                found[key] = response
+        
+        return unique_keys, found, now
+    
+    def _collect(self, unique_keys: List[str], found: Dict[str, str],
+                 rows: List[Tuple[str, str, float]]) -> Dict[str, str]:
+        """Merge SQLite rows into the found responses, updating stats and the LRU"""
+        for key, response, expires_at in rows:
+            found[key] = response
+            self._memory_put(key, response, expires_at)
+        
+        self.stats['hits'] += len(found)
+        self.stats['misses'] += len(unique_keys) - len(found)
+        return found
+    
+    def set(self, key: str, response: str, expire: Optional[float] = None):
+        """Store a response, expiring after ``expire`` seconds (default: cache TTL)"""
+        self.set_many([(key, response)], expire)
+    
+    async def set_async(self, key: str, response: str, expire: Optional[float] = None):
+        """Like set(), with the SQLite write and commit run in a worker thread"""
+        await self.set_many_async([(key, response)], expire)
+    
+    def set_many(self, items: Iterable[Tuple[str, str]], expire: Optional[float] = None):
+        """Store several (key, response) pairs in one transaction"""
+        expires_at = time.time() + (self.ttl_seconds if expire is None else expire)
+        items = list(items)
+        self._store(items, expires_at)
+        for key, response in items:
+            self._memory_put(key, response, expires_at)
+    
+    async def set_many_async(self, items: Iterable[Tuple[str, str]], expire: Optional[float] = None):
+        """Like set_many(), with the SQLite write and commit run in a worker thread"""
+        expires_at = time.time() + (self.ttl_seconds if expire is None else expire)
+        items = list(items)
+        await asyncio.to_thread(self._store, items, expires_at)
+        for key, response in items:
+            self._memory_put(key, response, expires_at)
+    
+    def _fetch(self, key: str) -> Optional[Tuple[str, float]]:
+        """(response, expires_at) row for a key, or None"""
+        with self._db_lock:
+            return self._db().execute(
+                "SELECT response, expires_at FROM responses WHERE key = ?", (key,)
+            ).fetchone()
+    
+    def _fetch_many(self, keys: List[str], now: float) -> List[Tuple[str, str, float]]:
+        """Unexpired (key, response, expires_at) rows for the given keys"""
+        rows = []
+        with self._db_lock:
+            db = self._db()
+            for start in range(0, len(keys), BULK_QUERY_SIZE):
+                chunk = keys[start:start + BULK_QUERY_SIZE]
+                rows.extend(db.execute(
+                    f"SELECT key, response, expires_at FROM responses WHERE expires_at >= ? AND key IN ({','.join('?' * len(chunk))})",
+                    (now, *chunk)
+                ).fetchall())
+        return rows
+    
+    def _store(self, items: List[Tuple[str, str]], expires_at: float):
+        """Write (key, response) pairs in one transaction"""
+        with self._db_lock:
+            db = self._db()
+            db.executemany(
+                "INSERT OR REPLACE INTO responses (key, response, expires_at) VALUES (?, ?, ?)",
+                ((key, response, expires_at) for key, response in items)
+            )
+            db.commit()
+    
+    def _memory_get(self, key: str, now: float) -> Optional[str]:
+        """Unexpired response from the in-process tier (marked as recently used), or None"""
+        entry = self._memory.get(key)
+        if entry is None:
+            return None
+        if entry[1] < now:
+            del self._memory[key]
+            return None
+        self._memory.move_to_end(key)
+        self.stats['memory_hits'] += 1
+        return entry[0]
+    
+    def _memory_put(self, key: str, response: str, expires_at: float):
+        """Remember an entry in the in-process tier, evicting the least recently used"""
+        if self.memory_entries <= 0:
+            return
+        self._memory[key] = (response, expires_at)
+        self._memory.move_to_end(key)
+        if len(self._memory) > self.memory_entries:
+            self._memory.popitem(last=False)
+    
+    def close(self):
+        """Close the database connection"""
+        self._memory.clear()
+        with self._db_lock:
+            if self._connection is not None:
+                self._connection.close()
+                self._connection = None
+    
+    def _db(self) -> sqlite3.Connection:
+        """Open the database on first use (callers hold ``_db_lock``)"""
+        if self._connection is None:
+            self.db_path.parent.mkdir(parents=True, exist_ok=True)
+            # Used from worker threads by the async methods; access is serialized by _db_lock
+            self._connection = sqlite3.connect(self.db_path, check_same_thread=False)
+            self._connection.execute("PRAGMA journal_mode=WAL")
+            self._connection.execute(
+                "CREATE TABLE IF NOT EXISTS responses "
+                "(key TEXT PRIMARY KEY, response TEXT NOT NULL, expires_at REAL NOT NULL)"
+            )
+            self.logger.info(f"🗃️ LLM response cache opened: {self.db_path}")
+        return self._connection
@@ -0,0 +1,156 @@
+#!/usr/bin/env python3
+"""
+💽 IO_URING WRITER
+=================
+Kernel-async batched file writes for the file repository on Linux.
+
+Domain-Driven Design: Infrastructure layer repository for data persistence.
+Writes queued from the event loop are submitted to an io_uring ring in
+batches by one background thread, and their completions are reaped in the
+same batch, instead of one blocking write() per file on a thread pool.
+"""
+
+import os
+import queue
+import asyncio
+import logging
+import platform
+import threading
+from pathlib import Path
+from typing import List, Optional, Tuple
+
+try:
+    from liburing import (
+        Ring, Cqe, io_uring_queue_init, io_uring_queue_exit, io_uring_get_sqe,
+        io_uring_prep_write, io_uring_submit, io_uring_wait_cqe, io_uring_cqe_seen
+    )
+except ImportError:  # Optional: io_uring write path (Linux only)
+    Ring = None
+
+
+# (path, data, future, loop) of one queued write
+WriteOp = Tuple[Path, bytes, asyncio.Future, asyncio.AbstractEventLoop]
+
+
+class UringWriter:
+    """
+    💽 Batched io_uring file writer
+    
+    - ``write()`` queues a whole-file write and awaits its completion
+    - A daemon thread drains the queue, submits up to ``entries`` writes
+      with one io_uring_submit, then reaps all their completions
+    - Results are handed back to the event loop with call_soon_threadsafe
+    """
+    
+    def __init__(self, entries: int = 256):
+        """Initialize the ring (raises OSError if the kernel refuses io_uring)"""
+        self.entries = entries
+        self.logger = logging.getLogger(__name__)
+        
+        self._ring = Ring()
+        self._cqe = Cqe()
+        io_uring_queue_init(entries, self._ring, 0)
+        
+        self._queue: "queue.Queue[Optional[WriteOp]]" = queue.Queue()
+        self._thread = threading.Thread(target=self._run, name="uring-writer", daemon=True)
+        self._thread.start()
+    
+    @classmethod
+    def create(cls, entries: int = 256) -> Optional['UringWriter']:
+        """Build a writer if io_uring is usable here, otherwise None"""
+        if platform.system() != 'Linux' or Ring is None:
+            return None
+        try:
+            return cls(entries)
+        except OSError as e:
+            logging.getLogger(__name__).warning(f"⚠️ io_uring unavailable, using thread writes: {str(e)}")
+            return None
+    
+    async def write(self, file_path: Path, data: bytes):
+        """Write ``data`` as the whole content of ``file_path`` (parent dirs are created)"""
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self._queue.put((file_path, data, future, loop))
+        await future
+    
+    def close(self):
+        """Stop the writer thread after pending writes and release the ring"""
+        if self._thread.is_alive():
+            self._queue.put(None)
+            self._thread.join()
+            io_uring_queue_exit(self._ring)
+    
+    def _run(self):
+        """Writer thread: submit queued writes in batches and reap their completions"""
+        while True:
+            op = self._queue.get()
+            if op is None:
+                return
+            
+            batch = [op]
+            while len(batch) < self.entries:
+                try:
+                    op = self._queue.get_nowait()
+                except queue.Empty:
+                    break
+                if op is None:
+                    self._queue.put(None)  # stop after this batch
+                    break
+                batch.append(op)
+            
+            self._write_batch(batch)
+    
+    def _write_batch(self, batch: List[WriteOp]):
+        """Submit one batch with a single io_uring_submit and wait for all of it"""
+        fds: List[Optional[int]] = [None] * len(batch)
+        errors: List[Optional[BaseException]] = [None] * len(batch)
+        submitted = 0
+        
+        for index, (file_path, data, _, _) in enumerate(batch):
+            try:
+                file_path.parent.mkdir(parents=True, exist_ok=True)
+                fds[index] = os.open(file_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+                sqe = io_uring_get_sqe(self._ring)
+                io_uring_prep_write(sqe, fds[index], data, 0)
+                sqe.user_data = index
+                submitted += 1
+            except OSError as e:
+                errors[index] = e
+        
+        if submitted:
+            io_uring_submit(self._ring)
+        
+        for _ in range(submitted):
+            io_uring_wait_cqe(self._ring, self._cqe)
+            entry = self._cqe[0]
+            index, res = entry.user_data, entry.res
+            io_uring_cqe_seen(self._ring, entry)
+            
+            file_path, data = batch[index][0], batch[index][1]
+            try:
+                if res < 0:
+                    raise OSError(-res, os.strerror(-res), str(file_path))
+                # Short write: finish the rest synchronously
+                written = res
+                while written < len(data):
+                    written += os.pwrite(fds[index], data[written:], written)
+            except OSError as e:
+                errors[index] = e
+        
+        for index, (_, _, future, loop) in enumerate(batch):
+            if fds[index] is not None:
+                os.close(fds[index])
+            try:
+                loop.call_soon_threadsafe(self._resolve, future, errors[index])
+            except RuntimeError:
+                pass  # Caller's event loop already closed; nobody is waiting
+    
+    @staticmethod
+    def _resolve(future: asyncio.Future, error: Optional[BaseException]):
+        """Complete a write's future on its event loop"""
+        if future.done():
+            return
+        if error is not None:
+            future.set_exception(error)
+        else:
+            future.set_result(None)
@@ -0,0 +1,20 @@
+"""
+🧪 UNIT TESTS
+============
+Tests unitarios de los componentes de concurrencia y fiabilidad.
+
+Módulos:
+- test_pipeline_queue: Cola entre las fases de extracción y análisis
+- test_llm_response_cache: Caché de respuestas LLM (variantes asíncronas)
+- test_uring_writer: Escritor io_uring y su fallback
+- test_rate_limiter: Limitador de tasa token-bucket
+- test_circuit_breaker: Transiciones del circuit breaker
+- test_adaptive_concurrency: Límite de concurrencia AIMD
+- test_bulkhead: Aislamiento de concurrencia por proveedor
+- test_chaos: Inyección de fallos reproducible
+- test_latency_metrics: Percentiles de latencia por operación
+- test_background_logging: Logging en hilo de fondo
+- test_openai_batch_adapter: Adaptador de la Batch API de OpenAI
+- test_namespaced_memory_store: Memoria por namespace y su tamaño estimado
+- test_user_id_cache: Caché de IDs de usuario de Twitter
+"""
@@ -0,0 +1,64 @@
+#!/usr/bin/env python3
+"""
+🧪 TESTS FOR ADAPTIVE CONCURRENCY
+================================
+AIMD limit: halve on sustained rate limiting, grow by one after successes.
+"""
+
+import asyncio
+
+from infrastructure.reliability.adaptive_concurrency import AdaptiveConcurrency
+
+
+def _gate() -> AdaptiveConcurrency:
+    return AdaptiveConcurrency("test", max_limit=8, min_limit=1, window_size=10,
+                               min_samples=4, decrease_threshold=0.25, increase_after=3)
+
+
+def test_rate_limiting_halves_limit_down_to_minimum():
+    """Rate-limited outcomes above the threshold halve the limit, never below min_limit"""
+    async def run():
+        gate = _gate()
+        limits = []
+        for _ in range(4):
+            for _ in range(4):
+                await gate.record(rate_limited=True)
+            limits.append(gate.limit)
+        return limits
+    
+    assert asyncio.run(run()) == [4, 2, 1, 1]
+
+
+def test_consecutive_successes_add_one_slot_up_to_maximum():
+    """Each run of increase_after successes adds one slot, capped at max_limit"""
+    async def run():
+        gate = _gate()
+        for _ in range(4):
+            await gate.record(rate_limited=True)
+        halved = gate.limit
+        for _ in range(3):
+            await gate.record(rate_limited=False)
+        grown = gate.limit
+        for _ in range(30):
+            await gate.record(rate_limited=False)
+        return halved, grown, gate.limit
+    
+    assert asyncio.run(run()) == (4, 5, 8)
+
+
+def test_gate_admits_at_most_limit_calls():
+    """Callers beyond the limit wait until a slot is released"""
+    async def run():
+        gate = AdaptiveConcurrency("test", max_limit=2)
+        peak = 0
+        
+        async def call():
+            nonlocal peak
+            async with gate:
+                peak = max(peak, gate.in_flight)
+                await asyncio.sleep(0.01)
+        
+        await asyncio.gather(*(call() for _ in range(6)))
+        return peak, gate.in_flight
+    
+    assert asyncio.run(run()) == (2, 0)
@@ -0,0 +1,59 @@
+#!/usr/bin/env python3
+"""
+🧪 TESTS FOR BACKGROUND LOGGING
+==============================
+Records go through the listener thread while running; handlers are restored on stop.
+"""
+
+import logging
+import threading
+
+from infrastructure.monitoring.background_logging import BackgroundLogging
+
+
+class _ThreadRecordingHandler(logging.Handler):
+    """Collects (message, thread name) of every record it handles"""
+    
+    def __init__(self):
+        super().__init__()
+        self.records = []
+    
+    def emit(self, record: logging.LogRecord):
+        self.records.append((record.getMessage(), threading.current_thread().name))
+
+
+def test_start_routes_records_through_listener_and_stop_restores(tmp_path):
+    """Handlers run off the calling thread while started; stop flushes and puts them back"""
+    target = logging.getLogger("tests.background_logging")
+    target.setLevel(logging.INFO)
+    target.propagate = False
+    handler = _ThreadRecordingHandler()
+    target.addHandler(handler)
+    log_file = tmp_path / "workflow.log"
+    
+    background = BackgroundLogging(str(log_file), logger_name="tests.background_logging")
+    try:
+        background.start()
+        assert background.running
+        assert handler not in target.handlers
+        target.info("queued record")
+    finally:
+        background.stop()
+    
+    target.info("direct record")
+    target.removeHandler(handler)
+    
+    assert not background.running
+    assert target.handlers == []
+    messages = dict(handler.records)
+    assert messages["queued record"] != messages["direct record"]
+    assert "queued record" in log_file.read_text(encoding='utf-8')
+
+
+def test_start_without_handlers_is_a_no_op():
+    """A logger with no handlers keeps logging's last-resort handler"""
+    background = BackgroundLogging(logger_name="tests.background_logging.empty")
+    background.start()
+    
+    assert not background.running
+    background.stop()
@@ -0,0 +1,49 @@
+#!/usr/bin/env python3
+"""
+🧪 TESTS FOR THE BULKHEAD
+========================
+Bounded running and waiting calls; overflow is rejected immediately.
+"""
+
+import asyncio
+import threading
+
+import pytest
+
+from infrastructure.reliability.bulkhead import Bulkhead, BulkheadFull
+
+
+def test_calls_beyond_running_and_queue_slots_are_rejected():
+    """1 running + 1 waiting fit; a third concurrent call raises BulkheadFull"""
+    async def run():
+        bulkhead = Bulkhead("test", max_concurrent=1, max_queue=1)
+        release = asyncio.Event()
+        
+        async def slow():
+            await release.wait()
+            return "done"
+        
+        accepted = [asyncio.create_task(bulkhead.submit(slow())) for _ in range(2)]
+        await asyncio.sleep(0)
+        assert bulkhead.in_flight == 2
+        
+        with pytest.raises(BulkheadFull):
+            await bulkhead.submit(slow())
+        
+        release.set()
+        results = await asyncio.gather(*accepted)
+        return results, bulkhead.in_flight
+    
+    assert asyncio.run(run()) == (["done", "done"], 0)
+
+
+def test_run_sync_uses_the_bulkhead_thread_pool():
+    """Blocking calls run on the bulkhead's own named worker threads"""
+    async def run():
+        bulkhead = Bulkhead("twitter", max_concurrent=2, max_queue=0)
+        try:
+            return await bulkhead.run_sync(lambda: threading.current_thread().name)
+        finally:
+            bulkhead.shutdown()
+    
+    assert asyncio.run(run()).startswith("bulkhead-twitter")
@@ -0,0 +1,66 @@
+#!/usr/bin/env python3
+"""
+🧪 TESTS FOR THE CIRCUIT BREAKER
+===============================
+CLOSED → OPEN → HALF_OPEN → CLOSED (or back to OPEN) transitions.
+"""
+
+import time
+import asyncio
+
+import pytest
+
+from infrastructure.reliability.circuit_breaker import CircuitBreaker, CircuitOpenError, CircuitState
+
+RECOVERY_S = 0.05
+
+
+async def _ok():
+    return "ok"
+
+
+async def _fail():
+    raise ConnectionError("provider down")
+
+
+def _open_breaker() -> CircuitBreaker:
+    """Breaker opened by reaching its failure threshold"""
+    breaker = CircuitBreaker("test", failure_threshold=2, recovery_timeout=RECOVERY_S)
+    for _ in range(2):
+        with pytest.raises(ConnectionError):
+            asyncio.run(breaker.call(_fail))
+    return breaker
+
+
+def test_threshold_failures_open_the_circuit():
+    """Consecutive failures open the circuit; calls are then rejected without running"""
+    breaker = _open_breaker()
+    
+    assert breaker.state is CircuitState.OPEN
+    with pytest.raises(CircuitOpenError):
+        asyncio.run(breaker.call(_ok))
+
+
+def test_successful_trial_closes_the_circuit():
+    """After the recovery window one trial call is allowed; its success closes the circuit"""
+    breaker = _open_breaker()
+    time.sleep(RECOVERY_S)
+    
+    assert breaker.state is CircuitState.HALF_OPEN
+    assert breaker.allow_request()
+    assert not breaker.allow_request()  # only one trial in flight
+    breaker.record_success()
+    
+    assert breaker.state is CircuitState.CLOSED
+    assert asyncio.run(breaker.call(_ok)) == "ok"
+
+
+def test_failed_trial_reopens_the_circuit():
+    """A failing trial call opens the circuit again for a new recovery window"""
+    breaker = _open_breaker()
+    time.sleep(RECOVERY_S)
+    
+    with pytest.raises(ConnectionError):
+        asyncio.run(breaker.call(_fail))
+    
+    assert breaker.state is CircuitState.OPEN
@@ -0,0 +1,50 @@
+#!/usr/bin/env python3
+"""
+🧪 TESTS FOR LATENCY METRICS
+===========================
+Nearest-rank percentiles per (provider, op) and bounded sample windows.
+"""
+
+import time
+
+from infrastructure.monitoring.latency_metrics import LatencyRecorder
+
+
+def test_percentiles_per_operation():
+    """p50/p95/p99 are nearest-rank over each operation's own samples"""
+    recorder = LatencyRecorder()
+    for ms in range(1, 101):
+        recorder.observe("openai", "chat", ms / 1000)
+    recorder.observe("twitter", "users_lookup", 0.5)
+    
+    summary = recorder.percentiles()
+    
+    assert summary["openai.chat"] == {'count': 100, 'p50': 0.05, 'p95': 0.095, 'p99': 0.099}
+    assert summary["twitter.users_lookup"] == {'count': 1, 'p50': 0.5, 'p95': 0.5, 'p99': 0.5}
+
+
+def test_only_recent_samples_are_kept():
+    """Older samples fall out of the max_samples window"""
+    recorder = LatencyRecorder(max_samples=3)
+    for seconds in (10.0, 1.0, 2.0, 3.0):
+        recorder.observe("openai", "chat", seconds)
+    
+    assert recorder.percentiles()["openai.chat"]['count'] == 3
+    assert recorder.percentiles()["openai.chat"]['p99'] == 3.0
+    recorder.reset()
+    assert recorder.percentiles() == {}
+
+
+def test_time_records_the_block_even_when_it_raises():
+    """The context manager records one sample per block, including failed calls"""
+    recorder = LatencyRecorder()
+    try:
+        with recorder.time("twitter", "account_timeline"):
+            time.sleep(0.01)
+            raise ConnectionError("provider down")
+    except ConnectionError:
+        pass
+    
+    stats = recorder.percentiles()["twitter.account_timeline"]
+    assert stats['count'] == 1
+    assert stats['p50'] >= 0.01
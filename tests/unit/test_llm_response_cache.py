@@ -0,0 +1,44 @@
+#!/usr/bin/env python3
+"""
+🧪 TESTS FOR THE LLM RESPONSE CACHE
+==================================
+Async lookups and writes must behave like the sync ones.
+"""
+
+import asyncio
+
+from infrastructure.repositories.llm_response_cache import LLMResponseCache
+
+
+def test_async_set_then_get_from_sqlite(tmp_path):
+    """Entries written off the loop are readable by a fresh cache (no in-process tier)"""
+    async def run():
+        writer = LLMResponseCache(str(tmp_path / "cache.sqlite3"))
+        await writer.set_async("a", "response a")
+        await writer.set_many_async([("b", "response b"), ("c", "response c")])
+        writer.close()
+        
+        reader = LLMResponseCache(str(tmp_path / "cache.sqlite3"), memory_entries=0)
+        single = await reader.get_async("a")
+        many = await reader.get_many_async(["b", "c", "missing"])
+        stats = dict(reader.stats)
+        reader.close()
+        return single, many, stats
+    
+    single, many, stats = asyncio.run(run())
+    
+    assert single == "response a"
+    assert many == {"b": "response b", "c": "response c"}
+    assert stats['hits'] == 3 and stats['misses'] == 1
+
+
+def test_async_get_serves_expired_entry_only_as_stale(tmp_path):
+    """Expired entries are misses unless the caller accepts stale responses"""
+    async def run():
+        cache = LLMResponseCache(str(tmp_path / "cache.sqlite3"), memory_entries=0)
+        await cache.set_async("key", "old response", expire=-1)
+        results = (await cache.get_async("key"), await cache.get_async("key", allow_expired=True))
+        cache.close()
+        return results
+    
+    assert asyncio.run(run()) == (None, "old response")
@@ -0,0 +1,57 @@
+#!/usr/bin/env python3
+"""
+🧪 TESTS FOR THE NAMESPACED MEMORY STORE
+=======================================
+Flat-key dict behaviour over per-namespace dicts, with an exact size estimate.
+"""
+
+import orjson
+import pytest
+
+from domain.services.memory.namespaced_memory_store import NamespacedMemoryStore
+
+
+def test_flat_keys_map_to_namespaces():
+    """Keys like ``namespace:subkey`` land in their namespace; unprefixed keys in None"""
+    store = NamespacedMemoryStore({"echo_map:btc": {"count": 2}, "plain": 1})
+    store.put("latency", "eth", 3)
+    
+    assert store.namespace("echo_map") == {"btc": {"count": 2}}
+    assert store.namespace(None) == {"plain": 1}
+    assert store["latency:eth"] == 3
+    assert "echo_map:btc" in store and "echo_map:eth" not in store
+    assert dict(store) == {"echo_map:btc": {"count": 2}, "plain": 1, "latency:eth": 3}
+    
+    del store["echo_map:btc"]
+    assert store.namespace("echo_map") == {}
+    assert len(store) == 2
+    with pytest.raises(KeyError):
+        del store["echo_map:btc"]
+
+
+def test_version_changes_on_every_write_and_delete():
+    """Per-namespace versions let callers invalidate data derived from a namespace"""
+    store = NamespacedMemoryStore()
+    store["echo_map:btc"] = 1
+    store["echo_map:btc"] = 2
+    store["slop:x"] = 1
+    del store["echo_map:btc"]
+    
+    assert store.version("echo_map") == 3
+    assert store.version("slop") == 1
+    assert store.version("unused") == 0
+
+
+def test_size_estimate_matches_serialized_store():
+    """size_estimate equals len(orjson.dumps(store)) through writes, overwrites and deletes"""
+    store = NamespacedMemoryStore()
+    assert store.size_estimate == len(orjson.dumps(dict(store)))
+    
+    store["echo_map:btc"] = {"sources": ["a", "b"], "score": 0.5}
+    store["plain"] = "value"
+    store.put("latency", "é:ü", [1, 2, 3])
+    assert store.size_estimate == len(orjson.dumps(dict(store)))
+    
+    store["echo_map:btc"] = None
+    del store["plain"]
+    assert store.size_estimate == len(orjson.dumps(dict(store)))
@@ -0,0 +1,92 @@
+#!/usr/bin/env python3
+"""
+🧪 TESTS FOR THE OPENAI BATCH ADAPTER
+====================================
+Results routed by custom_id, whole-batch failures, and cancellation on timeout.
+"""
+
+import asyncio
+from types import SimpleNamespace
+
+import orjson
+import pytest
+
+from infrastructure.adapters.openai_batch_adapter import OpenAIBatchAdapter
+
+
+def _output_line(custom_id: str, status_code: int, body: dict) -> bytes:
+    return orjson.dumps({"custom_id": custom_id, "response": {"status_code": status_code, "body": body}}) + b"\n"
+
+
+class _FakeBatchClient:
+    """Stands in for AsyncOpenAI's files/batches APIs; the batch ends in ``final_status``"""
+    
+    def __init__(self, final_status: str, output: bytes = b"", polls_until_done: int = 1):
+        self.final_status = final_status
+        self.output = output
+        self.polls_until_done = polls_until_done
+        self.uploaded = b""
+        self.cancelled = []
+        self.files = SimpleNamespace(create=self._create_file, content=self._content)
+        self.batches = SimpleNamespace(create=self._create_batch, retrieve=self._retrieve, cancel=self._cancel)
+    
+    async def _create_file(self, file, purpose):
+        self.uploaded = file[1]
+        return SimpleNamespace(id="file-in")
+    
+    async def _content(self, file_id):
+        return SimpleNamespace(content=self.output)
+    
+    async def _create_batch(self, input_file_id, endpoint, completion_window):
+        return SimpleNamespace(id="batch-1", status="validating")
+    
+    async def _retrieve(self, batch_id):
+        self.polls_until_done -= 1
+        if self.polls_until_done > 0:
+            return SimpleNamespace(id=batch_id, status="in_progress")
+        return SimpleNamespace(id=batch_id, status=self.final_status,
+                               output_file_id="file-out", error_file_id=None)
+    
+    async def _cancel(self, batch_id):
+        self.cancelled.append(batch_id)
+
+
+def _adapter(client, timeout=None) -> OpenAIBatchAdapter:
+    return OpenAIBatchAdapter(client, poll_interval=0.001, max_poll_interval=0.002, timeout=timeout)
+
+
+def test_completed_batch_routes_results_by_custom_id():
+    """Successful lines become content, failed ones exceptions, dropped ones RuntimeError"""
+    output = (_output_line("summary_agent", 200, {"choices": [{"message": {"content": "summary"}}]})
+              + _output_line("fact_checker", 500, {"error": {"message": "server error"}}))
+    client = _FakeBatchClient("completed", output, polls_until_done=2)
+    adapter = _adapter(client)
+    requests = {name: {"model": "gpt-4o"} for name in ("summary_agent", "fact_checker", "depth_analyzer")}
+    
+    results = asyncio.run(adapter.complete(requests))
+    
+    assert results["summary_agent"] == "summary"
+    assert isinstance(results["fact_checker"], RuntimeError)
+    assert "server error" in str(results["fact_checker"])
+    assert isinstance(results["depth_analyzer"], RuntimeError)
+    assert len(client.uploaded.splitlines()) == 3
+    assert adapter.stats['batches_completed'] == 1 and adapter.stats['requests_submitted'] == 3
+
+
+def test_failed_batch_raises():
+    """A batch ending as failed/expired/cancelled raises instead of returning partial results"""
+    adapter = _adapter(_FakeBatchClient("expired"))
+    
+    with pytest.raises(RuntimeError, match="expired"):
+        asyncio.run(adapter.complete({"summary_agent": {"model": "gpt-4o"}}))
+    assert adapter.stats['batches_failed'] == 1
+
+
+def test_timeout_cancels_batch_on_provider():
+    """A batch still running at the timeout is cancelled provider-side"""
+    client = _FakeBatchClient("completed", polls_until_done=10 ** 6)
+    adapter = _adapter(client, timeout=0.05)
+    
+    with pytest.raises(TimeoutError):
+        asyncio.run(adapter.complete({"summary_agent": {"model": "gpt-4o"}}))
+    assert client.cancelled == ["batch-1"]
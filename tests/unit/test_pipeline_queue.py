@@ -0,0 +1,98 @@
+#!/usr/bin/env python3
+"""
+🧪 TESTS FOR THE EXTRACTION → ANALYSIS PIPELINE
+==============================================
+The producer must never block once the consumer has stopped reading.
+"""
+
+import asyncio
+import logging
+from types import SimpleNamespace
+
+from application.orchestrators.twitter_analysis_orchestrator import TwitterAnalysisOrchestrator, WorkflowConfig
+from infrastructure.reliability.pipeline_queue import PipelineQueue
+
+QUEUE_SIZE = 2
+BATCHES = 10
+
+
+async def _produce(batch_queue):
+    """Put more batches than the queue holds, then report how many were put"""
+    for i in range(BATCHES):
+        await batch_queue.put([i])
+    return BATCHES
+
+
+def test_queue_finish_never_blocks_and_ends_stream():
+    """finish() on a full queue returns immediately; get() yields the items then None"""
+    async def run():
+        batch_queue = PipelineQueue(maxsize=QUEUE_SIZE)
+        await batch_queue.put([0])
+        await batch_queue.put([1])
+        batch_queue.finish()
+        return [await batch_queue.get() for _ in range(3)]
+    
+    assert asyncio.run(run()) == [[0], [1], None]
+
+
+def test_close_releases_blocked_producer():
+    """A consumer that stops early must not leave the producer waiting for room"""
+    async def run():
+        batch_queue = PipelineQueue(maxsize=QUEUE_SIZE)
+        
+        async def consume_one():
+            try:
+                return await batch_queue.get()
+            finally:
+                batch_queue.close()
+        
+        producer = asyncio.create_task(_produce(batch_queue))
+        consumer = asyncio.create_task(consume_one())
+        return await asyncio.wait_for(asyncio.gather(producer, consumer), timeout=2)
+    
+    assert asyncio.run(run()) == [BATCHES, [0]]
+
+
+def _orchestrator(analyze_tweet_stream):
+    """Orchestrator with only the pieces _execute_pipelined_phases touches"""
+    orchestrator = TwitterAnalysisOrchestrator.__new__(TwitterAnalysisOrchestrator)
+    orchestrator.logger = logging.getLogger(__name__)
+    orchestrator.analysis_service = SimpleNamespace(analyze_tweet_stream=analyze_tweet_stream)
+    orchestrator._build_analysis_config = lambda *args: None
+    
+    async def extraction_phase(config, workflow_dir, batch_queue):
+        return await _produce(batch_queue)
+    
+    orchestrator._execute_extraction_phase = extraction_phase
+    return orchestrator
+
+
+def test_pipelined_phases_finish_when_analysis_times_out(tmp_path):
+    """Phase timeout on analysis: extraction still completes instead of hanging"""
+    async def stalled_analysis(batch_queue, analysis_config):
+        await batch_queue.get()
+        await asyncio.sleep(60)
+    
+    config = WorkflowConfig(pipeline_queue_size=QUEUE_SIZE, phase_timeout_s=0.05)
+    orchestrator = _orchestrator(stalled_analysis)
+    
+    extraction_result, analysis_result = asyncio.run(
+        asyncio.wait_for(orchestrator._execute_pipelined_phases(config, tmp_path), timeout=2))
+    
+    assert extraction_result == BATCHES
+    assert analysis_result is None
+
+
+def test_pipelined_phases_finish_when_analysis_fails(tmp_path):
+    """Analysis error before reading anything: extraction still completes"""
+    async def failing_analysis(batch_queue, analysis_config):
+        raise RuntimeError("analysis unavailable")
+    
+    config = WorkflowConfig(pipeline_queue_size=QUEUE_SIZE)
+    orchestrator = _orchestrator(failing_analysis)
+    
+    extraction_result, analysis_result = asyncio.run(
+        asyncio.wait_for(orchestrator._execute_pipelined_phases(config, tmp_path), timeout=2))
+    
+    assert extraction_result == BATCHES
+    assert analysis_result is None
@@ -0,0 +1,41 @@
+#!/usr/bin/env python3
+"""
+🧪 TESTS FOR THE ASYNC RATE LIMITER
+==================================
+Callers wait only for the capacity they are missing.
+"""
+
+import time
+import asyncio
+
+from infrastructure.reliability.rate_limiter import AsyncRateLimiter
+
+
+def test_acquire_waits_for_missing_capacity():
+    """A full bucket of 10 units/s frees one unit after ~0.1s"""
+    async def run():
+        limiter = AsyncRateLimiter(max_rate=10, time_period=1.0)
+        start = time.monotonic()
+        for _ in range(10):
+            await limiter.acquire()
+        burst = time.monotonic() - start
+        
+        assert not limiter.has_capacity()
+        start = time.monotonic()
+        await limiter.acquire()
+        return burst, time.monotonic() - start
+    
+    burst, wait = asyncio.run(run())
+    
+    assert burst < 0.05
+    assert 0.08 <= wait < 0.5
+
+
+def test_oversized_acquire_is_clamped_to_capacity():
+    """Asking for more than max_rate waits for an empty bucket instead of forever"""
+    async def run():
+        limiter = AsyncRateLimiter(max_rate=5, time_period=0.1)
+        await asyncio.wait_for(limiter.acquire(50), timeout=1)
+        return limiter.has_capacity()
+    
+    assert asyncio.run(run()) is False
@@ -0,0 +1,36 @@
+#!/usr/bin/env python3
+"""
+🧪 TESTS FOR THE IO_URING WRITER
+===============================
+Without a usable ring the file repository must fall back to thread writes.
+"""
+
+from infrastructure.repositories import uring_writer
+from infrastructure.repositories.uring_writer import UringWriter
+
+
+def test_create_returns_none_without_liburing(monkeypatch):
+    """No liburing binding (Ring is None): no writer"""
+    monkeypatch.setattr(uring_writer, "Ring", None)
+    
+    assert UringWriter.create() is None
+
+
+def test_create_returns_none_off_linux(monkeypatch):
+    """io_uring is Linux only"""
+    monkeypatch.setattr(uring_writer, "Ring", object)
+    monkeypatch.setattr(uring_writer.platform, "system", lambda: "Darwin")
+    
+    assert UringWriter.create() is None
+
+
+def test_create_returns_none_when_kernel_refuses_ring(monkeypatch):
+    """Ring setup failing with OSError (e.g. io_uring disabled) is not fatal"""
+    def refuse(self, entries):
+        raise OSError(1, "Operation not permitted")
+    
+    monkeypatch.setattr(uring_writer, "Ring", object)
+    monkeypatch.setattr(uring_writer.platform, "system", lambda: "Linux")
+    monkeypatch.setattr(UringWriter, "__init__", refuse)
+    
+    assert UringWriter.create() is None
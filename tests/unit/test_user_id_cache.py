@@ -0,0 +1,45 @@
+#!/usr/bin/env python3
+"""
+🧪 TESTS FOR THE USER ID CACHE
+=============================
+A damaged cache file must never fail extraction.
+"""
+
+import json
+import logging
+from datetime import datetime, timedelta
+
+from domain.services.core_analysis.tweet_extraction_service import TweetExtractionService, ExtractionConfig
+
+
+def _service() -> TweetExtractionService:
+    """Service with only the pieces the cache helpers touch"""
+    service = TweetExtractionService.__new__(TweetExtractionService)
+    service.logger = logging.getLogger(__name__)
+    return service
+
+
+def test_malformed_and_expired_entries_are_dropped(tmp_path):
+    """Bad entries are skipped with a warning; valid fresh ones are kept"""
+    cache_file = tmp_path / "user_ids.json"
+    cache_file.write_text(json.dumps({
+        "fresh": {"id": "1", "resolved_at": datetime.now().isoformat()},
+        "stale": {"id": "2", "resolved_at": (datetime.now() - timedelta(days=90)).isoformat()},
+        "no_timestamp": {"id": "3"},
+        "bad_timestamp": {"id": "4", "resolved_at": "yesterday"},
+        "not_a_dict": "5"
+    }), encoding='utf-8')
+    config = ExtractionConfig(user_id_cache_file=str(cache_file))
+    
+    assert list(_service()._load_user_id_cache(config)) == ["fresh"]
+
+
+def test_unreadable_cache_file_is_ignored(tmp_path):
+    """Invalid JSON or a non-object document reads as an empty cache"""
+    cache_file = tmp_path / "user_ids.json"
+    config = ExtractionConfig(user_id_cache_file=str(cache_file))
+    
+    cache_file.write_text("{not json", encoding='utf-8')
+    assert _service()._load_user_id_cache(config) == {}
+    cache_file.write_text("[1, 2]", encoding='utf-8')
+    assert _service()._load_user_id_cache(config) == {}